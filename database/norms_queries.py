@@ -4,13 +4,26 @@ Norms Database Queries
 Queries to fetch norms data from NormsMonthDetail and NormsHeader tables.
 """
 
+import time
+from functools import lru_cache
+
 from database.connection import get_connection
 
 
+# Cached norms rows are refetched after this many seconds, so edits made by
+# another worker process or directly in the database are eventually seen
+NORMS_CACHE_TTL_SECONDS = 300
+
+
 def fetch_all_norms_for_month(month: int, year: int) -> list:
     """
     Fetch all norms for a specific month and year.
     
+    The query result is cached per (month, year) for up to
+    NORMS_CACHE_TTL_SECONDS since norms rarely change within a run; every
+    call still gets its own row dicts. Writers to NormsMonthDetail in this
+    process call clear_norms_cache() so their edits are seen immediately.
+    
     Args:
         month: Month number (1-12)
         year: Year (e.g., 2025, 2026)
@@ -18,6 +31,27 @@ def fetch_all_norms_for_month(month: int, year: int) -> list:
     Returns:
         List of dictionaries containing norm data
     """
+    ttl_bucket = int(time.monotonic() // NORMS_CACHE_TTL_SECONDS)
+    columns, rows = _fetch_norm_rows_for_month(month, year, ttl_bucket)
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def clear_norms_cache():
+    """Drop the cached per-(month, year) norms query results."""
+    _fetch_norm_rows_for_month.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def _fetch_norm_rows_for_month(month: int, year: int, ttl_bucket: int) -> tuple:
+    """
+    Run the monthly norms query for fetch_all_norms_for_month().
+    
+    ttl_bucket is only part of the cache key: it changes every
+    NORMS_CACHE_TTL_SECONDS, which expires the cached entry.
+    
+    Returns:
+        (column names, rows) as tuples, so the cached value cannot be mutated
+    """
     conn = get_connection()
     cur = conn.cursor()
     
@@ -58,14 +92,11 @@ def fetch_all_norms_for_month(month: int, year: int) -> list:
     """
     
     cur.execute(query, (month, year))
-    columns = [column[0] for column in cur.description]
-    results = []
-    
-    for row in cur.fetchall():
-        results.append(dict(zip(columns, row)))
+    columns = tuple(column[0] for column in cur.description)
+    rows = tuple(tuple(row) for row in cur.fetchall())
     
     conn.close()
-    return results
+    return columns, rows
 
 
 def fetch_norms_by_plant(month: int, year: int, plant_name: str) -> list:
@@ -740,7 +740,7 @@ def calculate_budget_with_iteration(
         "overall_success": usd_result.get("converged", False),
         "iterations_used": usd_result.get("iterations_used", 0),
         "tolerance_achieved": usd_result.get("tolerance_achieved", 0),
-        "usd_result": usd_result,
+        "usd_result": usd_result.to_dict(),
         "power_result": usd_result.get("power_result"),
         "steam_result": usd_result.get("final_steam_balance"),
         "stg_extraction": usd_result.get("stg_extraction"),
@@ -44,13 +44,20 @@ Utility Norms:
 - Oxygen Power: 936-968 KWH per MT
 """
 
-from services.power_service import distribute_by_priority, NORM_STG_SHP_PER_KWH
+import io
+import sys
+from collections import namedtuple
+from dataclasses import dataclass, field, fields
+
+from services.power_service import distribute_by_priority, NORM_STG_SHP_PER_KWH, _VERBOSE_LOGGING
 from services.steam_service import (
     calculate_steam_balance,
     calculate_lp_balance,
     calculate_mp_balance,
     calculate_lp_balance_stg_based,
     calculate_mp_balance_stg_based,
+    round_balance,
+    index_dispatch,
     get_hrsg_availability_from_dispatch,
     calculate_shp_generation_capacity,
     check_shp_balance,
@@ -91,6 +98,7 @@ NORM_STG_AUX_PER_KWH = 0.0020     # STG: 0.2% aux consumption
 
 # STG Steam Requirement (MT SHP per KWH generated)
 NORM_STG_SHP_PER_KWH = 0.0035600  # 0.00356 MT SHP per KWH
+_INV_STG_SHP_KWH_TO_MWH = 1.0 / (NORM_STG_SHP_PER_KWH * 1000.0)  # MWh STG per MT SHP
 
 # HRSG Norms (per MT SHP generated)
 NORM_HRSG_BFW_PER_MT_SHP = 1.0240           # 1.024 M3 BFW per MT SHP
@@ -125,6 +133,166 @@ NORM_AIR_PER_MT_SHP_HRSG = 9.7440           # ~468720 NM3 per ~48000 MT SHP (sca
 # Iteration Constants
 USD_ITERATION_LIMIT = 50
 USD_TOLERANCE = 0.0000001  # 0.0001 KWh = 0.0000001 MWh tolerance for aux power convergence
+USD_AITKEN_ACCELERATION = True  # Aitken delta-squared extrapolation of the aux power fixed point
+
+# Per-iteration record (fixed-width tuple instead of a fresh dict every pass).
+# Values are stored unrounded; _iteration_record_to_dict() applies the
+# reporting precision when the history is returned.
+IterRecord = namedtuple("IterRecord", [
+    "iteration",
+    "total_demand_mwh",
+    "total_gross_mwh",
+    "total_net_mwh",
+    "stg_gross_mwh",
+    "gt_gross_mwh",
+    "stg_shp_required_mt",
+    "shp_demand_mt",
+    "free_steam_mt",
+    "supplementary_firing_mt",
+    "max_shp_capacity_mt",
+    "shp_deficit_mt",
+    "deficit_percent",
+    "utilization_percent",
+    "previous_aux_mwh",
+    "current_aux_mwh",
+    "aux_power_error_mwh",
+    "stg_reduction_mwh",
+    "import_compensation_mwh",
+    "action_code",
+    "action_value",
+    "status",
+])
+
+# Iteration action codes (IterRecord.action_code). action_value carries the
+# amount shown in the label; format_action() renders the label on demand.
+ACTION_NONE = 0
+ACTION_REDUCE_STG = 1
+ACTION_AUX_ITER = 2
+ACTION_SHP_IMPOSSIBLE = 3
+ACTION_CONVERGED = 4
+ACTION_INCREASE_STG = 5
+ACTION_EXCESS_STEAM_BALANCE = 6      # action_value = (stg_increase_mwh, gt_reduction_mwh)
+ACTION_EXCESS_STEAM_UNABSORBED = 7
+
+_STATUS_FAILED = "FAILED"
+
+# Reporting precision per IterRecord field (fields not listed are returned as-is)
+_ITER_RECORD_DECIMALS = {
+    "total_demand_mwh": 2,
+    "total_gross_mwh": 2,
+    "total_net_mwh": 2,
+    "stg_gross_mwh": 2,
+    "gt_gross_mwh": 2,
+    "stg_shp_required_mt": 2,
+    "shp_demand_mt": 2,
+    "free_steam_mt": 2,
+    "supplementary_firing_mt": 2,
+    "max_shp_capacity_mt": 2,
+    "shp_deficit_mt": 2,
+    "deficit_percent": 4,
+    "utilization_percent": 2,
+    "previous_aux_mwh": 4,
+    "current_aux_mwh": 4,
+    "aux_power_error_mwh": 6,
+    "stg_reduction_mwh": 2,
+    "import_compensation_mwh": 2,
+}
+
+# Marks USDResult fields that the result does not carry (early error returns
+# only fill a few fields); they behave as missing keys in get() / to_dict().
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class USDResult:
+    """
+    Result of usd_iterate().
+    
+    Fields mirror the keys of the former result dict. get() and [] keep
+    dict-style access working for existing callers; to_dict() produces the
+    JSON-serializable dict when the result is stored in an API response.
+    
+    final_shp_balance is computed from final_steam_balance and
+    final_shp_capacity on first access, so callers that only need the
+    convergence scalars never run check_shp_balance().
+    """
+    success: bool
+    error_type: object
+    message: str
+    converged: bool
+    iterations_used: object = _MISSING
+    final_power_aux_mwh: object = _MISSING
+    tolerance_achieved: object = _MISSING
+    
+    # STG Extraction (FIXED based on steam demand)
+    stg_extraction: object = _MISSING
+    
+    # Power results
+    power_result: object = _MISSING
+    final_dispatch: object = _MISSING
+    
+    # Steam results
+    final_steam_balance: object = _MISSING
+    final_hrsg_availability: object = _MISSING
+    final_shp_capacity: object = _MISSING
+    
+    # STG load-based LP/MP balance (with calculated ratios)
+    final_lp_balance: object = _MISSING
+    final_mp_balance: object = _MISSING
+    
+    # HRSG MIN load, dispatch and NG reverse calculation
+    hrsg_min_load: object = _MISSING
+    hrsg_dispatch: object = _MISSING
+    hrsg_ng_calculation: object = _MISSING
+    
+    # STG Reduction (for SHP balance)
+    stg_reduction_mwh: object = _MISSING
+    import_compensation_mwh: object = _MISSING
+    
+    # Export power
+    excess_power_for_export_mwh: object = _MISSING
+    export_available: object = _MISSING
+    
+    # Iteration history
+    iteration_history: object = _MISSING
+    
+    _shp_balance_cache: object = field(default=_MISSING, init=False, repr=False)
+    
+    @property
+    def final_shp_balance(self):
+        """SHP demand vs capacity check for the final iteration (lazy)."""
+        if self._shp_balance_cache is _MISSING and self.final_steam_balance is not _MISSING:
+            balance = None
+            if self.final_steam_balance and self.final_shp_capacity:
+                balance = check_shp_balance(
+                    self.final_steam_balance["summary"]["total_shp_demand"],
+                    self.final_shp_capacity
+                )
+            self._shp_balance_cache = balance
+        return self._shp_balance_cache
+    
+    def get(self, key: str, default=None):
+        value = getattr(self, key, _MISSING)
+        return default if value is _MISSING else value
+    
+    def __getitem__(self, key: str):
+        value = getattr(self, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+    
+    def to_dict(self) -> dict:
+        """Return the result as a plain dict (fields not carried are omitted)."""
+        result = {}
+        for f in fields(self):
+            if f.name.startswith("_"):
+                continue
+            value = getattr(self, f.name)
+            if value is not _MISSING:
+                result[f.name] = value
+            if f.name == "final_shp_capacity" and self.final_steam_balance is not _MISSING:
+                result["final_shp_balance"] = self.final_shp_balance
+        return result
 
 
 # ============================================================
@@ -427,6 +595,189 @@ def calculate_stg_extraction_requirements_load_based(
     }
 
 
+# ============================================================
+# CONVERGENCE STEP ARITHMETIC
+# ============================================================
+
+def _excess_steam_step(
+    potential_stg_increase: float,
+    stg_current_mwh: float,
+    stg_max_mwh: float,
+    gt_available_reduction_mwh: float,
+) -> tuple:
+    """
+    Pure arithmetic for STEP 3g.1 (excess steam balancing).
+    
+    Args:
+        potential_stg_increase: STG MWh that the excess steam could produce
+        stg_current_mwh: Current STG gross generation in MWh
+        stg_max_mwh: STG maximum generation in MWh
+        gt_available_reduction_mwh: Total GT MWh reducible above MIN load
+    
+    Returns:
+        (stg_available_increase, actual_stg_increase) in MWh
+    """
+    stg_available_increase = stg_max_mwh - stg_current_mwh
+    actual_stg_increase = min(potential_stg_increase, stg_available_increase, gt_available_reduction_mwh)
+    return stg_available_increase, actual_stg_increase
+
+
+def _stg_recovery_step(excess_shp: float, stg_reduction_mwh: float) -> tuple:
+    """
+    Pure arithmetic for STEP 3g.2 (recover STG from excess SHP).
+    
+    A 50% damping factor is applied to prevent oscillation.
+    
+    Args:
+        excess_shp: Excess SHP available in MT
+        stg_reduction_mwh: Cumulative STG reduction applied so far in MWh
+    
+    Returns:
+        (potential_stg_recovery, damped_recovery, actual_recovery) in MWh
+    """
+    potential_stg_recovery = excess_shp * _INV_STG_SHP_KWH_TO_MWH
+    damped_recovery = potential_stg_recovery * 0.5
+    actual_recovery = min(damped_recovery, stg_reduction_mwh)
+    return potential_stg_recovery, damped_recovery, actual_recovery
+
+
+def _stg_reduction_step(
+    shp_deficit: float,
+    stg_reduction_mwh: float,
+    stg_original_max_mwh: float,
+) -> tuple:
+    """
+    Pure arithmetic for STEP 3h (reduce STG to eliminate SHP deficit).
+    
+    To reduce SHP demand by X MT, reduce STG by X / 0.0036 KWh = X / 0.0036 / 1000 MWh.
+    The cumulative reduction is capped at the STG original max (if known).
+    
+    Args:
+        shp_deficit: SHP deficit (demand - capacity) in MT
+        stg_reduction_mwh: Cumulative STG reduction applied so far in MWh
+        stg_original_max_mwh: STG max generation from first dispatch (or None)
+    
+    Returns:
+        (stg_reduction_for_shp, new_stg_reduction_mwh, import_compensation_mwh) in MWh
+    """
+    stg_reduction_for_shp = shp_deficit * _INV_STG_SHP_KWH_TO_MWH
+    new_stg_reduction_mwh = stg_reduction_mwh + stg_reduction_for_shp
+    if stg_original_max_mwh is not None:
+        new_stg_reduction_mwh = min(new_stg_reduction_mwh, stg_original_max_mwh)
+    return stg_reduction_for_shp, new_stg_reduction_mwh, new_stg_reduction_mwh
+
+
+def _stg_steam_limit_step(
+    max_shp_capacity: float,
+    shp_base_fixed: float,
+    shp_for_stg_lp: float,
+    shp_for_stg_mp: float,
+    shp_for_hp_prds: float,
+    shp_for_prds_mp: float,
+) -> tuple:
+    """
+    Pure arithmetic for the steam-based STG limit used by the NEXT iteration.
+    
+    Base SHP demand (without STG power) = Process + Fixed + extraction + PRDS demands.
+    Max STG power = Available SHP / 0.0036 MT per KWh.
+    
+    Args:
+        max_shp_capacity: Maximum SHP generation capacity (MT)
+        shp_base_fixed: Loop-invariant SHP Process + SHP Fixed demand (MT)
+        shp_for_stg_lp/mp, shp_for_hp_prds, shp_for_prds_mp: Per-iteration
+            SHP contributors from the steam balance (MT)
+    
+    Returns:
+        (base_shp_demand, available_shp_for_stg, stg_steam_limit_mwh)
+    """
+    base_shp_demand = (
+        shp_base_fixed
+        + shp_for_stg_lp + shp_for_stg_mp
+        + shp_for_hp_prds + shp_for_prds_mp
+    )
+    available_shp_for_stg = max_shp_capacity - base_shp_demand
+    if available_shp_for_stg > 0:
+        stg_steam_limit_mwh = available_shp_for_stg * _INV_STG_SHP_KWH_TO_MWH
+    else:
+        stg_steam_limit_mwh = 0.0
+    return base_shp_demand, available_shp_for_stg, stg_steam_limit_mwh
+
+
+def _aitken_aux_step(x0: float, x1: float, x2: float):
+    """
+    Aitken delta-squared extrapolation for the aux power fixed point.
+    
+    x1 = F(x0) and x2 = F(x1) are two plain USD passes. The extrapolated value
+    is only returned while the sequence contracts monotonically (both steps
+    have the same sign and the second is smaller), which is the regime where
+    the extrapolation is reliable; otherwise the caller keeps the plain step.
+    
+    Args:
+        x0, x1, x2: Consecutive utility aux power values in MWh
+    
+    Returns:
+        Extrapolated aux power in MWh, or None if the step should not be used
+    """
+    d1 = x1 - x0
+    d2 = x2 - x1
+    if d1 * d2 <= 0 or abs(d2) >= abs(d1):
+        return None
+    x_acc = x2 - d2 * d2 / (d2 - d1)
+    if x_acc < 0:
+        return None
+    return x_acc
+
+
+def format_action(code: int, value=None):
+    """
+    Render an iteration action code as its report label.
+    
+    Args:
+        code: One of the ACTION_* constants
+        value: Amount for the action (a (stg, gt) MWh pair for
+               ACTION_EXCESS_STEAM_BALANCE)
+    
+    Returns:
+        Label such as "REDUCE_STG_12.50_MWH", or None for ACTION_NONE
+    """
+    if code == ACTION_REDUCE_STG:
+        return f"REDUCE_STG_{value:.2f}_MWH"
+    if code == ACTION_AUX_ITER:
+        return f"AUX_ERROR_{value:.6f}_MWH"
+    if code == ACTION_SHP_IMPOSSIBLE:
+        return "SHP_IMPOSSIBLE"
+    if code == ACTION_CONVERGED:
+        return "CONVERGED"
+    if code == ACTION_INCREASE_STG:
+        return f"INCREASE_STG_{value:.2f}_MWH"
+    if code == ACTION_EXCESS_STEAM_BALANCE:
+        stg_increase, gt_reduction = value
+        return f"EXCESS_STEAM_BALANCE_STG+{stg_increase:.2f}_GT-{gt_reduction:.2f}"
+    if code == ACTION_EXCESS_STEAM_UNABSORBED:
+        return f"EXCESS_STEAM_UNABSORBED_{value:.2f}_MT"
+    return None
+
+
+def _iteration_record_to_dict(record: IterRecord) -> dict:
+    """
+    Convert an IterRecord to the dict shape returned in iteration_history.
+    
+    Args:
+        record: IterRecord captured during the USD loop
+    
+    Returns:
+        dict keyed by IterRecord field names, rounded to reporting precision,
+        with the action code rendered as the "action" label
+    """
+    result = record._asdict()
+    for name, decimals in _ITER_RECORD_DECIMALS.items():
+        result[name] = round(result[name], decimals)
+    del result["action_code"], result["action_value"]
+    result["action"] = format_action(record.action_code, record.action_value)
+    result["status"] = result.pop("status")
+    return result
+
+
 # ============================================================
 # USD ITERATION MAIN FUNCTION
 # ============================================================
@@ -444,7 +795,10 @@ def usd_iterate(
     shp_fixed: float,
     bfw_ufu: float = 0.0,
     export_available: bool = False,
-) -> dict:
+    verbose: bool = None,
+    stg_extraction_lookup_df=None,
+    hrsg_heat_rate_lookup_df=None,
+) -> USDResult:
     """
     Execute USD iteration loop to balance power and steam.
     
@@ -469,10 +823,18 @@ def usd_iterate(
         month, year: Financial period
         lp/mp/hp/shp_process/fixed: Steam demands (MT)
         bfw_ufu: BFW for UFU (M3)
+        verbose: Print per-iteration diagnostics (defaults to _VERBOSE_LOGGING).
+                 Setup, error and final-result output is always printed.
+        stg_extraction_lookup_df: Pre-fetched STG extraction lookup (fetched if None)
+        hrsg_heat_rate_lookup_df: Pre-fetched HRSG heat rate lookup (fetched if None)
         
     Returns:
-        dict with iteration results, final dispatch, and steam balance
+        USDResult with iteration results, final dispatch, and steam balance
+        (supports result.get(...) / result[...]; use to_dict() for JSON)
     """
+    # Use global verbose setting if not specified
+    if verbose is None:
+        verbose = _VERBOSE_LOGGING
     
     print("\n" + "="*100)
     print("                              USD ITERATION LOOP")
@@ -487,7 +849,8 @@ def usd_iterate(
     print("-"*100)
     
     # Fetch STG extraction lookup table (cached for all iterations)
-    stg_extraction_lookup_df = fetch_stg_extraction_lookup()
+    if stg_extraction_lookup_df is None:
+        stg_extraction_lookup_df = fetch_stg_extraction_lookup()
     stg_op_hours = get_stg_operating_hours(month, year)
     
     if stg_extraction_lookup_df.empty:
@@ -507,7 +870,8 @@ def usd_iterate(
     print("-"*100)
     
     # Fetch HRSG heat rate lookup table (cached for all iterations)
-    hrsg_heat_rate_lookup_df = fetch_hrsg_heat_rate_lookup()
+    if hrsg_heat_rate_lookup_df is None:
+        hrsg_heat_rate_lookup_df = fetch_hrsg_heat_rate_lookup()
     
     if hrsg_heat_rate_lookup_df.empty:
         print("  [WARNING] HRSG Heat Rate Lookup table is empty - using legacy fixed norms")
@@ -720,6 +1084,7 @@ def usd_iterate(
     
     # Track STG limit based on steam availability
     stg_steam_limit_mwh = None  # Will be calculated based on available SHP
+    shp_base_fixed = shp_process + shp_fixed  # SHP demand that does not move with dispatch
     
     # NEW: Excess steam balancing tracking
     stg_min_override_mwh = None  # Override STG minimum for excess steam absorption
@@ -729,20 +1094,22 @@ def usd_iterate(
     
     for iteration in range(1, USD_ITERATION_LIMIT + 1):
         
-        print(f"\n  {'='*96}")
-        print(f"  === ITERATION {iteration} ===")
-        print(f"  {'='*96}")
-        print(f"  [Input] Previous Utility Aux Power: {previous_utility_aux_mwh:>12.2f} MWh")
-        print(f"  [Input] STG Reduction (SHP):        {stg_reduction_mwh:>12.2f} MWh")
-        if stg_steam_limit_mwh is not None:
-            print(f"  [Input] STG Steam Limit:            {stg_steam_limit_mwh:>12.2f} MWh")
+        if verbose:
+            print(f"\n  {'='*96}")
+            print(f"  === ITERATION {iteration} ===")
+            print(f"  {'='*96}")
+            print(f"  [Input] Previous Utility Aux Power: {previous_utility_aux_mwh:>12.2f} MWh")
+            print(f"  [Input] STG Reduction (SHP):        {stg_reduction_mwh:>12.2f} MWh")
+            if stg_steam_limit_mwh is not None:
+                print(f"  [Input] STG Steam Limit:            {stg_steam_limit_mwh:>12.2f} MWh")
         
         # Calculate STG limit for this iteration
         # Use the more restrictive of: SHP-based reduction OR steam availability limit
         stg_limit_mwh = None
         if stg_reduction_mwh > 0 and stg_original_max_mwh is not None:
             stg_limit_mwh = max(0, stg_original_max_mwh - stg_reduction_mwh)
-            print(f"  [Input] STG Limit (from SHP deficit): {stg_limit_mwh:>12.2f} MWh")
+            if verbose:
+                print(f"  [Input] STG Limit (from SHP deficit): {stg_limit_mwh:>12.2f} MWh")
         
         # Apply steam-based limit if available (from previous iteration)
         if stg_steam_limit_mwh is not None:
@@ -750,7 +1117,8 @@ def usd_iterate(
                 stg_limit_mwh = stg_steam_limit_mwh
             else:
                 stg_limit_mwh = min(stg_limit_mwh, stg_steam_limit_mwh)
-            print(f"  [Input] STG Limit (final):          {stg_limit_mwh:>12.2f} MWh")
+            if verbose:
+                print(f"  [Input] STG Limit (final):          {stg_limit_mwh:>12.2f} MWh")
         
         # ---------------------------------------------------------
         # STEP 3a: Dispatch Power (with utility aux power as additional demand)
@@ -760,9 +1128,9 @@ def usd_iterate(
         #   - POWER DISPATCH RESULT
         # ---------------------------------------------------------
         # Log excess steam balancing inputs
-        if stg_min_override_mwh is not None:
+        if verbose and stg_min_override_mwh is not None:
             print(f"  [Input] STG Min Override (excess steam): {stg_min_override_mwh:>12.2f} MWh")
-        if gt_reduction_for_balance_mwh > 0:
+        if verbose and gt_reduction_for_balance_mwh > 0:
             print(f"  [Input] GT Reduction (power balance):    {gt_reduction_for_balance_mwh:>12.2f} MWh")
         
         power_result = distribute_by_priority(
@@ -770,30 +1138,31 @@ def usd_iterate(
             additional_demand_mwh=previous_utility_aux_mwh,
             stg_max_mwh=stg_limit_mwh,
             stg_min_override_mwh=stg_min_override_mwh,
-            gt_reduction_mwh=gt_reduction_for_balance_mwh
+            gt_reduction_mwh=gt_reduction_for_balance_mwh,
+            verbose=verbose
         )
         
         if power_result.get("insufficientCapacity") or power_result.get("insufficientCapacityAfterImport"):
             print(f"  [ERROR] Power dispatch failed: Insufficient capacity")
-            return {
-                "success": False,
-                "error_type": "POWER_INSUFFICIENT",
-                "message": power_result.get("message", "Power capacity insufficient"),
-                "power_result": power_result,
-                "iteration_history": iteration_history,
-                "converged": False,
-            }
+            return USDResult(
+                success=False,
+                error_type="POWER_INSUFFICIENT",
+                message=power_result.get("message", "Power capacity insufficient"),
+                power_result=power_result,
+                iteration_history=[_iteration_record_to_dict(r) for r in iteration_history],
+                converged=False,
+            )
         
         if "dispatchPlan" not in power_result:
             print(f"  [ERROR] Power dispatch failed: No dispatch plan")
-            return {
-                "success": False,
-                "error_type": "POWER_ERROR",
-                "message": power_result.get("message", "Power dispatch failed"),
-                "power_result": power_result,
-                "iteration_history": iteration_history,
-                "converged": False,
-            }
+            return USDResult(
+                success=False,
+                error_type="POWER_ERROR",
+                message=power_result.get("message", "Power dispatch failed"),
+                power_result=power_result,
+                iteration_history=[_iteration_record_to_dict(r) for r in iteration_history],
+                converged=False,
+            )
         
         current_dispatch = power_result["dispatchPlan"]
         total_gross_mwh = power_result.get("totalGrossGeneration", 0)
@@ -881,19 +1250,20 @@ def usd_iterate(
                 stg_operating_hours=stg_op_hours
             )
             
-            print(f"\n  [STG EXTRACTION - Load Based]")
-            print(f"    STG Load (dispatch): {stg_load_mw:.2f} MW")
-            print(f"    STG Load (lookup):   {stg_extraction.get('stg_load_mw_actual', stg_load_mw):.2f} MW" + (" [CLAMPED]" if stg_extraction.get('clamped') else ""))
-            print(f"    STG Gross: {stg_extraction.get('stg_gross_kwh', 0):,.0f} KWH")
-            print(f"    LP Extraction: {extraction_data['lp_extraction_tph']:.2f} TPH x {stg_op_hours:.0f} hrs = {stg_extraction['lp_from_stg']:.2f} MT")
-            print(f"    MP Extraction: {extraction_data['mp_extraction_tph']:.2f} TPH x {stg_op_hours:.0f} hrs = {stg_extraction['mp_from_stg']:.2f} MT")
-            print(f"    LP Ratio: {stg_extraction['lp_stg_ratio']*100:.2f}% (vs legacy 61.34%)")
-            print(f"    MP Ratio: {stg_extraction['mp_stg_ratio']*100:.2f}% (vs legacy 29.08%)")
-            print(f"    --- STG Reverse Norms (from lookup @ {stg_extraction.get('stg_load_mw_actual', stg_load_mw):.2f} MW) ---")
-            print(f"    SHP Inlet: {stg_extraction.get('shp_inlet_tph', 0):.2f} TPH x {stg_op_hours:.0f} hrs = {stg_extraction.get('stg_shp_inlet_mt', 0):.2f} MT")
-            print(f"    SHP Norm: {stg_extraction.get('stg_shp_norm', 0):.7f} MT/KWH (vs legacy 0.00356)")
-            print(f"    Condensate: {stg_extraction.get('condensing_load_m3hr', 0):.2f} M3/hr x {stg_op_hours:.0f} hrs = {stg_extraction.get('stg_condensate_m3', 0):.2f} M3")
-            print(f"    Condensate Norm: {stg_extraction.get('stg_condensate_norm', 0):.7f} M3/KWH (vs legacy 0.00293)")
+            if verbose:
+                print(f"\n  [STG EXTRACTION - Load Based]")
+                print(f"    STG Load (dispatch): {stg_load_mw:.2f} MW")
+                print(f"    STG Load (lookup):   {stg_extraction.get('stg_load_mw_actual', stg_load_mw):.2f} MW" + (" [CLAMPED]" if stg_extraction.get('clamped') else ""))
+                print(f"    STG Gross: {stg_extraction.get('stg_gross_kwh', 0):,.0f} KWH")
+                print(f"    LP Extraction: {extraction_data['lp_extraction_tph']:.2f} TPH x {stg_op_hours:.0f} hrs = {stg_extraction['lp_from_stg']:.2f} MT")
+                print(f"    MP Extraction: {extraction_data['mp_extraction_tph']:.2f} TPH x {stg_op_hours:.0f} hrs = {stg_extraction['mp_from_stg']:.2f} MT")
+                print(f"    LP Ratio: {stg_extraction['lp_stg_ratio']*100:.2f}% (vs legacy 61.34%)")
+                print(f"    MP Ratio: {stg_extraction['mp_stg_ratio']*100:.2f}% (vs legacy 29.08%)")
+                print(f"    --- STG Reverse Norms (from lookup @ {stg_extraction.get('stg_load_mw_actual', stg_load_mw):.2f} MW) ---")
+                print(f"    SHP Inlet: {stg_extraction.get('shp_inlet_tph', 0):.2f} TPH x {stg_op_hours:.0f} hrs = {stg_extraction.get('stg_shp_inlet_mt', 0):.2f} MT")
+                print(f"    SHP Norm: {stg_extraction.get('stg_shp_norm', 0):.7f} MT/KWH (vs legacy 0.00356)")
+                print(f"    Condensate: {stg_extraction.get('condensing_load_m3hr', 0):.2f} M3/hr x {stg_op_hours:.0f} hrs = {stg_extraction.get('stg_condensate_m3', 0):.2f} M3")
+                print(f"    Condensate Norm: {stg_extraction.get('stg_condensate_norm', 0):.7f} M3/KWH (vs legacy 0.00293)")
         else:
             # Use legacy fixed ratios
             stg_extraction = calculate_stg_extraction_requirements(lp_total, mp_total)
@@ -902,44 +1272,48 @@ def usd_iterate(
         # STEP 3b: HRSG AVAILABILITY & SHP CAPACITY
         # (Linked to GT dispatch - HRSG available when GT is running)
         # ---------------------------------------------------------
-        hrsg_availability = get_hrsg_availability_from_dispatch(current_dispatch)
+        # Index this pass's dispatch once; the HRSG readers below share it
+        dispatch_index = index_dispatch(current_dispatch)
+        hrsg_availability = get_hrsg_availability_from_dispatch(current_dispatch, dispatch_index)
         shp_capacity = calculate_shp_generation_capacity(hrsg_availability)
         
-        print("\n" + "="*90)
-        print("HRSG AVAILABILITY & SHP CAPACITY")
-        print("="*90)
-        print("  (HRSG availability linked to GT dispatch - HRSG available when corresponding GT is running)")
-        print(f"\n  +----------------+------------+------------+------------+------------+------------+------------+")
-        print(f"  | HRSG           | Available  | Hours      | Free Steam | Supp Min   | Supp Max   | Total Max  |")
-        print(f"  +----------------+------------+------------+------------+------------+------------+------------+")
-        
         hrsg_details_list = shp_capacity.get("hrsg_details", [])
-        for hrsg_detail in hrsg_details_list:
-            hrsg_name = hrsg_detail.get("name", "Unknown")
-            is_avail = "YES" if hrsg_detail.get("is_available", False) else "NO"
-            hours = hrsg_detail.get("hours", 0) or 0
-            free_steam = hrsg_detail.get("free_steam_mt", 0) or 0
-            supp_min = hrsg_detail.get("supp_min_mt_month", 0) or 0
-            supp_max = hrsg_detail.get("supp_max_mt_month", 0) or 0
-            total_max = free_steam + supp_max
-            print(f"  | {hrsg_name:<14} | {is_avail:>10} | {hours:>10.2f} | {free_steam:>10.2f} | {supp_min:>10.2f} | {supp_max:>10.2f} | {total_max:>10.2f} |")
-        
         total_free_steam = shp_capacity["total_free_steam_mt"]
         total_supp_min = shp_capacity["total_supplementary_min_mt"]
         total_supp_max = shp_capacity["total_supplementary_max_mt"]
         min_shp_capacity = shp_capacity["total_min_shp_capacity"]
         max_shp_capacity = shp_capacity["total_max_shp_capacity"]
         
-        print(f"  +----------------+------------+------------+------------+------------+------------+------------+")
-        print(f"  | TOTAL          |            |            | {total_free_steam:>10.2f} | {total_supp_min:>10.2f} | {total_supp_max:>10.2f} | {max_shp_capacity:>10.2f} |")
-        print(f"  +----------------+------------+------------+------------+------------+------------+------------+")
+        if verbose:
+            print("\n" + "="*90)
+            print("HRSG AVAILABILITY & SHP CAPACITY")
+            print("="*90)
+            print("  (HRSG availability linked to GT dispatch - HRSG available when corresponding GT is running)")
+            print(f"\n  +----------------+------------+------------+------------+------------+------------+------------+")
+            print(f"  | HRSG           | Available  | Hours      | Free Steam | Supp Min   | Supp Max   | Total Max  |")
+            print(f"  +----------------+------------+------------+------------+------------+------------+------------+")
+            
+            for hrsg_detail in hrsg_details_list:
+                hrsg_name = hrsg_detail.get("name", "Unknown")
+                is_avail = "YES" if hrsg_detail.get("is_available", False) else "NO"
+                hours = hrsg_detail.get("hours", 0) or 0
+                free_steam = hrsg_detail.get("free_steam_mt", 0) or 0
+                supp_min = hrsg_detail.get("supp_min_mt_month", 0) or 0
+                supp_max = hrsg_detail.get("supp_max_mt_month", 0) or 0
+                total_max = free_steam + supp_max
+                print(f"  | {hrsg_name:<14} | {is_avail:>10} | {hours:>10.2f} | {free_steam:>10.2f} | {supp_min:>10.2f} | {supp_max:>10.2f} | {total_max:>10.2f} |")
+            
+            print(f"  +----------------+------------+------------+------------+------------+------------+------------+")
+            print(f"  | TOTAL          |            |            | {total_free_steam:>10.2f} | {total_supp_min:>10.2f} | {total_supp_max:>10.2f} | {max_shp_capacity:>10.2f} |")
+            print(f"  +----------------+------------+------------+------------+------------+------------+------------+")
         
         # ---------------------------------------------------------
         # STEP 3c: Calculate Steam Balance
         # ---------------------------------------------------------
-        print("\n" + "="*90)
-        print("STEAM BALANCE CALCULATION")
-        print("="*90)
+        if verbose:
+            print("\n" + "="*90)
+            print("STEAM BALANCE CALCULATION")
+            print("="*90)
         
         steam_balance = calculate_steam_balance(
             lp_process=lp_process,
@@ -956,6 +1330,16 @@ def usd_iterate(
         
         shp_demand = steam_balance["summary"]["total_shp_demand"]
         
+        # Bind the per-header balances once; the SHP contributors are reused by
+        # the balance report and by the steam-based STG limit at the end of the pass
+        lp_b = steam_balance["lp_balance"]
+        mp_b = steam_balance["mp_balance"]
+        hp_b = steam_balance["hp_balance"]
+        shp_for_stg_lp = lp_b.get("shp_for_stg_lp", 0.0)
+        shp_for_stg_mp = mp_b.get("shp_for_stg_mp", 0.0)
+        shp_for_hp_prds = hp_b.get("shp_for_hp_prds", 0.0)
+        shp_for_prds_mp = mp_b.get("shp_for_prds_mp", 0.0)
+        
         # ---------------------------------------------------------
         # STEP 3d: SHP Balance Analysis
         # (HRSG capacity already printed above)
@@ -973,38 +1357,40 @@ def usd_iterate(
         # Full demand must be met by supplementary firing
         supplementary_firing_needed = shp_demand  # Free steam excluded from balance
         
-        print("\n" + "="*90)
-        print("SHP BALANCE ANALYSIS")
-        print("="*90)
-        print(f"  +----------------------------------+----------------+")
-        print(f"  | SHP DEMAND                       | Value (MT)     |")
-        print(f"  +----------------------------------+----------------+")
-        print(f"  | SHP Process Demand               | {shp_process:>14.2f} |")
-        print(f"  | SHP Fixed Demand                 | {shp_fixed:>14.2f} |")
-        print(f"  | SHP for STG Power (0.0036/KWh)   | {stg_shp_required:>14.2f} |")
-        print(f"  | SHP for LP Extraction (STG)      | {steam_balance['lp_balance']['shp_for_stg_lp']:>14.2f} |")
-        print(f"  | SHP for MP Extraction (STG)      | {steam_balance['mp_balance']['shp_for_stg_mp']:>14.2f} |")
-        print(f"  | SHP for HP PRDS                  | {steam_balance['hp_balance']['shp_for_hp_prds']:>14.2f} |")
-        print(f"  | SHP for MP PRDS                  | {steam_balance['mp_balance']['shp_for_prds_mp']:>14.2f} |")
-        print(f"  +----------------------------------+----------------+")
-        print(f"  | TOTAL SHP DEMAND                 | {shp_demand:>14.2f} |")
-        print(f"  +----------------------------------+----------------+")
-        print(f"  | SHP SUPPLY                       |                |")
-        print(f"  +----------------------------------+----------------+")
-        print(f"  | Free Steam (display only)        | {total_free_steam:>14.2f} |")
-        print(f"  | Supplementary Firing Needed      | {supplementary_firing_needed:>14.2f} |")
-        print(f"  | Supplementary Max Capacity       | {total_supp_max:>14.2f} |")
-        print(f"  +----------------------------------+----------------+")
-        print(f"  | Total Max SHP Capacity           | {max_shp_capacity:>14.2f} |")
-        print(f"  +----------------------------------+----------------+")
-        print(f"  | SHP DEFICIT (Demand - Capacity)  | {shp_deficit:>14.2f} |")
-        print(f"  | Deficit %                        | {deficit_percent:>13.4f}% |")
-        print(f"  | Utilization %                    | {utilization_percent:>13.2f}% |")
-        print(f"  +----------------------------------+----------------+")
+        if verbose:
+            print("\n" + "="*90)
+            print("SHP BALANCE ANALYSIS")
+            print("="*90)
+            print(f"  +----------------------------------+----------------+")
+            print(f"  | SHP DEMAND                       | Value (MT)     |")
+            print(f"  +----------------------------------+----------------+")
+            print(f"  | SHP Process Demand               | {shp_process:>14.2f} |")
+            print(f"  | SHP Fixed Demand                 | {shp_fixed:>14.2f} |")
+            print(f"  | SHP for STG Power (0.0036/KWh)   | {stg_shp_required:>14.2f} |")
+            print(f"  | SHP for LP Extraction (STG)      | {shp_for_stg_lp:>14.2f} |")
+            print(f"  | SHP for MP Extraction (STG)      | {shp_for_stg_mp:>14.2f} |")
+            print(f"  | SHP for HP PRDS                  | {shp_for_hp_prds:>14.2f} |")
+            print(f"  | SHP for MP PRDS                  | {shp_for_prds_mp:>14.2f} |")
+            print(f"  +----------------------------------+----------------+")
+            print(f"  | TOTAL SHP DEMAND                 | {shp_demand:>14.2f} |")
+            print(f"  +----------------------------------+----------------+")
+            print(f"  | SHP SUPPLY                       |                |")
+            print(f"  +----------------------------------+----------------+")
+            print(f"  | Free Steam (display only)        | {total_free_steam:>14.2f} |")
+            print(f"  | Supplementary Firing Needed      | {supplementary_firing_needed:>14.2f} |")
+            print(f"  | Supplementary Max Capacity       | {total_supp_max:>14.2f} |")
+            print(f"  +----------------------------------+----------------+")
+            print(f"  | Total Max SHP Capacity           | {max_shp_capacity:>14.2f} |")
+            print(f"  +----------------------------------+----------------+")
+            print(f"  | SHP DEFICIT (Demand - Capacity)  | {shp_deficit:>14.2f} |")
+            print(f"  | Deficit %                        | {deficit_percent:>13.4f}% |")
+            print(f"  | Utilization %                    | {utilization_percent:>13.2f}% |")
+            print(f"  +----------------------------------+----------------+")
         
         # Check if SHP can be met
         can_meet_shp = shp_deficit <= 0
-        print(f"\n  SHP Status: {'CAN MEET DEMAND' if can_meet_shp else 'CANNOT MEET DEMAND - NEED TO REDUCE STG'}")
+        if verbose:
+            print(f"\n  SHP Status: {'CAN MEET DEMAND' if can_meet_shp else 'CANNOT MEET DEMAND - NEED TO REDUCE STG'}")
         
         # ---------------------------------------------------------
         # STEP 3e: HRSG LOAD DISPATCH (Priority-Based)
@@ -1013,7 +1399,9 @@ def usd_iterate(
         hrsg_dispatch_result = dispatch_hrsg_load(
             power_dispatch=current_dispatch,
             shp_demand=shp_demand,
-            shp_capacity=shp_capacity
+            shp_capacity=shp_capacity,
+            dispatch_index=dispatch_index,
+            verbose=verbose
         )
         
         # Store dispatch result for return
@@ -1026,7 +1414,9 @@ def usd_iterate(
         # Also calculate MIN load result for backward compatibility
         hrsg_min_load_result = calculate_hrsg_min_load_and_excess_steam(
             power_dispatch=current_dispatch,
-            shp_demand=shp_demand
+            shp_demand=shp_demand,
+            dispatch_index=dispatch_index,
+            verbose=verbose
         )
         final_hrsg_min_load = hrsg_min_load_result
         
@@ -1037,50 +1427,61 @@ def usd_iterate(
         if use_hrsg_heat_rate_lookup and hrsg_dispatch_result:
             hrsg_ng_results = []
             hrsg_dispatch_list = hrsg_dispatch_result.get("hrsg_dispatch", [])
-            
-            print("\n" + "-"*90)
-            print("HRSG NATURAL GAS REVERSE CALCULATION (From Heat Rate Lookup)")
-            print("-"*90)
-            print(f"  {'HRSG':<10} {'Supp Fire':<14} {'Hours':<10} {'Flow TPH':<12} {'Heat Rate':<12} {'NG Norm':<14} {'NG Qty':<14}")
-            print(f"  {'Name':<10} {'(MT)':<14} {'(hrs)':<10} {'(MT/hr)':<12} {'(BTU/lb)':<12} {'(MMBTU/MT)':<14} {'(MMBTU)':<14}")
-            print("  " + "-"*88)
-            
             total_ng_from_hrsg = 0.0
             
-            for hrsg_data in hrsg_dispatch_list:
-                hrsg_name = hrsg_data.get("name", "")
-                dispatched_supp = hrsg_data.get("dispatched_supp_mt", 0.0)
-                hours = hrsg_data.get("hours", 0.0)
+            # No available HRSGs -> empty dispatch list; skip the table and loop entirely
+            if hrsg_dispatch_list:
+                # Buffer the report and emit it with a single write
+                if verbose:
+                    buf = io.StringIO()
+                    buf.write("\n" + "-"*90 + "\n")
+                    buf.write("HRSG NATURAL GAS REVERSE CALCULATION (From Heat Rate Lookup)\n")
+                    buf.write("-"*90 + "\n")
+                    buf.write(f"  {'HRSG':<10} {'Supp Fire':<14} {'Hours':<10} {'Flow TPH':<12} {'Heat Rate':<12} {'NG Norm':<14} {'NG Qty':<14}\n")
+                    buf.write(f"  {'Name':<10} {'(MT)':<14} {'(hrs)':<10} {'(MT/hr)':<12} {'(BTU/lb)':<12} {'(MMBTU/MT)':<14} {'(MMBTU)':<14}\n")
+                    buf.write("  " + "-"*88 + "\n")
+            
+                # dispatch_hrsg_load() always populates these keys on every row
+                for hrsg_data in hrsg_dispatch_list:
+                    hrsg_name = hrsg_data["name"]
+                    dispatched_supp = hrsg_data["dispatched_supp_mt"]
+                    hours = hrsg_data["hours"]
                 
-                if dispatched_supp > 0:
-                    # Calculate NG using heat rate lookup based on dispatched supp firing
-                    ng_result = calculate_hrsg_ng_from_heat_rate(
-                        hrsg_name=hrsg_name,
-                        shp_production_mt=dispatched_supp,
-                        operational_hours=hours,
-                        lookup_df=hrsg_heat_rate_lookup_df
-                    )
+                    if dispatched_supp > 0:
+                        # Calculate NG using heat rate lookup based on dispatched supp firing
+                        ng_result = calculate_hrsg_ng_from_heat_rate(
+                            hrsg_name=hrsg_name,
+                            shp_production_mt=dispatched_supp,
+                            operational_hours=hours,
+                            lookup_df=hrsg_heat_rate_lookup_df
+                        )
                     
-                    hrsg_ng_results.append(ng_result)
-                    total_ng_from_hrsg += ng_result.get("ng_quantity_mmbtu", 0.0)
+                        hrsg_ng_results.append(ng_result)
                     
-                    print(f"  {hrsg_name:<10} {dispatched_supp:>12.2f}   {hours:>8.0f}   {ng_result['steam_flow_tph']:>10.4f}   {ng_result['heat_rate_btu_lb']:>10.2f}   {ng_result['ng_norm_mmbtu_mt']:>12.7f}   {ng_result['ng_quantity_mmbtu']:>12.2f}")
-                else:
-                    hrsg_ng_results.append({
-                        "hrsg_name": hrsg_name,
-                        "shp_production_mt": 0.0,
-                        "operational_hours": 0.0,
-                        "steam_flow_tph": 0.0,
-                        "heat_rate_btu_lb": 0.0,
-                        "ng_norm_mmbtu_mt": 0.0,
-                        "ng_quantity_mmbtu": 0.0,
-                        "interpolated": False
-                    })
-                    print(f"  {hrsg_name:<10} {'N/A - Not Available':<70}")
+                        if verbose:
+                            buf.write(f"  {hrsg_name:<10} {dispatched_supp:>12.2f}   {hours:>8.0f}   {ng_result['steam_flow_tph']:>10.4f}   {ng_result['heat_rate_btu_lb']:>10.2f}   {ng_result['ng_norm_mmbtu_mt']:>12.7f}   {ng_result['ng_quantity_mmbtu']:>12.2f}\n")
+                    else:
+                        hrsg_ng_results.append({
+                            "hrsg_name": hrsg_name,
+                            "shp_production_mt": 0.0,
+                            "operational_hours": 0.0,
+                            "steam_flow_tph": 0.0,
+                            "heat_rate_btu_lb": 0.0,
+                            "ng_norm_mmbtu_mt": 0.0,
+                            "ng_quantity_mmbtu": 0.0,
+                            "interpolated": False
+                        })
+                        if verbose:
+                            buf.write(f"  {hrsg_name:<10} {'N/A - Not Available':<70}\n")
+            
+                # Single C-level reduction instead of a running += per HRSG
+                total_ng_from_hrsg = sum(r["ng_quantity_mmbtu"] for r in hrsg_ng_results)
             
-            print("  " + "-"*88)
-            print(f"  {'TOTAL':<10} {'':<14} {'':<10} {'':<12} {'':<12} {'':<14} {total_ng_from_hrsg:>12.2f}")
-            print("-"*90)
+                if verbose:
+                    buf.write("  " + "-"*88 + "\n")
+                    buf.write(f"  {'TOTAL':<10} {'':<14} {'':<10} {'':<12} {'':<12} {'':<14} {total_ng_from_hrsg:>12.2f}\n")
+                    buf.write("-"*90 + "\n")
+                    sys.stdout.write(buf.getvalue())
             
             final_hrsg_ng_calculation = {
                 "hrsg_ng_details": hrsg_ng_results,
@@ -1097,7 +1498,7 @@ def usd_iterate(
         
         # If there's excess steam, we can potentially increase STG to absorb it
         # This creates additional power that may require reducing GT dispatch
-        if excess_steam_mt > 0:
+        if verbose and excess_steam_mt > 0:
             print("\n" + "="*90)
             print("EXCESS STEAM HANDLING (Needs STG/GT Adjustment)")
             print("="*90)
@@ -1114,34 +1515,35 @@ def usd_iterate(
         # ---------------------------------------------------------
         # DETAILED CALCULATION BREAKDOWN (Show formulas with norms)
         # ---------------------------------------------------------
-        print(f"\n  [CALCULATION DETAILS - Using Norms]")
-        print(f"  " + "="*90)
-        print(f"  | STG SHP Calculation:")
-        print(f"  |   STG Gross = {stg_gross_mwh:,.2f} MWh = {stg_gross_mwh * 1000:,.2f} KWh")
-        print(f"  |   STG SHP = {stg_gross_mwh * 1000:,.2f} KWh x {NORM_STG_SHP_PER_KWH} MT/KWh = {stg_shp_required:,.2f} MT")
-        print(f"  " + "-"*90)
-        print(f"  | Free Steam Calculation (per GT):")
-        print(f"  |   Formula: Free Steam = GT_Gross_MWh x FreeSteamFactor (from HeatRateLookup)")
-        print(f"  |   Total Free Steam = {total_free_steam:,.2f} MT")
-        print(f"  " + "-"*90)
-        print(f"  | Supplementary Firing Calculation (per HRSG):")
-        print(f"  |   Formula: Supp Max = Hours x Max_Capacity_MT/hr x Efficiency")
-        for hrsg_detail in hrsg_details_list:
-            if hrsg_detail.get("is_available", False):
-                h_name = hrsg_detail.get("name", "")
-                h_hours = hrsg_detail.get("hours", 0)
-                h_max_cap = hrsg_detail.get("max_capacity_per_hr", 136.0)
-                h_eff = hrsg_detail.get("efficiency", 1.03)
-                h_supp_max = hrsg_detail.get("supp_max_mt_month", 0)
-                print(f"  |   {h_name}: {h_hours:.0f} hrs x {h_max_cap} MT/hr x {h_eff} = {h_supp_max:,.2f} MT")
-        print(f"  |   Total Supp Max = {total_supp_max:,.2f} MT")
-        print(f"  " + "-"*90)
-        print(f"  | Total SHP Capacity = Supp Max (Free Steam is display only)")
-        print(f"  |                    = {total_supp_max:,.2f} MT")
-        print(f"  " + "-"*90)
-        print(f"  | Supplementary Firing Needed = SHP Demand (Free Steam not subtracted)")
-        print(f"  |                             = {shp_demand:,.2f} MT")
-        print(f"  " + "="*90)
+        if verbose:
+            print(f"\n  [CALCULATION DETAILS - Using Norms]")
+            print(f"  " + "="*90)
+            print(f"  | STG SHP Calculation:")
+            print(f"  |   STG Gross = {stg_gross_mwh:,.2f} MWh = {stg_gross_mwh * 1000:,.2f} KWh")
+            print(f"  |   STG SHP = {stg_gross_mwh * 1000:,.2f} KWh x {NORM_STG_SHP_PER_KWH} MT/KWh = {stg_shp_required:,.2f} MT")
+            print(f"  " + "-"*90)
+            print(f"  | Free Steam Calculation (per GT):")
+            print(f"  |   Formula: Free Steam = GT_Gross_MWh x FreeSteamFactor (from HeatRateLookup)")
+            print(f"  |   Total Free Steam = {total_free_steam:,.2f} MT")
+            print(f"  " + "-"*90)
+            print(f"  | Supplementary Firing Calculation (per HRSG):")
+            print(f"  |   Formula: Supp Max = Hours x Max_Capacity_MT/hr x Efficiency")
+            for hrsg_detail in hrsg_details_list:
+                if hrsg_detail.get("is_available", False):
+                    h_name = hrsg_detail.get("name", "")
+                    h_hours = hrsg_detail.get("hours", 0)
+                    h_max_cap = hrsg_detail.get("max_capacity_per_hr", 136.0)
+                    h_eff = hrsg_detail.get("efficiency", 1.03)
+                    h_supp_max = hrsg_detail.get("supp_max_mt_month", 0)
+                    print(f"  |   {h_name}: {h_hours:.0f} hrs x {h_max_cap} MT/hr x {h_eff} = {h_supp_max:,.2f} MT")
+            print(f"  |   Total Supp Max = {total_supp_max:,.2f} MT")
+            print(f"  " + "-"*90)
+            print(f"  | Total SHP Capacity = Supp Max (Free Steam is display only)")
+            print(f"  |                    = {total_supp_max:,.2f} MT")
+            print(f"  " + "-"*90)
+            print(f"  | Supplementary Firing Needed = SHP Demand (Free Steam not subtracted)")
+            print(f"  |                             = {shp_demand:,.2f} MT")
+            print(f"  " + "="*90)
         
         # ---------------------------------------------------------
         # STEP 3f: Calculate FULL U4U Power (Power Aux + Utility Power)
@@ -1230,78 +1632,85 @@ def usd_iterate(
         # Total U4U = Power Aux + Utility Power
         utility_power_mwh = u4u_power["utility_power"]["total_mwh"]
         current_utility_aux_mwh = power_aux_mwh + utility_power_mwh
-        aux_power_error = abs(current_utility_aux_mwh - previous_utility_aux_mwh)
-        
-        # Print U4U breakdown
-        print("\n" + "="*90)
-        print("U4U POWER CALCULATION (Power Aux + Utility Power)")
-        print("="*90)
-        print(f"  +----------------------------------+----------------+")
-        print(f"  | Component                        | Power (MWH)    |")
-        print(f"  +----------------------------------+----------------+")
-        print(f"  | Power Plant Auxiliary            | {power_aux_mwh:>14.2f} |")
-        print(f"  |   - GT1 Aux                      | {u4u_power['power_aux']['gt1_kwh']/1000:>14.2f} |")
-        print(f"  |   - GT2 Aux                      | {u4u_power['power_aux']['gt2_kwh']/1000:>14.2f} |")
-        print(f"  |   - GT3 Aux                      | {u4u_power['power_aux']['gt3_kwh']/1000:>14.2f} |")
-        print(f"  |   - STG Aux                      | {u4u_power['power_aux']['stg_kwh']/1000:>14.2f} |")
-        print(f"  +----------------------------------+----------------+")
-        print(f"  | Utility Power                    | {utility_power_mwh:>14.2f} |")
-        print(f"  |   - BFW Power                    | {u4u_power['utility_power']['bfw_kwh']/1000:>14.2f} |")
-        print(f"  |   - DM Power                     | {u4u_power['utility_power']['dm_kwh']/1000:>14.2f} |")
-        print(f"  |   - CW1 Power                    | {u4u_power['utility_power']['cw1_kwh']/1000:>14.2f} |")
-        print(f"  |   - CW2 Power                    | {u4u_power['utility_power']['cw2_kwh']/1000:>14.2f} |")
-        print(f"  |   - Air Power                    | {u4u_power['utility_power']['air_kwh']/1000:>14.2f} |")
-        print(f"  |   - Oxygen Power                 | {u4u_power['utility_power']['oxygen_kwh']/1000:>14.2f} |")
-        print(f"  |   - Effluent Power               | {u4u_power['utility_power']['effluent_kwh']/1000:>14.2f} |")
-        print(f"  +----------------------------------+----------------+")
-        print(f"  | TOTAL U4U POWER                  | {current_utility_aux_mwh:>14.2f} |")
-        print(f"  +----------------------------------+----------------+")
+        aux_delta = current_utility_aux_mwh - previous_utility_aux_mwh
+        aux_power_error = aux_delta if aux_delta >= 0 else -aux_delta
+        
+        # Print U4U breakdown and convergence check as one buffered write
+        if verbose:
+            buf = io.StringIO()
+            buf.write("\n" + "="*90 + "\n")
+            buf.write("U4U POWER CALCULATION (Power Aux + Utility Power)\n")
+            buf.write("="*90 + "\n")
+            buf.write(f"  +----------------------------------+----------------+\n")
+            buf.write(f"  | Component                        | Power (MWH)    |\n")
+            buf.write(f"  +----------------------------------+----------------+\n")
+            buf.write(f"  | Power Plant Auxiliary            | {power_aux_mwh:>14.2f} |\n")
+            buf.write(f"  |   - GT1 Aux                      | {u4u_power['power_aux']['gt1_kwh']/1000:>14.2f} |\n")
+            buf.write(f"  |   - GT2 Aux                      | {u4u_power['power_aux']['gt2_kwh']/1000:>14.2f} |\n")
+            buf.write(f"  |   - GT3 Aux                      | {u4u_power['power_aux']['gt3_kwh']/1000:>14.2f} |\n")
+            buf.write(f"  |   - STG Aux                      | {u4u_power['power_aux']['stg_kwh']/1000:>14.2f} |\n")
+            buf.write(f"  +----------------------------------+----------------+\n")
+            buf.write(f"  | Utility Power                    | {utility_power_mwh:>14.2f} |\n")
+            buf.write(f"  |   - BFW Power                    | {u4u_power['utility_power']['bfw_kwh']/1000:>14.2f} |\n")
+            buf.write(f"  |   - DM Power                     | {u4u_power['utility_power']['dm_kwh']/1000:>14.2f} |\n")
+            buf.write(f"  |   - CW1 Power                    | {u4u_power['utility_power']['cw1_kwh']/1000:>14.2f} |\n")
+            buf.write(f"  |   - CW2 Power                    | {u4u_power['utility_power']['cw2_kwh']/1000:>14.2f} |\n")
+            buf.write(f"  |   - Air Power                    | {u4u_power['utility_power']['air_kwh']/1000:>14.2f} |\n")
+            buf.write(f"  |   - Oxygen Power                 | {u4u_power['utility_power']['oxygen_kwh']/1000:>14.2f} |\n")
+            buf.write(f"  |   - Effluent Power               | {u4u_power['utility_power']['effluent_kwh']/1000:>14.2f} |\n")
+            buf.write(f"  +----------------------------------+----------------+\n")
+            buf.write(f"  | TOTAL U4U POWER                  | {current_utility_aux_mwh:>14.2f} |\n")
+            buf.write(f"  +----------------------------------+----------------+\n")
         
         # Calculate SHP deficit change
         shp_deficit_error = 0.0
-        if previous_shp_deficit is not None:
-            shp_deficit_error = abs(shp_deficit - previous_shp_deficit)
-        
-        print("\n" + "="*90)
-        print("CONVERGENCE CHECK")
-        print("="*90)
-        print(f"  +----------------------------------+----------------+----------------+")
-        print(f"  | Metric                           | Current        | Previous       |")
-        print(f"  +----------------------------------+----------------+----------------+")
-        print(f"  | Power Aux (MWh)                  | {current_utility_aux_mwh:>14.4f} | {previous_utility_aux_mwh:>14.4f} |")
-        print(f"  | Power Aux Error (MWh)            | {aux_power_error:>14.6f} |                |")
-        print(f"  | SHP Deficit (MT)                 | {shp_deficit:>14.2f} | {previous_shp_deficit or 0:>14.2f} |")
-        print(f"  | SHP Deficit Error (MT)           | {shp_deficit_error:>14.2f} |                |")
-        print(f"  | STG Reduction (MWh)              | {stg_reduction_mwh:>14.2f} |                |")
-        print(f"  | Import Compensation (MWh)        | {import_compensation_mwh:>14.2f} |                |")
-        print(f"  +----------------------------------+----------------+----------------+")
-        print(f"  | Tolerance (MWh)                  | {USD_TOLERANCE:>14.6f} |                |")
-        print(f"  +----------------------------------+----------------+----------------+")
-        
-        # Record iteration
-        iteration_record = {
-            "iteration": iteration,
-            "total_demand_mwh": round(total_demand_mwh, 2),
-            "total_gross_mwh": round(total_gross_mwh, 2),
-            "total_net_mwh": round(total_net_mwh, 2),
-            "stg_gross_mwh": round(stg_gross_mwh, 2),
-            "gt_gross_mwh": round(gt_gross_mwh, 2),
-            "stg_shp_required_mt": round(stg_shp_required, 2),
-            "shp_demand_mt": round(shp_demand, 2),
-            "free_steam_mt": round(total_free_steam, 2),
-            "supplementary_firing_mt": round(supplementary_firing_needed, 2),
-            "max_shp_capacity_mt": round(max_shp_capacity, 2),
-            "shp_deficit_mt": round(shp_deficit, 2),
-            "deficit_percent": round(deficit_percent, 4),
-            "utilization_percent": round(utilization_percent, 2),
-            "previous_aux_mwh": round(previous_utility_aux_mwh, 4),
-            "current_aux_mwh": round(current_utility_aux_mwh, 4),
-            "aux_power_error_mwh": round(aux_power_error, 6),
-            "stg_reduction_mwh": round(stg_reduction_mwh, 2),
-            "import_compensation_mwh": round(import_compensation_mwh, 2),
-            "action": None,
-            "status": "PENDING",
-        }
+        if previous_shp_deficit is not None and shp_deficit != previous_shp_deficit:
+            shp_deficit_delta = shp_deficit - previous_shp_deficit
+            shp_deficit_error = shp_deficit_delta if shp_deficit_delta >= 0 else -shp_deficit_delta
+        
+        if verbose:
+            buf.write("\n" + "="*90 + "\n")
+            buf.write("CONVERGENCE CHECK\n")
+            buf.write("="*90 + "\n")
+            buf.write(f"  +----------------------------------+----------------+----------------+\n")
+            buf.write(f"  | Metric                           | Current        | Previous       |\n")
+            buf.write(f"  +----------------------------------+----------------+----------------+\n")
+            buf.write(f"  | Power Aux (MWh)                  | {current_utility_aux_mwh:>14.4f} | {previous_utility_aux_mwh:>14.4f} |\n")
+            buf.write(f"  | Power Aux Error (MWh)            | {aux_power_error:>14.6f} |                |\n")
+            buf.write(f"  | SHP Deficit (MT)                 | {shp_deficit:>14.2f} | {previous_shp_deficit or 0:>14.2f} |\n")
+            buf.write(f"  | SHP Deficit Error (MT)           | {shp_deficit_error:>14.2f} |                |\n")
+            buf.write(f"  | STG Reduction (MWh)              | {stg_reduction_mwh:>14.2f} |                |\n")
+            buf.write(f"  | Import Compensation (MWh)        | {import_compensation_mwh:>14.2f} |                |\n")
+            buf.write(f"  +----------------------------------+----------------+----------------+\n")
+            buf.write(f"  | Tolerance (MWh)                  | {USD_TOLERANCE:>14.6f} |                |\n")
+            buf.write(f"  +----------------------------------+----------------+----------------+\n")
+            sys.stdout.write(buf.getvalue())
+        
+        # Record iteration (action/status are filled in once the pass is decided)
+        iteration_values = (
+            iteration,
+            total_demand_mwh,
+            total_gross_mwh,
+            total_net_mwh,
+            stg_gross_mwh,
+            gt_gross_mwh,
+            stg_shp_required,
+            shp_demand,
+            total_free_steam,
+            supplementary_firing_needed,
+            max_shp_capacity,
+            shp_deficit,
+            deficit_percent,
+            utilization_percent,
+            previous_utility_aux_mwh,
+            current_utility_aux_mwh,
+            aux_power_error,
+            stg_reduction_mwh,
+            import_compensation_mwh,
+        )
+        iteration_action_code = ACTION_NONE
+        iteration_action_value = None
+        iteration_status = "PENDING"
         
         # ---------------------------------------------------------
         # STEP 3g: Check Convergence
@@ -1343,10 +1752,6 @@ def usd_iterate(
                     stg_db_max_mwh = asset.get("CapacityMW", 25) * asset.get("Hours", 720)
                     break
             
-            # Calculate how much STG can actually increase
-            stg_available_increase = stg_db_max_mwh - stg_current_mwh
-            actual_stg_increase = min(potential_stg_increase, stg_available_increase)
-            
             # Check if GTs can be reduced further (not below MIN)
             gt_available_reduction = 0.0
             for asset in current_dispatch:
@@ -1357,28 +1762,31 @@ def usd_iterate(
                     gt_available_reduction += max(0, gt_current - gt_min)
             
             # Actual increase is limited by both STG capacity AND GT reduction available
-            actual_stg_increase = min(actual_stg_increase, gt_available_reduction)
+            stg_available_increase, actual_stg_increase = _excess_steam_step(
+                potential_stg_increase, stg_current_mwh, stg_db_max_mwh, gt_available_reduction
+            )
             
             if actual_stg_increase > 50:  # Only if meaningful (> 50 MWh)
-                print("\n" + "="*90)
-                print("⚡ EXCESS STEAM BALANCING (ITERATIVE)")
-                print("="*90)
-                print(f"  Iteration:                          {iteration}")
-                print(f"  Excess Steam from HRSG MIN Load:    {excess_steam_mt:>12.2f} MT")
-                print(f"  Potential STG Increase:             {potential_stg_increase:>12.2f} MWh")
-                print(f"  STG Current:                        {stg_current_mwh:>12.2f} MWh")
-                print(f"  STG Max Capacity:                   {stg_db_max_mwh:>12.2f} MWh")
-                print(f"  STG Available Increase:             {stg_available_increase:>12.2f} MWh")
-                print(f"  GT Available Reduction:             {gt_available_reduction:>12.2f} MWh")
-                print(f"  Actual STG Increase:                {actual_stg_increase:>12.2f} MWh")
-                print(f"  ─────────────────────────────────────────────")
-                
                 # Calculate GT reduction needed to maintain power balance
                 gt_reduction_needed = actual_stg_increase
-                print(f"  GT Reduction Needed:                {gt_reduction_needed:>12.2f} MWh")
-                print(f"  ─────────────────────────────────────────────")
-                print(f"  ACTION: Will increase STG and reduce GT in next iteration")
-                print("="*90 + "\n")
+                
+                if verbose:
+                    print("\n" + "="*90)
+                    print("⚡ EXCESS STEAM BALANCING (ITERATIVE)")
+                    print("="*90)
+                    print(f"  Iteration:                          {iteration}")
+                    print(f"  Excess Steam from HRSG MIN Load:    {excess_steam_mt:>12.2f} MT")
+                    print(f"  Potential STG Increase:             {potential_stg_increase:>12.2f} MWh")
+                    print(f"  STG Current:                        {stg_current_mwh:>12.2f} MWh")
+                    print(f"  STG Max Capacity:                   {stg_db_max_mwh:>12.2f} MWh")
+                    print(f"  STG Available Increase:             {stg_available_increase:>12.2f} MWh")
+                    print(f"  GT Available Reduction:             {gt_available_reduction:>12.2f} MWh")
+                    print(f"  Actual STG Increase:                {actual_stg_increase:>12.2f} MWh")
+                    print(f"  ─────────────────────────────────────────────")
+                    print(f"  GT Reduction Needed:                {gt_reduction_needed:>12.2f} MWh")
+                    print(f"  ─────────────────────────────────────────────")
+                    print(f"  ACTION: Will increase STG and reduce GT in next iteration")
+                    print("="*90 + "\n")
                 
                 # SET VALUES FOR NEXT ITERATION
                 # Calculate target STG (not incremental - direct target)
@@ -1394,34 +1802,38 @@ def usd_iterate(
                 excess_steam_adjustment_mwh = actual_stg_increase
                 stg_increased = True
                 
-                iteration_record["action"] = f"EXCESS_STEAM_BALANCE_STG+{actual_stg_increase:.2f}_GT-{gt_reduction_needed:.2f}"
-                iteration_record["status"] = "EXCESS_STEAM_BALANCING"
+                iteration_action_code = ACTION_EXCESS_STEAM_BALANCE
+                iteration_action_value = (actual_stg_increase, gt_reduction_needed)
+                iteration_status = "EXCESS_STEAM_BALANCING"
             elif excess_steam_mt > 100:
                 # Excess steam exists but can't be absorbed (GTs at MIN or STG at MAX)
-                print("\n" + "="*90)
-                print("⚠️ EXCESS STEAM - CANNOT BE FULLY ABSORBED")
-                print("="*90)
-                print(f"  Remaining Excess Steam:             {excess_steam_mt:>12.2f} MT")
-                print(f"  Equivalent Power:                   {excess_power_from_steam_mwh:>12.2f} MWh")
-                print(f"  STG Available Increase:             {stg_available_increase:>12.2f} MWh")
-                print(f"  GT Available Reduction:             {gt_available_reduction:>12.2f} MWh")
-                print(f"  ─────────────────────────────────────────────")
-                if stg_available_increase <= 0:
-                    print(f"  REASON: STG at MAX capacity ({stg_db_max_mwh:.2f} MWh)")
-                if gt_available_reduction <= 0:
-                    print(f"  REASON: All GTs at MIN load")
-                print(f"  ─────────────────────────────────────────────")
-                print(f"  OPTIONS:")
-                print(f"    1. Export excess power ({excess_power_from_steam_mwh:.2f} MWh)")
-                print(f"    2. Reduce HRSG supplementary firing (violates MIN rule)")
-                print(f"    3. Accept wasted steam ({excess_steam_mt:.2f} MT)")
-                print("="*90 + "\n")
+                if verbose:
+                    print("\n" + "="*90)
+                    print("⚠️ EXCESS STEAM - CANNOT BE FULLY ABSORBED")
+                    print("="*90)
+                    print(f"  Remaining Excess Steam:             {excess_steam_mt:>12.2f} MT")
+                    print(f"  Equivalent Power:                   {excess_power_from_steam_mwh:>12.2f} MWh")
+                    print(f"  STG Available Increase:             {stg_available_increase:>12.2f} MWh")
+                    print(f"  GT Available Reduction:             {gt_available_reduction:>12.2f} MWh")
+                    print(f"  ─────────────────────────────────────────────")
+                    if stg_available_increase <= 0:
+                        print(f"  REASON: STG at MAX capacity ({stg_db_max_mwh:.2f} MWh)")
+                    if gt_available_reduction <= 0:
+                        print(f"  REASON: All GTs at MIN load")
+                    print(f"  ─────────────────────────────────────────────")
+                    print(f"  OPTIONS:")
+                    print(f"    1. Export excess power ({excess_power_from_steam_mwh:.2f} MWh)")
+                    print(f"    2. Reduce HRSG supplementary firing (violates MIN rule)")
+                    print(f"    3. Accept wasted steam ({excess_steam_mt:.2f} MT)")
+                    print("="*90 + "\n")
                 
-                iteration_record["action"] = f"EXCESS_STEAM_UNABSORBED_{excess_steam_mt:.2f}_MT"
-                iteration_record["status"] = "EXCESS_STEAM_LIMIT_REACHED"
+                iteration_action_code = ACTION_EXCESS_STEAM_UNABSORBED
+                iteration_action_value = excess_steam_mt
+                iteration_status = "EXCESS_STEAM_LIMIT_REACHED"
             else:
                 # Excess steam is small, no adjustment needed
-                print(f"\n  [INFO] Excess steam ({excess_steam_mt:.2f} MT) is small, no balancing needed")
+                if verbose:
+                    print(f"\n  [INFO] Excess steam ({excess_steam_mt:.2f} MT) is small, no balancing needed")
         
         # ---------------------------------------------------------
         # STEP 3g.2: Check if we can INCREASE STG to consume excess steam
@@ -1433,40 +1845,42 @@ def usd_iterate(
             # Try to recover some STG generation
             excess_shp = abs(shp_deficit)
             
-            # Calculate how much STG we can recover
-            potential_stg_recovery = excess_shp / NORM_STG_SHP_PER_KWH / 1000  # MWh
-            
-            # Apply damping factor (50%) to prevent oscillation
-            # Only recover half of what's possible to allow gradual convergence
-            damped_recovery = potential_stg_recovery * 0.5
-            actual_recovery = min(damped_recovery, stg_reduction_mwh)
+            # Calculate how much STG we can recover (MWh), damped by 50%
+            # so that recovery converges gradually instead of oscillating
+            potential_stg_recovery, damped_recovery, actual_recovery = _stg_recovery_step(
+                excess_shp, stg_reduction_mwh
+            )
             
             if actual_recovery > 0.1:  # Only if meaningful (increased threshold)
-                print(f"\n  [ACTION] EXCESS SHP DETECTED - RECOVERING STG!")
-                print(f"       Excess SHP Available:     {excess_shp:>14.2f} MT")
-                print(f"       Potential STG Recovery:   {potential_stg_recovery:>14.2f} MWh")
-                print(f"       Damped Recovery (50%):    {damped_recovery:>14.2f} MWh")
-                print(f"       Previous STG Reduction:   {stg_reduction_mwh:>14.2f} MWh")
-                print(f"       Actual STG Recovery:      {actual_recovery:>14.2f} MWh")
+                if verbose:
+                    print(f"\n  [ACTION] EXCESS SHP DETECTED - RECOVERING STG!")
+                    print(f"       Excess SHP Available:     {excess_shp:>14.2f} MT")
+                    print(f"       Potential STG Recovery:   {potential_stg_recovery:>14.2f} MWh")
+                    print(f"       Damped Recovery (50%):    {damped_recovery:>14.2f} MWh")
+                    print(f"       Previous STG Reduction:   {stg_reduction_mwh:>14.2f} MWh")
+                    print(f"       Actual STG Recovery:      {actual_recovery:>14.2f} MWh")
                 
                 stg_reduction_mwh -= actual_recovery
                 import_compensation_mwh = stg_reduction_mwh
                 stg_increased = True
                 
-                print(f"       New STG Reduction:        {stg_reduction_mwh:>14.2f} MWh")
+                if verbose:
+                    print(f"       New STG Reduction:        {stg_reduction_mwh:>14.2f} MWh")
                 
-                iteration_record["action"] = f"INCREASE_STG_{actual_recovery:.2f}_MWH"
-                iteration_record["status"] = "SHP_EXCESS_RECOVERY"
+                iteration_action_code = ACTION_INCREASE_STG
+                iteration_action_value = actual_recovery
+                iteration_status = "SHP_EXCESS_RECOVERY"
         
         # Now check for final convergence
         if power_converged and shp_converged and not stg_increased:
-            print(f"\n  [CONVERGED] Both Power and Steam balanced!")
-            print(f"       Power Aux Error: {aux_power_error:.6f} MWh <= {USD_TOLERANCE} MWh")
-            print(f"       SHP Deficit: {shp_deficit:.2f} MT <= 0 (CAN MEET)")
+            if verbose:
+                print(f"\n  [CONVERGED] Both Power and Steam balanced!")
+                print(f"       Power Aux Error: {aux_power_error:.6f} MWh <= {USD_TOLERANCE} MWh")
+                print(f"       SHP Deficit: {shp_deficit:.2f} MT <= 0 (CAN MEET)")
             
-            iteration_record["action"] = "CONVERGED"
-            iteration_record["status"] = "CONVERGED"
-            iteration_history.append(iteration_record)
+            iteration_action_code = ACTION_CONVERGED
+            iteration_status = "CONVERGED"
+            iteration_history.append(IterRecord(*iteration_values, iteration_action_code, iteration_action_value, iteration_status))
             converged = True
             
             # Store final values
@@ -1479,33 +1893,47 @@ def usd_iterate(
             final_mp_balance = mp_balance  # STG load-based MP balance
             break
         
+        # Power still settling without an SHP deficit is the common case, so it
+        # is tested first. Whenever an SHP deficit exists, STEP 3h handles it
+        # regardless of power convergence.
+        shp_deficit_pending = not can_meet_shp and shp_deficit > 0
+        
+        if not shp_deficit_pending and not power_converged:
+            if verbose:
+                print(f"\n  [CONTINUE] Power Aux not stabilized yet...")
+            iteration_action_code = ACTION_AUX_ITER
+            iteration_action_value = aux_power_error
+            iteration_status = "POWER_ITERATING"
+        
         # ---------------------------------------------------------
         # STEP 3h: If SHP CANNOT be met, REDUCE STG
         # ---------------------------------------------------------
-        if not can_meet_shp and shp_deficit > 0:
+        elif shp_deficit_pending:
             # Calculate how much STG to reduce to eliminate SHP deficit
             # SHP deficit = SHP demand - SHP capacity
             # STG SHP = STG_gross_kwh * 0.0036
-            # To reduce SHP demand by X MT, reduce STG by X / 0.0036 KWh = X / 0.0036 / 1000 MWh
-            
-            stg_reduction_for_shp = shp_deficit / NORM_STG_SHP_PER_KWH / 1000  # MWh
+            stg_reduction_for_shp, next_stg_reduction_mwh, next_import_compensation_mwh = _stg_reduction_step(
+                shp_deficit, stg_reduction_mwh, stg_original_max_mwh
+            )
             
-            print(f"\n  [ACTION] SHP DEFICIT DETECTED - REDUCING STG!")
-            print(f"       SHP Deficit:          {shp_deficit:>14.2f} MT")
-            print(f"       STG Reduction Needed: {stg_reduction_for_shp:>14.2f} MWh")
-            print(f"       (To reduce SHP demand by {shp_deficit:.2f} MT)")
+            if verbose:
+                print(f"\n  [ACTION] SHP DEFICIT DETECTED - REDUCING STG!")
+                print(f"       SHP Deficit:          {shp_deficit:>14.2f} MT")
+                print(f"       STG Reduction Needed: {stg_reduction_for_shp:>14.2f} MWh")
+                print(f"       (To reduce SHP demand by {shp_deficit:.2f} MT)")
             
             # Check if STG is already at 0
             if stg_gross_mwh <= 0:
                 print(f"\n  [ERROR] STG already at 0 but SHP still insufficient!")
-                print(f"       This means SHP demand exceeds maximum HRSG capacity.")
-                print(f"       SHP Demand:     {shp_demand:>14.2f} MT")
-                print(f"       Max SHP Cap:    {max_shp_capacity:>14.2f} MT")
-                print(f"       Shortfall:      {shp_deficit:>14.2f} MT")
+                if verbose:
+                    print(f"       This means SHP demand exceeds maximum HRSG capacity.")
+                    print(f"       SHP Demand:     {shp_demand:>14.2f} MT")
+                    print(f"       Max SHP Cap:    {max_shp_capacity:>14.2f} MT")
+                    print(f"       Shortfall:      {shp_deficit:>14.2f} MT")
                 
-                iteration_record["action"] = "SHP_IMPOSSIBLE"
-                iteration_record["status"] = "FAILED"
-                iteration_history.append(iteration_record)
+                iteration_action_code = ACTION_SHP_IMPOSSIBLE
+                iteration_status = _STATUS_FAILED
+                iteration_history.append(IterRecord(*iteration_values, iteration_action_code, iteration_action_value, iteration_status))
                 
                 # Store final values and exit
                 final_dispatch = current_dispatch
@@ -1517,65 +1945,73 @@ def usd_iterate(
                 final_mp_balance = mp_balance  # STG load-based MP balance
                 break
             
-            # Add to cumulative STG reduction (but cap at original max)
-            stg_reduction_mwh += stg_reduction_for_shp
-            if stg_original_max_mwh is not None:
-                stg_reduction_mwh = min(stg_reduction_mwh, stg_original_max_mwh)
-            import_compensation_mwh = stg_reduction_mwh  # Compensate with import
+            # Add to cumulative STG reduction (capped at original max), compensate with import
+            stg_reduction_mwh = next_stg_reduction_mwh
+            import_compensation_mwh = next_import_compensation_mwh
             
-            print(f"       Cumulative STG Reduction: {stg_reduction_mwh:>10.2f} MWh")
-            print(f"       Cumulative Import Comp:   {import_compensation_mwh:>10.2f} MWh")
+            if verbose:
+                print(f"       Cumulative STG Reduction: {stg_reduction_mwh:>10.2f} MWh")
+                print(f"       Cumulative Import Comp:   {import_compensation_mwh:>10.2f} MWh")
             
-            iteration_record["action"] = f"REDUCE_STG_{stg_reduction_for_shp:.2f}_MWH"
-            iteration_record["status"] = "SHP_DEFICIT"
-        
-        elif not power_converged:
-            print(f"\n  [CONTINUE] Power Aux not stabilized yet...")
-            iteration_record["action"] = f"AUX_ERROR_{aux_power_error:.6f}_MWH"
-            iteration_record["status"] = "POWER_ITERATING"
+            iteration_action_code = ACTION_REDUCE_STG
+            iteration_action_value = stg_reduction_for_shp
+            iteration_status = "SHP_DEFICIT"
         
-        iteration_history.append(iteration_record)
-        
-        # Store current values
-        final_dispatch = current_dispatch
-        final_power_result = power_result
-        final_steam_balance = steam_balance
-        final_shp_capacity = shp_capacity
-        final_hrsg_availability = hrsg_availability
-        final_lp_balance = lp_balance  # STG load-based LP balance
-        final_mp_balance = mp_balance  # STG load-based MP balance
+        iteration_history.append(IterRecord(*iteration_values, iteration_action_code, iteration_action_value, iteration_status))
         
         # ---------------------------------------------------------
         # Calculate STG limit based on steam availability for NEXT iteration
         # Per flowchart: STG should be limited by available SHP
         # ---------------------------------------------------------
         # Base SHP demand (without STG) = Process + Fixed + PRDS demands
-        base_shp_demand = shp_process + shp_fixed
-        base_shp_demand += steam_balance['lp_balance'].get('shp_for_stg_lp', 0)
-        base_shp_demand += steam_balance['mp_balance'].get('shp_for_stg_mp', 0)
-        base_shp_demand += steam_balance['hp_balance'].get('shp_for_hp_prds', 0)
-        base_shp_demand += steam_balance['mp_balance'].get('shp_for_prds_mp', 0)
-        
         # Available SHP for STG = Max Capacity - Base Demand
-        available_shp_for_stg = max_shp_capacity - base_shp_demand
-        
-        # Max STG power based on steam = Available SHP / 0.0036 MT per KWh
-        if available_shp_for_stg > 0:
-            max_stg_kwh_from_steam = available_shp_for_stg / NORM_STG_SHP_PER_KWH
-            stg_steam_limit_mwh = max_stg_kwh_from_steam / 1000  # Convert to MWh
-        else:
-            stg_steam_limit_mwh = 0.0
+        base_shp_demand, available_shp_for_stg, stg_steam_limit_mwh = _stg_steam_limit_step(
+            max_shp_capacity,
+            shp_base_fixed,
+            shp_for_stg_lp,
+            shp_for_stg_mp,
+            shp_for_hp_prds,
+            shp_for_prds_mp,
+        )
         
-        print(f"\n  [STEAM-BASED STG LIMIT CALCULATION]:")
-        print(f"       Base SHP Demand (no STG):     {base_shp_demand:>12.2f} MT")
-        print(f"       Max SHP Capacity:             {max_shp_capacity:>12.2f} MT")
-        print(f"       Available SHP for STG:        {available_shp_for_stg:>12.2f} MT")
-        print(f"       Max STG from Steam:           {stg_steam_limit_mwh:>12.2f} MWh")
-        print(f"       Current STG Generation:       {stg_gross_mwh:>12.2f} MWh")
+        if verbose:
+            print(f"\n  [STEAM-BASED STG LIMIT CALCULATION]:")
+            print(f"       Base SHP Demand (no STG):     {base_shp_demand:>12.2f} MT")
+            print(f"       Max SHP Capacity:             {max_shp_capacity:>12.2f} MT")
+            print(f"       Available SHP for STG:        {available_shp_for_stg:>12.2f} MT")
+            print(f"       Max STG from Steam:           {stg_steam_limit_mwh:>12.2f} MWh")
+            print(f"       Current STG Generation:       {stg_gross_mwh:>12.2f} MWh")
         
         # Update for next iteration
-        previous_utility_aux_mwh = current_utility_aux_mwh
+        next_utility_aux_mwh = current_utility_aux_mwh
+        
+        # Two consecutive plain power-only passes: extrapolate the aux power
+        # fixed point instead of taking another linear step
+        if USD_AITKEN_ACCELERATION and iteration_status == "POWER_ITERATING" and len(iteration_history) >= 2:
+            prev_record = iteration_history[-2]
+            if prev_record.status == "POWER_ITERATING" and prev_record.current_aux_mwh == previous_utility_aux_mwh:
+                accelerated_aux_mwh = _aitken_aux_step(
+                    prev_record.previous_aux_mwh,
+                    previous_utility_aux_mwh,
+                    current_utility_aux_mwh,
+                )
+                if accelerated_aux_mwh is not None:
+                    if verbose:
+                        print(f"\n  [AITKEN] Aux power extrapolated: {current_utility_aux_mwh:.4f} -> {accelerated_aux_mwh:.4f} MWh")
+                    next_utility_aux_mwh = accelerated_aux_mwh
+        
+        previous_utility_aux_mwh = next_utility_aux_mwh
         previous_shp_deficit = shp_deficit
+    else:
+        # Iteration limit reached without a break: keep the last pass's values
+        # (the CONVERGED / SHP_IMPOSSIBLE paths store theirs before breaking)
+        final_dispatch = current_dispatch
+        final_power_result = power_result
+        final_steam_balance = steam_balance
+        final_shp_capacity = shp_capacity
+        final_hrsg_availability = hrsg_availability
+        final_lp_balance = lp_balance  # STG load-based LP balance
+        final_mp_balance = mp_balance  # STG load-based MP balance
     
     # =========================================================
     # STEP 4: FINAL RESULTS
@@ -1584,14 +2020,6 @@ def usd_iterate(
     print("STEP 4: FINAL RESULTS")
     print("-"*80)
     
-    # Calculate final SHP balance
-    final_shp_balance = None
-    if final_steam_balance and final_shp_capacity:
-        final_shp_balance = check_shp_balance(
-            final_steam_balance["summary"]["total_shp_demand"],
-            final_shp_capacity
-        )
-    
     final_aux_power = current_utility_aux_mwh if iteration_history else 0.0
     
     # Get excess power for export from final power result
@@ -1613,52 +2041,92 @@ def usd_iterate(
             print(f"  Export Status:           NOT AVAILABLE")
             print(f"  WARNING: Excess power generated but export not available!")
     
-    return {
-        "success": converged,
-        "error_type": None if converged else "USD_NOT_CONVERGED",
-        "message": "USD iteration converged successfully" if converged else "USD iteration did not converge",
-        "converged": converged,
-        "iterations_used": len(iteration_history),
-        "final_power_aux_mwh": round(final_aux_power, 4),
-        "tolerance_achieved": iteration_history[-1]["aux_power_error_mwh"] if iteration_history else 0.0,
+    return USDResult(
+        success=converged,
+        error_type=None if converged else "USD_NOT_CONVERGED",
+        message="USD iteration converged successfully" if converged else "USD iteration did not converge",
+        converged=converged,
+        iterations_used=len(iteration_history),
+        final_power_aux_mwh=round(final_aux_power, 4),
+        tolerance_achieved=round(iteration_history[-1].aux_power_error_mwh, 6) if iteration_history else 0.0,
         
         # STG Extraction (FIXED based on steam demand)
-        "stg_extraction": stg_extraction,
+        stg_extraction=stg_extraction,
         
         # Power results
-        "power_result": final_power_result,
-        "final_dispatch": final_dispatch,
+        power_result=final_power_result,
+        final_dispatch=final_dispatch,
         
         # Steam results
-        "final_steam_balance": final_steam_balance,
-        "final_hrsg_availability": final_hrsg_availability,
-        "final_shp_capacity": final_shp_capacity,
-        "final_shp_balance": final_shp_balance,
+        final_steam_balance=final_steam_balance,
+        final_hrsg_availability=final_hrsg_availability,
+        final_shp_capacity=final_shp_capacity,
         
-        # STG load-based LP/MP balance (with calculated ratios)
-        "final_lp_balance": final_lp_balance,
-        "final_mp_balance": final_mp_balance,
+        # STG load-based LP/MP balance (with calculated ratios), rounded for output
+        final_lp_balance=round_balance(final_lp_balance),
+        final_mp_balance=round_balance(final_mp_balance),
         
         # HRSG MIN load calculation (backward compatibility)
-        "hrsg_min_load": final_hrsg_min_load,
+        hrsg_min_load=final_hrsg_min_load,
         
         # HRSG Dispatch (priority-based load allocation)
-        "hrsg_dispatch": final_hrsg_dispatch,
+        hrsg_dispatch=final_hrsg_dispatch,
         
         # HRSG Natural Gas reverse calculation (from heat rate lookup)
-        "hrsg_ng_calculation": final_hrsg_ng_calculation,
+        hrsg_ng_calculation=final_hrsg_ng_calculation,
         
         # STG Reduction (for SHP balance)
-        "stg_reduction_mwh": round(stg_reduction_mwh, 2),
-        "import_compensation_mwh": round(import_compensation_mwh, 2),
+        stg_reduction_mwh=round(stg_reduction_mwh, 2),
+        import_compensation_mwh=round(import_compensation_mwh, 2),
         
         # Export power
-        "excess_power_for_export_mwh": round(final_excess_power, 2),
-        "export_available": export_available,
+        excess_power_for_export_mwh=round(final_excess_power, 2),
+        export_available=export_available,
         
         # Iteration history
-        "iteration_history": iteration_history,
-    }
+        iteration_history=[_iteration_record_to_dict(r) for r in iteration_history],
+    )
+
+
+def usd_iterate_batch(
+    month: int,
+    year: int,
+    scenarios: list,
+    export_available: bool = False,
+    verbose: bool = False,
+) -> list:
+    """
+    Run usd_iterate() for several steam-demand scenarios of the same period.
+    
+    The STG extraction and HRSG heat rate lookup tables are fetched once and
+    shared by every scenario, and per-iteration diagnostics are off by default.
+    
+    Args:
+        month, year: Financial period shared by all scenarios
+        scenarios: List of dicts with usd_iterate steam demand arguments
+                   (lp_process, lp_fixed, mp_process, mp_fixed, hp_process,
+                   hp_fixed, shp_process, shp_fixed and optionally bfw_ufu)
+        export_available: Whether export power is available
+        verbose: Print per-iteration diagnostics for each scenario
+    
+    Returns:
+        List of USDResult objects, in scenario order
+    """
+    stg_extraction_lookup_df = fetch_stg_extraction_lookup()
+    hrsg_heat_rate_lookup_df = fetch_hrsg_heat_rate_lookup()
+    
+    results = []
+    for scenario in scenarios:
+        results.append(usd_iterate(
+            month=month,
+            year=year,
+            export_available=export_available,
+            verbose=verbose,
+            stg_extraction_lookup_df=stg_extraction_lookup_df,
+            hrsg_heat_rate_lookup_df=hrsg_heat_rate_lookup_df,
+            **scenario,
+        ))
+    return results
 
 
 # ============================================================
@@ -8,6 +8,7 @@ Updates:
 """
 
 from database.connection import get_connection
+from database.norms_queries import clear_norms_cache
 
 
 def save_calculated_norms(month: int, year: int, result: dict, dry_run: bool = False) -> dict:
@@ -144,6 +145,10 @@ def save_calculated_norms(month: int, year: int, result: dict, dry_run: bool = F
     
     conn.close()
     
+    # Saved norms must be re-read from the DB, not served from the cache
+    if not dry_run and updated_count:
+        clear_norms_cache()
+    
     return {
         'success': True,
         'message': f'{"DRY RUN: " if dry_run else ""}Updated {updated_count} records, {same_count} unchanged',
@@ -5,6 +5,13 @@ Service to fetch, store, and compare norms from database with hardcoded values.
 Provides dynamic norms loading based on month/year input.
 """
 
+import io
+import sys
+import threading
+from functools import lru_cache
+from math import isclose
+from types import MappingProxyType
+
 from database.norms_queries import fetch_all_norms_for_month
 
 
@@ -17,24 +24,54 @@ class DynamicNorms:
     Access norms like: NORMS.GT2_NATURAL_GAS or NORMS.get('GT2_NATURAL_GAS')
     """
     
+    # Internal state lives in slots; __dict__ is kept for the promoted norms
+    __slots__ = ('_norms', '_loaded', '_month', '_year', '_hardcoded', '_version', '__dict__')
+    
     def __init__(self):
         self._norms = {}
         self._loaded = False
         self._month = None
         self._year = None
+        self._hardcoded = None
+        self._version = 0  # Bumped on every change; keys the get_norm() cache
+    
+    def load(self, month: int, year: int, use_hardcoded: bool = True):
+        """
+        Load norms for a period, skipping the reload if this period (and source)
+        is already loaded. See load_norms_for_calculation().
+        """
+        if (self._loaded and self._month == month and self._year == year
+                and self._hardcoded == use_hardcoded):
+            return self
+        return load_norms_for_calculation(month, year, use_hardcoded)
     
     def set(self, key: str, value: float):
-        """Set a norm value."""
+        """
+        Set a norm value.
+        
+        The value is also promoted to a real instance attribute so that
+        NORMS.GT2_NATURAL_GAS is a plain __dict__ hit; __getattr__ only
+        runs for norms that were never set.
+        """
         self._norms[key] = value
+        object.__setattr__(self, key, value)
+        self._version += 1
+    
+    def update(self, values: dict):
+        """Set several norm values at once (same promotion as set())."""
+        self._norms.update(values)
+        self.__dict__.update(values)
+        self._version += 1
     
     def get(self, key: str, default: float = None):
         """Get a norm value with optional default."""
         return self._norms.get(key, default)
     
     def __getattr__(self, name: str):
-        """Allow attribute-style access: NORMS.GT2_NATURAL_GAS"""
-        if name.startswith('_'):
-            return object.__getattribute__(self, name)
+        """Miss path for attribute-style access: NORMS.GT2_NATURAL_GAS"""
+        # Unset slots and dunder probes (copy, pickle, hasattr) must still miss
+        if name[:1] == "_":
+            raise AttributeError(name)
         return self._norms.get(name)
     
     def is_loaded(self) -> bool:
@@ -44,10 +81,15 @@ class DynamicNorms:
         return (self._month, self._year)
     
     def clear(self):
+        # Drop the promoted attributes so cleared norms fall back to __getattr__
+        for key in self._norms:
+            self.__dict__.pop(key, None)
         self._norms = {}
         self._loaded = False
         self._month = None
         self._year = None
+        self._hardcoded = None
+        self._version += 1
 
 
 # Global instance
@@ -136,8 +178,17 @@ def get_norm(key: str, default: float = None) -> float:
     Returns:
         Norm value from DB if loaded and not None, else fallback default
     """
+    return _resolve_norm(key, default, NORMS._version, NORMS._loaded)
+
+
+@lru_cache(maxsize=256)
+def _resolve_norm(key: str, default: float, version: int, loaded: bool) -> float:
+    """
+    Cached body of get_norm(). version/loaded only key the cache: any change
+    to NORMS bumps its version, so stale entries are never hit again.
+    """
     # First try to get from loaded norms
-    if NORMS.is_loaded():
+    if loaded:
         db_value = NORMS.get(key)
         if db_value is not None:
             return db_value
@@ -148,17 +199,296 @@ def get_norm(key: str, default: float = None) -> float:
     return _DEFAULTS.get(key, 0.0)
 
 
+# ============================================================
+# NORM LOOKUP TABLES (built once at import)
+# ============================================================
+# Keys are (plant, utility, material) as stored in the norms tables.
+
+def _intern(value):
+    """Intern a plant/utility/material name (non-strings such as NULL pass through)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _to_float_or_none(value):
+    """Convert a DB numeric to float, keeping NULL as None."""
+    return None if value is None else float(value)
+
+
+def _intern_keys(table: dict) -> dict:
+    """Rebuild a (plant, utility, material)-keyed table with interned key strings."""
+    return {tuple(_intern(part) for part in key): value for key, value in table.items()}
+
+
+# Hardcoded norms from utility_service.py and iteration_service.py
+_HARDCODED_NORMS = MappingProxyType(_intern_keys({
+    # Power Plants - Natural Gas
+    ('NMD - Power Plant 2', 'POWERGEN', 'NATURAL GAS'): {'code_norm': 0.0101, 'description': 'GT2 NG Norm'},
+    ('NMD - Power Plant 3', 'POWERGEN', 'NATURAL GAS'): {'code_norm': 0.0095, 'description': 'GT3 NG Norm'},
+    
+    # Power Plants - Auxiliary Power
+    ('NMD - Power Plant 1', 'POWERGEN', 'Power_Dis'): {'code_norm': 0.0140, 'description': 'GT1 Aux Power'},
+    ('NMD - Power Plant 2', 'POWERGEN', 'Power_Dis'): {'code_norm': 0.0140, 'description': 'GT2 Aux Power'},
+    ('NMD - Power Plant 3', 'POWERGEN', 'Power_Dis'): {'code_norm': 0.0140, 'description': 'GT3 Aux Power'},
+    
+    # STG Power Plant
+    ('NMD - STG Power Plant', 'POWERGEN', 'Power_Dis'): {'code_norm': 0.0020, 'description': 'STG Aux Power'},
+    ('NMD - STG Power Plant', 'POWERGEN', 'SHP Steam_Dis'): {'code_norm': 0.0036, 'description': 'STG SHP Norm'},
+    ('NMD - STG Power Plant', 'POWERGEN', 'Ret steam condensate'): {'code_norm': 0.0029, 'description': 'STG Condensate'},
+    
+    # BFW
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'D M Water'): {'code_norm': 0.8600, 'description': 'BFW DM Water'},
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'LP Steam_Dis'): {'code_norm': 0.1450, 'description': 'BFW LP Steam'},
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'Power_Dis'): {'code_norm': 9.5000, 'description': 'BFW Power'},
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'CHEM CYCLO HEXY'): {'code_norm': 0.0001, 'description': 'BFW Cyclohexy'},
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'CHEM MORPHOLENE'): {'code_norm': 0.000002, 'description': 'BFW Morpholene'},
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'KEM WATREAT B 70M'): {'code_norm': 0.0005700, 'description': 'BFW Watreat'},
+    
+    # Compressed Air
+    ('NMD - Utility Plant', 'COMPRESSED AIR', 'Power_Dis'): {'code_norm': 0.1650, 'description': 'Air Power'},
+    
+    # Cooling Water 1
+    ('NMD - Utility Plant', 'Cooling Water 1', 'Power_Dis'): {'code_norm': 245.0000, 'description': 'CW1 Power'},
+    ('NMD - Utility Plant', 'Cooling Water 1', 'SULPHURIC ACID'): {'code_norm': 0.0001580, 'description': 'CW1 Sulphuric Acid'},
+    
+    # Cooling Water 2
+    ('NMD - Utility Plant', 'Cooling Water 2', 'Power_Dis'): {'code_norm': 250.0000, 'description': 'CW2 Power'},
+    ('NMD - Utility Plant', 'Cooling Water 2', 'Water'): {'code_norm': 11.5000, 'description': 'CW2 Water'},
+    ('NMD - Utility Plant', 'Cooling Water 2', 'SULPHURIC ACID'): {'code_norm': 0.0001580, 'description': 'CW2 Sulphuric Acid'},
+    
+    # DM Water
+    ('NMD - Utility Plant', 'D M Water', 'Power_Dis'): {'code_norm': 1.2100, 'description': 'DM Power'},
+    ('NMD - Utility Plant', 'D M Water', 'COMPRESSED AIR'): {'code_norm': 0.0770, 'description': 'DM Air'},
+    ('NMD - Utility Plant', 'D M Water', 'Ret steam condensate'): {'code_norm': 0.2030, 'description': 'DM Condensate'},
+    ('NMD - Utility Plant', 'D M Water', 'Water'): {'code_norm': 1.0500, 'description': 'DM Water'},
+    ('NMD - Utility Plant', 'D M Water', 'CAUSTIC SODA LYE – GRADE 1'): {'code_norm': 0.0002260, 'description': 'DM Caustic'},
+    ('NMD - Utility Plant', 'D M Water', 'CHEM ALUM.SULFATE, AL2(SO4)3,18H2O'): {'code_norm': 0.0007570, 'description': 'DM Alum Sulfate'},
+    ('NMD - Utility Plant', 'D M Water', 'CHEM  SODIUM SULPHITE;PN:MIS 19OX'): {'code_norm': 0.0007010, 'description': 'DM Sodium Sulphite'},
+    ('NMD - Utility Plant', 'D M Water', 'POLYELECTROLYTE'): {'code_norm': 0.0005780, 'description': 'DM Polyelectrolyte'},
+    ('NMD - Utility Plant', 'D M Water', 'SODIUM CHLORIDE IS 797 GRADE1'): {'code_norm': 0.0000100, 'description': 'DM Sodium Chloride'},
+    ('NMD - Utility Plant', 'D M Water', 'HYDRO CHLORIC ACID (30%) -VIRGIN'): {'code_norm': 0.0003800, 'description': 'DM HCl'},
+    
+    # Effluent
+    ('NMD - Utility Plant', 'Effluent Treated', 'Power_Dis'): {'code_norm': 3.5400, 'description': 'Effluent Power'},
+    ('NMD - Utility Plant', 'Effluent Treated', 'Water'): {'code_norm': 0.0007, 'description': 'Effluent Water'},
+    
+    # HP Steam PRDS
+    ('NMD - Utility Plant', 'HP Steam PRDS', 'Boiler Feed Water'): {'code_norm': 0.0768, 'description': 'HP PRDS BFW'},
+    ('NMD - Utility Plant', 'HP Steam PRDS', 'SHP Steam_Dis'): {'code_norm': 0.9232, 'description': 'HP PRDS SHP'},
+    
+    # HRSG2
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'Boiler Feed Water'): {'code_norm': 1.0240, 'description': 'HRSG2 BFW'},
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'LP Steam_Dis'): {'code_norm': -0.0504, 'description': 'HRSG2 LP Credit'},
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'NATURAL GAS'): {'code_norm': 2.8064, 'description': 'HRSG2 NG'},
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'CHEM TRISODIUM PHOSPHATE'): {'code_norm': 0.0009, 'description': 'HRSG2 Trisodium'},
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'FURNACE OIL ( MEDIUM VISCOSITY GRADE )'): {'code_norm': 0.0001, 'description': 'HRSG2 Furnace Oil'},
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'Water'): {'code_norm': 0.0027, 'description': 'HRSG2 Water'},
+    
+    # HRSG3
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'Boiler Feed Water'): {'code_norm': 1.0240, 'description': 'HRSG3 BFW'},
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'LP Steam_Dis'): {'code_norm': -0.0504, 'description': 'HRSG3 LP Credit'},
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'NATURAL GAS'): {'code_norm': 2.8168, 'description': 'HRSG3 NG'},
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'CHEM TRISODIUM PHOSPHATE'): {'code_norm': 0.0009, 'description': 'HRSG3 Trisodium'},
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'FURNACE OIL ( MEDIUM VISCOSITY GRADE )'): {'code_norm': 0.0001, 'description': 'HRSG3 Furnace Oil'},
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'Water'): {'code_norm': 0.0027, 'description': 'HRSG3 Water'},
+    
+    # LP Steam PRDS
+    ('NMD - Utility Plant', 'LP Steam PRDS', 'Boiler Feed Water'): {'code_norm': 0.2500, 'description': 'LP PRDS BFW'},
+    ('NMD - Utility Plant', 'LP Steam PRDS', 'MP Steam_Dis'): {'code_norm': 0.7500, 'description': 'LP PRDS MP'},
+    
+    # MP Steam PRDS
+    ('NMD - Utility Plant', 'MP Steam PRDS SHP', 'Boiler Feed Water'): {'code_norm': 0.0900, 'description': 'MP PRDS BFW'},
+    ('NMD - Utility Plant', 'MP Steam PRDS SHP', 'SHP Steam_Dis'): {'code_norm': 0.9100, 'description': 'MP PRDS SHP'},
+    
+    # Oxygen
+    ('NMD - Utility Plant', 'Oxygen', 'Power_Dis'): {'code_norm': 968.6500, 'description': 'Oxygen Power'},
+    ('NMD - Utility Plant', 'Oxygen', 'Cooling Water 2'): {'code_norm': 0.2610, 'description': 'Oxygen CW2'},
+    ('NMD - Utility Plant', 'Oxygen', 'Nitrogen Gas'): {'code_norm': 2448.4000, 'description': 'Oxygen Nitrogen'},
+    
+    # STG LP/MP Steam
+    ('NMD - Utility Plant', 'STG1_LP STEAM', 'SHP Steam_Dis'): {'code_norm': 0.4800, 'description': 'STG LP SHP'},
+    ('NMD - Utility Plant', 'STG1_MP STEAM', 'SHP Steam_Dis'): {'code_norm': 0.6900, 'description': 'STG MP SHP'},
+}))
+
+# Flattened (plant, utility, material, code_norm, description) rows for compare_with_hardcoded()
+_HARDCODED_ITEMS = tuple(
+    (plant, utility, material, data['code_norm'], data['description'])
+    for (plant, utility, material), data in _HARDCODED_NORMS.items()
+)
+
+# Row templates for print_comparison_report()
+_MATCH_FMT = "%-25s %-25s %-20s %-30s %12.6f %12.6f\n"
+_MISMATCH_FMT = "%-25s %-25s %-30s %12.6f %12.6f %+12.6f %10s\n"
+_MISSING_FMT = "%-25s %-25s %-20s %-30s %12.6f %15s\n"
+
+# Right-justified NULL cell for print_loaded_norms()
+_NULL_SUFFIX = f"{'NULL':>15}"
+
+# Map database norms to standardized keys
+# Format: NORMS.PLANT_UTILITY_MATERIAL or simplified keys
+_NORM_MAPPING = MappingProxyType(_intern_keys({
+    # Power Plants - Natural Gas (MMBTU per KWH)
+    ('NMD - Power Plant 2', 'POWERGEN', 'NATURAL GAS'): 'GT2_NATURAL_GAS',
+    ('NMD - Power Plant 3', 'POWERGEN', 'NATURAL GAS'): 'GT3_NATURAL_GAS',
+    
+    # Power Plants - Auxiliary Power (KWH per KWH)
+    ('NMD - Power Plant 1', 'POWERGEN', 'Power_Dis'): 'GT1_AUX_POWER',
+    ('NMD - Power Plant 2', 'POWERGEN', 'Power_Dis'): 'GT2_AUX_POWER',
+    ('NMD - Power Plant 3', 'POWERGEN', 'Power_Dis'): 'GT3_AUX_POWER',
+    ('NMD - STG Power Plant', 'POWERGEN', 'Power_Dis'): 'STG_AUX_POWER',
+    
+    # STG Norms
+    ('NMD - STG Power Plant', 'POWERGEN', 'SHP Steam_Dis'): 'STG_SHP_PER_KWH',
+    ('NMD - STG Power Plant', 'POWERGEN', 'Ret steam condensate'): 'STG_CONDENSATE',
+    
+    # BFW Norms (per M3)
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'D M Water'): 'BFW_DM_WATER',
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'LP Steam_Dis'): 'BFW_LP_STEAM',
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'Power_Dis'): 'BFW_POWER',
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'CHEM CYCLO HEXY'): 'BFW_CYCLOHEXY',
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'CHEM MORPHOLENE'): 'BFW_MORPHOLENE',
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'KEM WATREAT B 70M'): 'BFW_WATREAT',
+    
+    # Compressed Air Norms (per NM3)
+    ('NMD - Utility Plant', 'COMPRESSED AIR', 'Power_Dis'): 'AIR_POWER',
+    
+    # Cooling Water 1 Norms (per KM3)
+    ('NMD - Utility Plant', 'Cooling Water 1', 'Power_Dis'): 'CW1_POWER',
+    ('NMD - Utility Plant', 'Cooling Water 1', 'SULPHURIC ACID'): 'CW1_SULPHURIC_ACID',
+    
+    # Cooling Water 2 Norms (per KM3)
+    ('NMD - Utility Plant', 'Cooling Water 2', 'Power_Dis'): 'CW2_POWER',
+    ('NMD - Utility Plant', 'Cooling Water 2', 'Water'): 'CW2_WATER',
+    ('NMD - Utility Plant', 'Cooling Water 2', 'SULPHURIC ACID'): 'CW2_SULPHURIC_ACID',
+    
+    # DM Water Norms (per M3)
+    ('NMD - Utility Plant', 'D M Water', 'Power_Dis'): 'DM_POWER',
+    ('NMD - Utility Plant', 'D M Water', 'COMPRESSED AIR'): 'DM_AIR',
+    ('NMD - Utility Plant', 'D M Water', 'Ret steam condensate'): 'DM_CONDENSATE',
+    ('NMD - Utility Plant', 'D M Water', 'Water'): 'DM_WATER',
+    ('NMD - Utility Plant', 'D M Water', 'CAUSTIC SODA LYE – GRADE 1'): 'DM_CAUSTIC',
+    ('NMD - Utility Plant', 'D M Water', 'CHEM ALUM.SULFATE, AL2(SO4)3,18H2O'): 'DM_ALUM_SULFATE',
+    ('NMD - Utility Plant', 'D M Water', 'CHEM  SODIUM SULPHITE;PN:MIS 19OX'): 'DM_SODIUM_SULPHITE',
+    ('NMD - Utility Plant', 'D M Water', 'POLYELECTROLYTE'): 'DM_POLYELECTROLYTE',
+    ('NMD - Utility Plant', 'D M Water', 'SODIUM CHLORIDE IS 797 GRADE1'): 'DM_SODIUM_CHLORIDE',
+    ('NMD - Utility Plant', 'D M Water', 'HYDRO CHLORIC ACID (30%) -VIRGIN'): 'DM_HCL',
+    
+    # Effluent Norms (per M3)
+    ('NMD - Utility Plant', 'Effluent Treated', 'Power_Dis'): 'EFFLUENT_POWER',
+    ('NMD - Utility Plant', 'Effluent Treated', 'Water'): 'EFFLUENT_WATER',
+    
+    # HP Steam PRDS Norms (per MT)
+    ('NMD - Utility Plant', 'HP Steam PRDS', 'Boiler Feed Water'): 'HP_PRDS_BFW',
+    ('NMD - Utility Plant', 'HP Steam PRDS', 'SHP Steam_Dis'): 'HP_PRDS_SHP',
+    
+    # HRSG2 Norms (per MT SHP)
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'Boiler Feed Water'): 'HRSG2_BFW',
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'LP Steam_Dis'): 'HRSG2_LP_CREDIT',
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'NATURAL GAS'): 'HRSG2_NATURAL_GAS',
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'CHEM TRISODIUM PHOSPHATE'): 'HRSG2_TRISODIUM',
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'FURNACE OIL ( MEDIUM VISCOSITY GRADE )'): 'HRSG2_FURNACE_OIL',
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'Water'): 'HRSG2_WATER',
+    
+    # HRSG3 Norms (per MT SHP)
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'Boiler Feed Water'): 'HRSG3_BFW',
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'LP Steam_Dis'): 'HRSG3_LP_CREDIT',
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'NATURAL GAS'): 'HRSG3_NATURAL_GAS',
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'CHEM TRISODIUM PHOSPHATE'): 'HRSG3_TRISODIUM',
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'FURNACE OIL ( MEDIUM VISCOSITY GRADE )'): 'HRSG3_FURNACE_OIL',
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'Water'): 'HRSG3_WATER',
+    
+    # LP Steam PRDS Norms (per MT)
+    ('NMD - Utility Plant', 'LP Steam PRDS', 'Boiler Feed Water'): 'LP_PRDS_BFW',
+    ('NMD - Utility Plant', 'LP Steam PRDS', 'MP Steam_Dis'): 'LP_PRDS_MP',
+    
+    # MP Steam PRDS Norms (per MT)
+    ('NMD - Utility Plant', 'MP Steam PRDS SHP', 'Boiler Feed Water'): 'MP_PRDS_BFW',
+    ('NMD - Utility Plant', 'MP Steam PRDS SHP', 'SHP Steam_Dis'): 'MP_PRDS_SHP',
+    
+    # Oxygen Norms (per MT)
+    ('NMD - Utility Plant', 'Oxygen', 'Power_Dis'): 'OXYGEN_POWER',
+    ('NMD - Utility Plant', 'Oxygen', 'Cooling Water 2'): 'OXYGEN_CW2',
+    ('NMD - Utility Plant', 'Oxygen', 'Nitrogen Gas'): 'OXYGEN_NITROGEN',
+    
+    # STG Steam Extraction Norms
+    ('NMD - Utility Plant', 'STG1_LP STEAM', 'SHP Steam_Dis'): 'STG_LP_SHP',
+    ('NMD - Utility Plant', 'STG1_MP STEAM', 'SHP Steam_Dis'): 'STG_MP_SHP',
+}))
+
+# NORMS keys filled from _NORM_MAPPING (pre-seeded as None before a DB load)
+_NORM_MAPPING_KEYS = tuple(_NORM_MAPPING.values())
+
+# Fixed quantities (for items with NULL norm but fixed quantity)
+_QUANTITY_MAPPING = MappingProxyType(_intern_keys({
+    # Power Plants - Fixed quantities per month
+    ('NMD - Power Plant 2', 'POWERGEN', 'Cooling Water 2'): 'GT2_CW2_QTY',
+    ('NMD - Power Plant 2', 'POWERGEN', 'COMPRESSED AIR'): 'GT2_AIR_QTY',
+    ('NMD - Power Plant 3', 'POWERGEN', 'Cooling Water 2'): 'GT3_CW2_QTY',
+    ('NMD - Power Plant 3', 'POWERGEN', 'COMPRESSED AIR'): 'GT3_AIR_QTY',
+    ('NMD - STG Power Plant', 'POWERGEN', 'Cooling Water 2'): 'STG_CW2_QTY',
+    ('NMD - STG Power Plant', 'POWERGEN', 'COMPRESSED AIR'): 'STG_AIR_QTY',
+    
+    # HRSG Fixed quantities
+    ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'COMPRESSED AIR'): 'HRSG2_AIR_QTY',
+    ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'COMPRESSED AIR'): 'HRSG3_AIR_QTY',
+    
+    # Utility Fixed quantities
+    ('NMD - Utility Plant', 'Boiler Feed Water', 'Cooling Water 2'): 'BFW_CW2_QTY',
+    ('NMD - Utility Plant', 'COMPRESSED AIR', 'Cooling Water 2'): 'AIR_CW2_QTY',
+    ('NMD - Utility Plant', 'Cooling Water 1', 'COMPRESSED AIR'): 'CW1_AIR_QTY',
+    ('NMD - Utility Plant', 'Cooling Water 2', 'COMPRESSED AIR'): 'CW2_AIR_QTY',
+}))
+
+# (plant, utility, material) -> (norm key or None, quantity key or None)
+_NO_MAPPING = (None, None)
+_COMBINED_MAPPING = MappingProxyType({
+    key_tuple: (_NORM_MAPPING.get(key_tuple), _QUANTITY_MAPPING.get(key_tuple))
+    for key_tuple in (*_NORM_MAPPING, *_QUANTITY_MAPPING)
+})
+
+
+class NormRecord:
+    """One norms row from the database for a (plant, utility, material) key."""
+    
+    __slots__ = ('norm_value', 'quantity', 'generation', 'uom', 'issuing_uom', 'account')
+    
+    def __init__(self, norm_value, quantity, generation, uom, issuing_uom, account):
+        self.norm_value = norm_value
+        self.quantity = quantity
+        self.generation = generation
+        self.uom = uom
+        self.issuing_uom = issuing_uom
+        self.account = account
+    
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class NormsService:
     """
     Service class to manage norms data from database.
     Fetches norms for a specific month/year and provides comparison with hardcoded values.
     """
     
+    __slots__ = ('_flat', '_db_norms', 'month', 'year', '_raw_data', '_cmp_cache_key', '_cmp_cache_val')
+    
     def __init__(self):
-        self.db_norms = {}  # Stores norms fetched from database
+        self._flat = {}  # (plant, utility, material) -> norm record from database
+        self._db_norms = None  # Nested plant -> utility -> material view (built on demand)
         self.month = None
         self.year = None
         self._raw_data = []  # Raw data from database
+        self._cmp_cache_key = None  # Single-slot cache for compare_with_hardcoded()
+        self._cmp_cache_val = None
+    
+    @property
+    def db_norms(self) -> dict:
+        """Norms organized by plant -> utility -> material (built on first use)."""
+        if self._db_norms is None:
+            nested = {}
+            for (plant, utility, material), data in self._flat.items():
+                nested.setdefault(plant, {}).setdefault(utility, {})[material] = data.to_dict()
+            self._db_norms = nested
+        return self._db_norms
     
     def load_norms(self, month: int, year: int) -> dict:
         """
@@ -169,41 +499,34 @@ class NormsService:
             year: Year (e.g., 2025, 2026)
         
         Returns:
-            Dictionary of norms organized by plant and material
+            Dictionary of NormRecord keyed by (plant, utility, material)
         """
         self.month = month
         self.year = year
         self._raw_data = fetch_all_norms_for_month(month, year)
         
-        # Organize norms by plant -> utility -> material
-        self.db_norms = {}
+        # Index norms by (plant, utility, material)
+        self._flat = {}
+        self._db_norms = None
+        self._cmp_cache_key = None
         
+        flat = self._flat
         for row in self._raw_data:
-            plant = row.get('PlantName', '')
-            utility = row.get('UtilityName', '')
-            material = row.get('MaterialName', '')
-            norm_value = row.get('NormValue')
-            quantity = row.get('Quantity')
-            generation = row.get('Generation')
+            g = row.get
+            key = (_intern(g('PlantName', '')), _intern(g('UtilityName', '')), _intern(g('MaterialName', '')))
             
-            if plant not in self.db_norms:
-                self.db_norms[plant] = {}
-            
-            if utility not in self.db_norms[plant]:
-                self.db_norms[plant][utility] = {}
-            
-            self.db_norms[plant][utility][material] = {
-                'norm_value': float(norm_value) if norm_value is not None else None,
-                'quantity': float(quantity) if quantity is not None else None,
-                'generation': float(generation) if generation is not None else None,
-                'uom': row.get('UtilityUOM'),
-                'issuing_uom': row.get('IssuingUOM'),
-                'account': row.get('AccountName'),
-            }
-        
-        return self.db_norms
-    
-    def get_norm(self, plant: str, utility: str, material: str) -> dict:
+            flat[key] = NormRecord(
+                _to_float_or_none(g('NormValue')),
+                _to_float_or_none(g('Quantity')),
+                _to_float_or_none(g('Generation')),
+                g('UtilityUOM'),
+                g('IssuingUOM'),
+                g('AccountName'),
+            )
+        
+        return self._flat
+    
+    def get_norm(self, plant: str, utility: str, material: str) -> NormRecord:
         """
         Get a specific norm value.
         
@@ -213,9 +536,9 @@ class NormsService:
             material: Material name (e.g., 'NATURAL GAS')
         
         Returns:
-            Dictionary with norm_value, quantity, generation, etc.
+            NormRecord with norm_value, quantity, generation, etc., or None if not found
         """
-        return self.db_norms.get(plant, {}).get(utility, {}).get(material, {})
+        return self._flat.get((plant, utility, material))
     
     def get_norm_value(self, plant: str, utility: str, material: str) -> float:
         """
@@ -225,7 +548,7 @@ class NormsService:
             Norm value or None if not found
         """
         norm = self.get_norm(plant, utility, material)
-        return norm.get('norm_value') if norm else None
+        return norm.norm_value if norm is not None else None
     
     def get_quantity(self, plant: str, utility: str, material: str) -> float:
         """
@@ -235,121 +558,41 @@ class NormsService:
             Quantity or None if not found
         """
         norm = self.get_norm(plant, utility, material)
-        return norm.get('quantity') if norm else None
+        return norm.quantity if norm is not None else None
     
     def print_all_norms(self):
         """Print all loaded norms in a readable format."""
-        print(f"\n{'='*120}")
-        print(f"DATABASE NORMS FOR {self.month}/{self.year}")
-        print(f"{'='*120}")
+        buf = io.StringIO()
+        buf.write(f"\n{'='*120}\n")
+        buf.write(f"DATABASE NORMS FOR {self.month}/{self.year}\n")
+        buf.write(f"{'='*120}\n")
         
         for plant, utilities in sorted(self.db_norms.items()):
-            print(f"\n{plant}")
-            print("-" * 100)
+            buf.write(f"\n{plant}\n")
+            buf.write("-" * 100 + "\n")
             for utility, materials in utilities.items():
                 for material, data in materials.items():
                     norm_val = data.get('norm_value')
                     qty = data.get('quantity')
                     norm_str = f"{norm_val:.6f}" if norm_val is not None else "NULL"
                     qty_str = f"{qty:,.2f}" if qty is not None else "NULL"
-                    print(f"  {utility:<20} | {material:<35} | Norm: {norm_str:>12} | Qty: {qty_str:>15}")
+                    buf.write(f"  {utility:<20} | {material:<35} | Norm: {norm_str:>12} | Qty: {qty_str:>15}\n")
+        
+        sys.stdout.write(buf.getvalue())
     
     def compare_with_hardcoded(self) -> dict:
         """
         Compare database norms with hardcoded values in the code.
         
+        The result is cached until the next load_norms(); callers share the
+        returned dict and should not modify it.
+        
         Returns:
             Dictionary with comparison results
         """
-        # Hardcoded norms from utility_service.py and iteration_service.py
-        HARDCODED_NORMS = {
-            # Power Plants - Natural Gas
-            ('NMD - Power Plant 2', 'POWERGEN', 'NATURAL GAS'): {'code_norm': 0.0101, 'description': 'GT2 NG Norm'},
-            ('NMD - Power Plant 3', 'POWERGEN', 'NATURAL GAS'): {'code_norm': 0.0095, 'description': 'GT3 NG Norm'},
-            
-            # Power Plants - Auxiliary Power
-            ('NMD - Power Plant 1', 'POWERGEN', 'Power_Dis'): {'code_norm': 0.0140, 'description': 'GT1 Aux Power'},
-            ('NMD - Power Plant 2', 'POWERGEN', 'Power_Dis'): {'code_norm': 0.0140, 'description': 'GT2 Aux Power'},
-            ('NMD - Power Plant 3', 'POWERGEN', 'Power_Dis'): {'code_norm': 0.0140, 'description': 'GT3 Aux Power'},
-            
-            # STG Power Plant
-            ('NMD - STG Power Plant', 'POWERGEN', 'Power_Dis'): {'code_norm': 0.0020, 'description': 'STG Aux Power'},
-            ('NMD - STG Power Plant', 'POWERGEN', 'SHP Steam_Dis'): {'code_norm': 0.0036, 'description': 'STG SHP Norm'},
-            ('NMD - STG Power Plant', 'POWERGEN', 'Ret steam condensate'): {'code_norm': 0.0029, 'description': 'STG Condensate'},
-            
-            # BFW
-            ('NMD - Utility Plant', 'Boiler Feed Water', 'D M Water'): {'code_norm': 0.8600, 'description': 'BFW DM Water'},
-            ('NMD - Utility Plant', 'Boiler Feed Water', 'LP Steam_Dis'): {'code_norm': 0.1450, 'description': 'BFW LP Steam'},
-            ('NMD - Utility Plant', 'Boiler Feed Water', 'Power_Dis'): {'code_norm': 9.5000, 'description': 'BFW Power'},
-            ('NMD - Utility Plant', 'Boiler Feed Water', 'CHEM CYCLO HEXY'): {'code_norm': 0.0001, 'description': 'BFW Cyclohexy'},
-            ('NMD - Utility Plant', 'Boiler Feed Water', 'CHEM MORPHOLENE'): {'code_norm': 0.000002, 'description': 'BFW Morpholene'},
-            ('NMD - Utility Plant', 'Boiler Feed Water', 'KEM WATREAT B 70M'): {'code_norm': 0.0005700, 'description': 'BFW Watreat'},
-            
-            # Compressed Air
-            ('NMD - Utility Plant', 'COMPRESSED AIR', 'Power_Dis'): {'code_norm': 0.1650, 'description': 'Air Power'},
-            
-            # Cooling Water 1
-            ('NMD - Utility Plant', 'Cooling Water 1', 'Power_Dis'): {'code_norm': 245.0000, 'description': 'CW1 Power'},
-            ('NMD - Utility Plant', 'Cooling Water 1', 'SULPHURIC ACID'): {'code_norm': 0.0001580, 'description': 'CW1 Sulphuric Acid'},
-            
-            # Cooling Water 2
-            ('NMD - Utility Plant', 'Cooling Water 2', 'Power_Dis'): {'code_norm': 250.0000, 'description': 'CW2 Power'},
-            ('NMD - Utility Plant', 'Cooling Water 2', 'Water'): {'code_norm': 11.5000, 'description': 'CW2 Water'},
-            ('NMD - Utility Plant', 'Cooling Water 2', 'SULPHURIC ACID'): {'code_norm': 0.0001580, 'description': 'CW2 Sulphuric Acid'},
-            
-            # DM Water
-            ('NMD - Utility Plant', 'D M Water', 'Power_Dis'): {'code_norm': 1.2100, 'description': 'DM Power'},
-            ('NMD - Utility Plant', 'D M Water', 'COMPRESSED AIR'): {'code_norm': 0.0770, 'description': 'DM Air'},
-            ('NMD - Utility Plant', 'D M Water', 'Ret steam condensate'): {'code_norm': 0.2030, 'description': 'DM Condensate'},
-            ('NMD - Utility Plant', 'D M Water', 'Water'): {'code_norm': 1.0500, 'description': 'DM Water'},
-            ('NMD - Utility Plant', 'D M Water', 'CAUSTIC SODA LYE – GRADE 1'): {'code_norm': 0.0002260, 'description': 'DM Caustic'},
-            ('NMD - Utility Plant', 'D M Water', 'CHEM ALUM.SULFATE, AL2(SO4)3,18H2O'): {'code_norm': 0.0007570, 'description': 'DM Alum Sulfate'},
-            ('NMD - Utility Plant', 'D M Water', 'CHEM  SODIUM SULPHITE;PN:MIS 19OX'): {'code_norm': 0.0007010, 'description': 'DM Sodium Sulphite'},
-            ('NMD - Utility Plant', 'D M Water', 'POLYELECTROLYTE'): {'code_norm': 0.0005780, 'description': 'DM Polyelectrolyte'},
-            ('NMD - Utility Plant', 'D M Water', 'SODIUM CHLORIDE IS 797 GRADE1'): {'code_norm': 0.0000100, 'description': 'DM Sodium Chloride'},
-            ('NMD - Utility Plant', 'D M Water', 'HYDRO CHLORIC ACID (30%) -VIRGIN'): {'code_norm': 0.0003800, 'description': 'DM HCl'},
-            
-            # Effluent
-            ('NMD - Utility Plant', 'Effluent Treated', 'Power_Dis'): {'code_norm': 3.5400, 'description': 'Effluent Power'},
-            ('NMD - Utility Plant', 'Effluent Treated', 'Water'): {'code_norm': 0.0007, 'description': 'Effluent Water'},
-            
-            # HP Steam PRDS
-            ('NMD - Utility Plant', 'HP Steam PRDS', 'Boiler Feed Water'): {'code_norm': 0.0768, 'description': 'HP PRDS BFW'},
-            ('NMD - Utility Plant', 'HP Steam PRDS', 'SHP Steam_Dis'): {'code_norm': 0.9232, 'description': 'HP PRDS SHP'},
-            
-            # HRSG2
-            ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'Boiler Feed Water'): {'code_norm': 1.0240, 'description': 'HRSG2 BFW'},
-            ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'LP Steam_Dis'): {'code_norm': -0.0504, 'description': 'HRSG2 LP Credit'},
-            ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'NATURAL GAS'): {'code_norm': 2.8064, 'description': 'HRSG2 NG'},
-            ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'CHEM TRISODIUM PHOSPHATE'): {'code_norm': 0.0009, 'description': 'HRSG2 Trisodium'},
-            ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'FURNACE OIL ( MEDIUM VISCOSITY GRADE )'): {'code_norm': 0.0001, 'description': 'HRSG2 Furnace Oil'},
-            ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'Water'): {'code_norm': 0.0027, 'description': 'HRSG2 Water'},
-            
-            # HRSG3
-            ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'Boiler Feed Water'): {'code_norm': 1.0240, 'description': 'HRSG3 BFW'},
-            ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'LP Steam_Dis'): {'code_norm': -0.0504, 'description': 'HRSG3 LP Credit'},
-            ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'NATURAL GAS'): {'code_norm': 2.8168, 'description': 'HRSG3 NG'},
-            ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'CHEM TRISODIUM PHOSPHATE'): {'code_norm': 0.0009, 'description': 'HRSG3 Trisodium'},
-            ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'FURNACE OIL ( MEDIUM VISCOSITY GRADE )'): {'code_norm': 0.0001, 'description': 'HRSG3 Furnace Oil'},
-            ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'Water'): {'code_norm': 0.0027, 'description': 'HRSG3 Water'},
-            
-            # LP Steam PRDS
-            ('NMD - Utility Plant', 'LP Steam PRDS', 'Boiler Feed Water'): {'code_norm': 0.2500, 'description': 'LP PRDS BFW'},
-            ('NMD - Utility Plant', 'LP Steam PRDS', 'MP Steam_Dis'): {'code_norm': 0.7500, 'description': 'LP PRDS MP'},
-            
-            # MP Steam PRDS
-            ('NMD - Utility Plant', 'MP Steam PRDS SHP', 'Boiler Feed Water'): {'code_norm': 0.0900, 'description': 'MP PRDS BFW'},
-            ('NMD - Utility Plant', 'MP Steam PRDS SHP', 'SHP Steam_Dis'): {'code_norm': 0.9100, 'description': 'MP PRDS SHP'},
-            
-            # Oxygen
-            ('NMD - Utility Plant', 'Oxygen', 'Power_Dis'): {'code_norm': 968.6500, 'description': 'Oxygen Power'},
-            ('NMD - Utility Plant', 'Oxygen', 'Cooling Water 2'): {'code_norm': 0.2610, 'description': 'Oxygen CW2'},
-            ('NMD - Utility Plant', 'Oxygen', 'Nitrogen Gas'): {'code_norm': 2448.4000, 'description': 'Oxygen Nitrogen'},
-            
-            # STG LP/MP Steam
-            ('NMD - Utility Plant', 'STG1_LP STEAM', 'SHP Steam_Dis'): {'code_norm': 0.4800, 'description': 'STG LP SHP'},
-            ('NMD - Utility Plant', 'STG1_MP STEAM', 'SHP Steam_Dis'): {'code_norm': 0.6900, 'description': 'STG MP SHP'},
-        }
+        cache_key = (self.month, self.year, id(self._raw_data), len(self._raw_data))
+        if self._cmp_cache_key == cache_key:
+            return self._cmp_cache_val
         
         comparison_results = {
             'matched': [],
@@ -359,13 +602,13 @@ class NormsService:
         }
         
         # Compare hardcoded with database
-        for (plant, utility, material), code_data in HARDCODED_NORMS.items():
-            code_norm = code_data['code_norm']
-            description = code_data['description']
-            
-            db_norm_data = self.get_norm(plant, utility, material)
-            db_norm = db_norm_data.get('norm_value') if db_norm_data else None
-            db_qty = db_norm_data.get('quantity') if db_norm_data else None
+        flat = self._flat
+        for plant, utility, material, code_norm, description in _HARDCODED_ITEMS:
+            rec = flat.get((plant, utility, material))
+            if rec is None:
+                db_norm, db_qty = None, None
+            else:
+                db_norm, db_qty = rec.norm_value, rec.quantity
             
             result = {
                 'plant': plant,
@@ -380,7 +623,7 @@ class NormsService:
             if db_norm is None:
                 result['status'] = 'MISSING_IN_DB'
                 comparison_results['missing_in_db'].append(result)
-            elif abs(code_norm - db_norm) < 0.0000001:
+            elif isclose(code_norm, db_norm, rel_tol=1e-6, abs_tol=1e-9):
                 result['status'] = 'MATCH'
                 result['difference'] = 0
                 result['pct_diff'] = 0
@@ -391,88 +634,105 @@ class NormsService:
                 result['pct_diff'] = ((db_norm - code_norm) / code_norm * 100) if code_norm != 0 else float('inf')
                 comparison_results['mismatched'].append(result)
         
+        self._cmp_cache_key = cache_key
+        self._cmp_cache_val = comparison_results
         return comparison_results
     
     def print_comparison_report(self):
         """Print a detailed comparison report."""
         results = self.compare_with_hardcoded()
         
-        print(f"\n{'='*140}")
-        print(f"NORMS COMPARISON REPORT - Database ({self.month}/{self.year}) vs Hardcoded Values")
-        print(f"{'='*140}")
+        buf = io.StringIO()
+        buf.write(f"\n{'='*140}\n")
+        buf.write(f"NORMS COMPARISON REPORT - Database ({self.month}/{self.year}) vs Hardcoded Values\n")
+        buf.write(f"{'='*140}\n")
         
         # Summary
         total = len(results['matched']) + len(results['mismatched']) + len(results['missing_in_db'])
-        print(f"\nSUMMARY:")
-        print(f"  Total Norms Compared: {total}")
-        print(f"  ✅ Matched:           {len(results['matched'])}")
-        print(f"  ⚠️  Mismatched:        {len(results['mismatched'])}")
-        print(f"  ❌ Missing in DB:     {len(results['missing_in_db'])}")
+        buf.write(f"\nSUMMARY:\n")
+        buf.write(f"  Total Norms Compared: {total}\n")
+        buf.write(f"  ✅ Matched:           {len(results['matched'])}\n")
+        buf.write(f"  ⚠️  Mismatched:        {len(results['mismatched'])}\n")
+        buf.write(f"  ❌ Missing in DB:     {len(results['missing_in_db'])}\n")
         
         # Matched
         if results['matched']:
-            print(f"\n{'='*140}")
-            print("✅ MATCHED NORMS")
-            print(f"{'='*140}")
-            print(f"{'Description':<25} {'Plant':<25} {'Utility':<20} {'Material':<30} {'Code':>12} {'DB':>12}")
-            print("-" * 140)
+            buf.write(f"\n{'='*140}\n")
+            buf.write("✅ MATCHED NORMS\n")
+            buf.write(f"{'='*140}\n")
+            buf.write(f"{'Description':<25} {'Plant':<25} {'Utility':<20} {'Material':<30} {'Code':>12} {'DB':>12}\n")
+            buf.write("-" * 140 + "\n")
             for r in results['matched']:
-                print(f"{r['description']:<25} {r['plant']:<25} {r['utility']:<20} {r['material']:<30} {r['code_norm']:>12.6f} {r['db_norm']:>12.6f}")
+                buf.write(_MATCH_FMT % (r['description'], r['plant'], r['utility'], r['material'], r['code_norm'], r['db_norm']))
         
         # Mismatched
         if results['mismatched']:
-            print(f"\n{'='*140}")
-            print("⚠️  MISMATCHED NORMS")
-            print(f"{'='*140}")
-            print(f"{'Description':<25} {'Plant':<25} {'Material':<30} {'Code':>12} {'DB':>12} {'Diff':>12} {'%Diff':>10}")
-            print("-" * 140)
+            buf.write(f"\n{'='*140}\n")
+            buf.write("⚠️  MISMATCHED NORMS\n")
+            buf.write(f"{'='*140}\n")
+            buf.write(f"{'Description':<25} {'Plant':<25} {'Material':<30} {'Code':>12} {'DB':>12} {'Diff':>12} {'%Diff':>10}\n")
+            buf.write("-" * 140 + "\n")
             for r in results['mismatched']:
                 pct_str = f"{r['pct_diff']:>+.2f}%" if r['pct_diff'] != float('inf') else "INF"
-                print(f"{r['description']:<25} {r['plant']:<25} {r['material']:<30} {r['code_norm']:>12.6f} {r['db_norm']:>12.6f} {r['difference']:>+12.6f} {pct_str:>10}")
+                buf.write(_MISMATCH_FMT % (r['description'], r['plant'], r['material'], r['code_norm'], r['db_norm'], r['difference'], pct_str))
         
         # Missing in DB
         if results['missing_in_db']:
-            print(f"\n{'='*140}")
-            print("❌ MISSING IN DATABASE (Norm value is NULL)")
-            print(f"{'='*140}")
-            print(f"{'Description':<25} {'Plant':<25} {'Utility':<20} {'Material':<30} {'Code':>12} {'DB Qty':>15}")
-            print("-" * 140)
+            buf.write(f"\n{'='*140}\n")
+            buf.write("❌ MISSING IN DATABASE (Norm value is NULL)\n")
+            buf.write(f"{'='*140}\n")
+            buf.write(f"{'Description':<25} {'Plant':<25} {'Utility':<20} {'Material':<30} {'Code':>12} {'DB Qty':>15}\n")
+            buf.write("-" * 140 + "\n")
             for r in results['missing_in_db']:
                 qty_str = f"{r['db_quantity']:,.2f}" if r['db_quantity'] is not None else "NULL"
-                print(f"{r['description']:<25} {r['plant']:<25} {r['utility']:<20} {r['material']:<30} {r['code_norm']:>12.6f} {qty_str:>15}")
+                buf.write(_MISSING_FMT % (r['description'], r['plant'], r['utility'], r['material'], r['code_norm'], qty_str))
         
-        print(f"\n{'='*140}")
-        print("END OF COMPARISON REPORT")
-        print(f"{'='*140}\n")
+        buf.write(f"\n{'='*140}\n")
+        buf.write("END OF COMPARISON REPORT\n")
+        buf.write(f"{'='*140}\n\n")
         
+        sys.stdout.write(buf.getvalue())
         return results
 
 
 # Module-level instance for easy access
 _norms_service = None
+_norms_service_lock = threading.Lock()
 
 
 def get_norms_service() -> NormsService:
-    """Get the singleton norms service instance."""
+    """Get the singleton norms service instance (created once, thread-safe)."""
+    service = _norms_service
+    if service is not None:
+        return service
+    return _create_norms_service()
+
+
+def _create_norms_service() -> NormsService:
+    """Create the singleton under the lock (double-checked)."""
     global _norms_service
-    if _norms_service is None:
-        _norms_service = NormsService()
-    return _norms_service
+    with _norms_service_lock:
+        if _norms_service is None:
+            _norms_service = NormsService()
+        return _norms_service
 
 
-def load_and_compare_norms(month: int, year: int) -> dict:
+def load_and_compare_norms(month: int, year: int, verbose: bool = True) -> dict:
     """
     Convenience function to load norms and print comparison report.
     
     Args:
         month: Month number (1-12)
         year: Year (e.g., 2025, 2026)
+        verbose: Print the comparison report (False returns the results only)
     
     Returns:
         Comparison results dictionary
     """
     service = get_norms_service()
     service.load_norms(month, year)
+    if not verbose:
+        return service.compare_with_hardcoded()
     return service.print_comparison_report()
 
 
@@ -503,12 +763,12 @@ def load_norms_for_calculation(month: int, year: int, use_hardcoded: bool = True
         print(f"Period: {month}/{year}")
         
         # Load all defaults into NORMS
-        for key, value in _DEFAULTS.items():
-            NORMS.set(key, value)
+        NORMS.update(_DEFAULTS)
         
         NORMS._loaded = True
         NORMS._month = month
         NORMS._year = year
+        NORMS._hardcoded = True
         
         print(f"Norms loaded: {len(_DEFAULTS)} (hardcoded defaults)")
         print(f"{'='*70}\n")
@@ -518,139 +778,26 @@ def load_norms_for_calculation(month: int, year: int, use_hardcoded: bool = True
     service = get_norms_service()
     service.load_norms(month, year)
     
-    # Map database norms to standardized keys
-    # Format: NORMS.PLANT_UTILITY_MATERIAL or simplified keys
-    
-    NORM_MAPPING = {
-        # Power Plants - Natural Gas (MMBTU per KWH)
-        ('NMD - Power Plant 2', 'POWERGEN', 'NATURAL GAS'): 'GT2_NATURAL_GAS',
-        ('NMD - Power Plant 3', 'POWERGEN', 'NATURAL GAS'): 'GT3_NATURAL_GAS',
-        
-        # Power Plants - Auxiliary Power (KWH per KWH)
-        ('NMD - Power Plant 1', 'POWERGEN', 'Power_Dis'): 'GT1_AUX_POWER',
-        ('NMD - Power Plant 2', 'POWERGEN', 'Power_Dis'): 'GT2_AUX_POWER',
-        ('NMD - Power Plant 3', 'POWERGEN', 'Power_Dis'): 'GT3_AUX_POWER',
-        ('NMD - STG Power Plant', 'POWERGEN', 'Power_Dis'): 'STG_AUX_POWER',
-        
-        # STG Norms
-        ('NMD - STG Power Plant', 'POWERGEN', 'SHP Steam_Dis'): 'STG_SHP_PER_KWH',
-        ('NMD - STG Power Plant', 'POWERGEN', 'Ret steam condensate'): 'STG_CONDENSATE',
-        
-        # BFW Norms (per M3)
-        ('NMD - Utility Plant', 'Boiler Feed Water', 'D M Water'): 'BFW_DM_WATER',
-        ('NMD - Utility Plant', 'Boiler Feed Water', 'LP Steam_Dis'): 'BFW_LP_STEAM',
-        ('NMD - Utility Plant', 'Boiler Feed Water', 'Power_Dis'): 'BFW_POWER',
-        ('NMD - Utility Plant', 'Boiler Feed Water', 'CHEM CYCLO HEXY'): 'BFW_CYCLOHEXY',
-        ('NMD - Utility Plant', 'Boiler Feed Water', 'CHEM MORPHOLENE'): 'BFW_MORPHOLENE',
-        ('NMD - Utility Plant', 'Boiler Feed Water', 'KEM WATREAT B 70M'): 'BFW_WATREAT',
-        
-        # Compressed Air Norms (per NM3)
-        ('NMD - Utility Plant', 'COMPRESSED AIR', 'Power_Dis'): 'AIR_POWER',
-        
-        # Cooling Water 1 Norms (per KM3)
-        ('NMD - Utility Plant', 'Cooling Water 1', 'Power_Dis'): 'CW1_POWER',
-        ('NMD - Utility Plant', 'Cooling Water 1', 'SULPHURIC ACID'): 'CW1_SULPHURIC_ACID',
-        
-        # Cooling Water 2 Norms (per KM3)
-        ('NMD - Utility Plant', 'Cooling Water 2', 'Power_Dis'): 'CW2_POWER',
-        ('NMD - Utility Plant', 'Cooling Water 2', 'Water'): 'CW2_WATER',
-        ('NMD - Utility Plant', 'Cooling Water 2', 'SULPHURIC ACID'): 'CW2_SULPHURIC_ACID',
-        
-        # DM Water Norms (per M3)
-        ('NMD - Utility Plant', 'D M Water', 'Power_Dis'): 'DM_POWER',
-        ('NMD - Utility Plant', 'D M Water', 'COMPRESSED AIR'): 'DM_AIR',
-        ('NMD - Utility Plant', 'D M Water', 'Ret steam condensate'): 'DM_CONDENSATE',
-        ('NMD - Utility Plant', 'D M Water', 'Water'): 'DM_WATER',
-        ('NMD - Utility Plant', 'D M Water', 'CAUSTIC SODA LYE – GRADE 1'): 'DM_CAUSTIC',
-        ('NMD - Utility Plant', 'D M Water', 'CHEM ALUM.SULFATE, AL2(SO4)3,18H2O'): 'DM_ALUM_SULFATE',
-        ('NMD - Utility Plant', 'D M Water', 'CHEM  SODIUM SULPHITE;PN:MIS 19OX'): 'DM_SODIUM_SULPHITE',
-        ('NMD - Utility Plant', 'D M Water', 'POLYELECTROLYTE'): 'DM_POLYELECTROLYTE',
-        ('NMD - Utility Plant', 'D M Water', 'SODIUM CHLORIDE IS 797 GRADE1'): 'DM_SODIUM_CHLORIDE',
-        ('NMD - Utility Plant', 'D M Water', 'HYDRO CHLORIC ACID (30%) -VIRGIN'): 'DM_HCL',
-        
-        # Effluent Norms (per M3)
-        ('NMD - Utility Plant', 'Effluent Treated', 'Power_Dis'): 'EFFLUENT_POWER',
-        ('NMD - Utility Plant', 'Effluent Treated', 'Water'): 'EFFLUENT_WATER',
-        
-        # HP Steam PRDS Norms (per MT)
-        ('NMD - Utility Plant', 'HP Steam PRDS', 'Boiler Feed Water'): 'HP_PRDS_BFW',
-        ('NMD - Utility Plant', 'HP Steam PRDS', 'SHP Steam_Dis'): 'HP_PRDS_SHP',
-        
-        # HRSG2 Norms (per MT SHP)
-        ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'Boiler Feed Water'): 'HRSG2_BFW',
-        ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'LP Steam_Dis'): 'HRSG2_LP_CREDIT',
-        ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'NATURAL GAS'): 'HRSG2_NATURAL_GAS',
-        ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'CHEM TRISODIUM PHOSPHATE'): 'HRSG2_TRISODIUM',
-        ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'FURNACE OIL ( MEDIUM VISCOSITY GRADE )'): 'HRSG2_FURNACE_OIL',
-        ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'Water'): 'HRSG2_WATER',
-        
-        # HRSG3 Norms (per MT SHP)
-        ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'Boiler Feed Water'): 'HRSG3_BFW',
-        ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'LP Steam_Dis'): 'HRSG3_LP_CREDIT',
-        ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'NATURAL GAS'): 'HRSG3_NATURAL_GAS',
-        ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'CHEM TRISODIUM PHOSPHATE'): 'HRSG3_TRISODIUM',
-        ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'FURNACE OIL ( MEDIUM VISCOSITY GRADE )'): 'HRSG3_FURNACE_OIL',
-        ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'Water'): 'HRSG3_WATER',
-        
-        # LP Steam PRDS Norms (per MT)
-        ('NMD - Utility Plant', 'LP Steam PRDS', 'Boiler Feed Water'): 'LP_PRDS_BFW',
-        ('NMD - Utility Plant', 'LP Steam PRDS', 'MP Steam_Dis'): 'LP_PRDS_MP',
-        
-        # MP Steam PRDS Norms (per MT)
-        ('NMD - Utility Plant', 'MP Steam PRDS SHP', 'Boiler Feed Water'): 'MP_PRDS_BFW',
-        ('NMD - Utility Plant', 'MP Steam PRDS SHP', 'SHP Steam_Dis'): 'MP_PRDS_SHP',
-        
-        # Oxygen Norms (per MT)
-        ('NMD - Utility Plant', 'Oxygen', 'Power_Dis'): 'OXYGEN_POWER',
-        ('NMD - Utility Plant', 'Oxygen', 'Cooling Water 2'): 'OXYGEN_CW2',
-        ('NMD - Utility Plant', 'Oxygen', 'Nitrogen Gas'): 'OXYGEN_NITROGEN',
-        
-        # STG Steam Extraction Norms
-        ('NMD - Utility Plant', 'STG1_LP STEAM', 'SHP Steam_Dis'): 'STG_LP_SHP',
-        ('NMD - Utility Plant', 'STG1_MP STEAM', 'SHP Steam_Dis'): 'STG_MP_SHP',
-    }
-    
-    # Load norms from database into NORMS object
+    # Collect norms and fixed quantities from database in a single pass over
+    # the loaded DB rows, then load them into NORMS in one update.
+    # Every mapped norm key starts as None (missing) and is overwritten on a hit.
+    payload = dict.fromkeys(_NORM_MAPPING_KEYS)
     loaded_count = 0
-    for (plant, utility, material), key in NORM_MAPPING.items():
-        norm_data = service.get_norm(plant, utility, material)
-        if norm_data and norm_data.get('norm_value') is not None:
-            NORMS.set(key, norm_data['norm_value'])
+    for key_tuple, rec in service._flat.items():
+        norm_key, qty_key = _COMBINED_MAPPING.get(key_tuple, _NO_MAPPING)
+        if norm_key is not None and rec.norm_value is not None:
+            payload[norm_key] = rec.norm_value
             loaded_count += 1
-        else:
-            # Set to None to indicate missing
-            NORMS.set(key, None)
-    
-    # Also load fixed quantities (for items with NULL norm but fixed quantity)
-    QUANTITY_MAPPING = {
-        # Power Plants - Fixed quantities per month
-        ('NMD - Power Plant 2', 'POWERGEN', 'Cooling Water 2'): 'GT2_CW2_QTY',
-        ('NMD - Power Plant 2', 'POWERGEN', 'COMPRESSED AIR'): 'GT2_AIR_QTY',
-        ('NMD - Power Plant 3', 'POWERGEN', 'Cooling Water 2'): 'GT3_CW2_QTY',
-        ('NMD - Power Plant 3', 'POWERGEN', 'COMPRESSED AIR'): 'GT3_AIR_QTY',
-        ('NMD - STG Power Plant', 'POWERGEN', 'Cooling Water 2'): 'STG_CW2_QTY',
-        ('NMD - STG Power Plant', 'POWERGEN', 'COMPRESSED AIR'): 'STG_AIR_QTY',
-        
-        # HRSG Fixed quantities
-        ('NMD - Utility Plant', 'HRSG2_SHP STEAM', 'COMPRESSED AIR'): 'HRSG2_AIR_QTY',
-        ('NMD - Utility Plant', 'HRSG3_SHP STEAM', 'COMPRESSED AIR'): 'HRSG3_AIR_QTY',
-        
-        # Utility Fixed quantities
-        ('NMD - Utility Plant', 'Boiler Feed Water', 'Cooling Water 2'): 'BFW_CW2_QTY',
-        ('NMD - Utility Plant', 'COMPRESSED AIR', 'Cooling Water 2'): 'AIR_CW2_QTY',
-        ('NMD - Utility Plant', 'Cooling Water 1', 'COMPRESSED AIR'): 'CW1_AIR_QTY',
-        ('NMD - Utility Plant', 'Cooling Water 2', 'COMPRESSED AIR'): 'CW2_AIR_QTY',
-    }
-    
-    for (plant, utility, material), key in QUANTITY_MAPPING.items():
-        norm_data = service.get_norm(plant, utility, material)
-        if norm_data and norm_data.get('quantity') is not None:
-            NORMS.set(key, norm_data['quantity'])
+        if qty_key is not None and rec.quantity is not None:
+            payload[qty_key] = rec.quantity
+    
+    NORMS.update(payload)
     
     # Mark as loaded
     NORMS._loaded = True
     NORMS._month = month
     NORMS._year = year
+    NORMS._hardcoded = False
     
     print(f"\n{'='*70}")
     print(f"NORMS LOADED FROM DATABASE")
@@ -679,17 +826,20 @@ def print_loaded_norms():
         return
     
     month, year = NORMS.get_period()
-    print(f"\n{'='*70}")
-    print(f"LOADED NORMS FOR {month}/{year}")
-    print(f"{'='*70}")
+    buf = io.StringIO()
+    buf.write(f"\n{'='*70}\n")
+    buf.write(f"LOADED NORMS FOR {month}/{year}\n")
+    buf.write(f"{'='*70}\n")
     
     for key, value in sorted(NORMS._norms.items()):
         if value is not None:
-            print(f"  {key:<30}: {value:>15.6f}")
+            buf.write(f"  {key:<30}: {value:>15.6f}\n")
         else:
-            print(f"  {key:<30}: {'NULL':>15}")
+            buf.write(f"  {key:<30}: {_NULL_SUFFIX}\n")
     
-    print(f"{'='*70}\n")
+    buf.write(f"{'='*70}\n\n")
+    
+    sys.stdout.write(buf.getvalue())
 
 
 # For testing
@@ -9,6 +9,7 @@ Columns updated:
 """
 
 from database.connection import get_connection
+from database.norms_queries import clear_norms_cache
 from decimal import Decimal
 
 
@@ -362,6 +363,10 @@ def save_model_quantities(month: int, year: int, utilities: dict, power_dispatch
             })
             print(f"  ? {plant} | {utility} | {material} - Header not found")
     
+    # Saved quantities must be re-read from the DB, not served from the cache
+    if results["success_count"]:
+        clear_norms_cache()
+    
     print("-" * 80)
     print(f"Total: {results['success_count']} saved, {results['failed_count']} failed")
     print("=" * 80)
@@ -10,7 +10,15 @@ HRSG-GT Linkage:
 - HRSG3 availability = GT3 availability
 """
 
+import io
+import math
+import re
+import sys
+import threading
+from contextlib import closing, redirect_stdout
 from itertools import groupby
+from operator import itemgetter
+from typing import NamedTuple
 
 # ============================================================
 # NORM FACTORS (Hardcoded - will move to DB later)
@@ -55,6 +63,44 @@ NORM_STG_SHP_PER_KWH = 0.0036     # 0.0036 MT of SHP steam per 1 KWh generated
 # 3.56 MT of SHP steam = 1 MWh of power from STG
 STEAM_TO_POWER_MT_PER_MWH = 3.56  # MT of SHP steam per MWh of power
 
+# Derived per-header-total factors (products of the norms above, folded once)
+_K_SHP_FROM_LP_STG = NORM_LP_FROM_STG * NORM_SHP_PER_LP_STG      # SHP per MT LP total
+_K_MP_FROM_LP_PRDS = NORM_LP_FROM_PRDS * NORM_MP_PER_LP_PRDS     # MP per MT LP total
+_K_BFW_FROM_LP_PRDS = NORM_LP_FROM_PRDS * NORM_BFW_PER_LP_PRDS   # BFW per MT LP total
+_K_SHP_FROM_MP_STG = NORM_MP_FROM_STG * NORM_SHP_PER_MP_STG      # SHP per MT MP total
+_K_SHP_FROM_MP_PRDS = NORM_MP_FROM_PRDS * NORM_SHP_PER_MP_PRDS   # SHP per MT MP total
+_K_BFW_FROM_MP_PRDS = NORM_MP_FROM_PRDS * NORM_BFW_PER_MP_PRDS   # BFW per MT MP total
+_K_SHP_FROM_HP_PRDS = NORM_HP_FROM_PRDS * NORM_SHP_PER_HP_PRDS   # SHP per MT HP total
+_K_BFW_FROM_HP_PRDS = NORM_HP_FROM_PRDS * NORM_BFW_PER_HP_PRDS   # BFW per MT HP total
+
+# Zero-demand results, returned as copies when a header is idle
+_ZERO_LP_BALANCE = {
+    **dict.fromkeys((
+        "lp_process", "lp_fixed", "lp_ufu", "lp_total", "lp_from_prds",
+        "lp_from_stg", "shp_for_stg_lp", "mp_for_prds_lp", "bfw_for_prds_lp",
+    ), 0.0),
+    "lp_stg_ratio": NORM_LP_FROM_STG,
+    "lp_prds_ratio": NORM_LP_FROM_PRDS,
+}
+_ZERO_MP_BALANCE = {
+    **dict.fromkeys((
+        "mp_process", "mp_fixed", "mp_for_lp", "mp_total", "mp_from_prds",
+        "mp_from_stg", "shp_for_stg_mp", "shp_for_prds_mp", "bfw_for_prds_mp",
+        "shp_from_mp_chain",
+    ), 0.0),
+    "mp_stg_ratio": NORM_MP_FROM_STG,
+    "mp_prds_ratio": NORM_MP_FROM_PRDS,
+}
+_ZERO_HP_BALANCE = dict.fromkeys((
+    "hp_process", "hp_fixed", "hp_total", "hp_from_prds",
+    "shp_for_hp_prds", "bfw_for_hp_prds",
+), 0.0)
+_ZERO_SHP_BALANCE = dict.fromkeys((
+    "shp_process", "shp_fixed", "shp_for_stg_lp", "shp_from_mp_chain",
+    "shp_for_hp_prds", "shp_from_headers", "shp_total_without_power",
+    "stg_shp_power", "shp_total_demand", "shp_from_hrsg2", "shp_from_hrsg3",
+), 0.0)
+
 
 # ============================================================
 # LP STEAM BALANCE (Legacy - Fixed Ratio)
@@ -73,8 +119,11 @@ def calculate_lp_balance(
         bfw_ufu: BFW for UFU (M3) - generates additional LP demand
     
     Returns:
-        dict with LP balance details and downstream requirements
+        dict with LP balance details and downstream requirements (unrounded)
     """
+    if not (lp_process or lp_fixed or bfw_ufu):
+        return _ZERO_LP_BALANCE.copy()
+    
     # Step 1: Calculate LP from UFU (BFW)
     lp_ufu = bfw_ufu * NORM_LP_PER_BFW
     
@@ -87,24 +136,24 @@ def calculate_lp_balance(
     
     # Step 4: Calculate what each supplier needs
     # STG LP needs SHP
-    shp_for_stg_lp = lp_from_stg * NORM_SHP_PER_LP_STG
+    shp_for_stg_lp = lp_total * _K_SHP_FROM_LP_STG
     
     # PRDS LP needs MP and BFW
-    mp_for_prds_lp = lp_from_prds * NORM_MP_PER_LP_PRDS
-    bfw_for_prds_lp = lp_from_prds * NORM_BFW_PER_LP_PRDS
+    mp_for_prds_lp = lp_total * _K_MP_FROM_LP_PRDS
+    bfw_for_prds_lp = lp_total * _K_BFW_FROM_LP_PRDS
     
     return {
-        "lp_process": round(lp_process, 2),
-        "lp_fixed": round(lp_fixed, 2),
-        "lp_ufu": round(lp_ufu, 2),
-        "lp_total": round(lp_total, 2),
-        "lp_from_prds": round(lp_from_prds, 2),
-        "lp_from_stg": round(lp_from_stg, 2),
-        "shp_for_stg_lp": round(shp_for_stg_lp, 2),
-        "mp_for_prds_lp": round(mp_for_prds_lp, 2),
-        "bfw_for_prds_lp": round(bfw_for_prds_lp, 2),
-        "lp_stg_ratio": round(NORM_LP_FROM_STG, 4),
-        "lp_prds_ratio": round(NORM_LP_FROM_PRDS, 4),
+        "lp_process": lp_process,
+        "lp_fixed": lp_fixed,
+        "lp_ufu": lp_ufu,
+        "lp_total": lp_total,
+        "lp_from_prds": lp_from_prds,
+        "lp_from_stg": lp_from_stg,
+        "shp_for_stg_lp": shp_for_stg_lp,
+        "mp_for_prds_lp": mp_for_prds_lp,
+        "bfw_for_prds_lp": bfw_for_prds_lp,
+        "lp_stg_ratio": NORM_LP_FROM_STG,
+        "lp_prds_ratio": NORM_LP_FROM_PRDS,
     }
 
 
@@ -132,7 +181,7 @@ def calculate_lp_balance_stg_based(
         stg_operating_hours: STG operating hours for the month
     
     Returns:
-        dict with LP balance details and downstream requirements
+        dict with LP balance details and downstream requirements (unrounded)
     """
     # Step 1: Calculate LP from UFU (BFW)
     lp_ufu = bfw_ufu * NORM_LP_PER_BFW
@@ -166,21 +215,21 @@ def calculate_lp_balance_stg_based(
     bfw_for_prds_lp = lp_from_prds * NORM_BFW_PER_LP_PRDS
     
     return {
-        "lp_process": round(lp_process, 2),
-        "lp_fixed": round(lp_fixed, 2),
-        "lp_ufu": round(lp_ufu, 2),
-        "lp_total": round(lp_total, 2),
-        "lp_from_prds": round(lp_from_prds, 2),
-        "lp_from_stg": round(lp_from_stg, 2),
-        "lp_from_stg_available": round(lp_from_stg_available, 2),
-        "lp_stg_excess": round(lp_stg_excess, 2),
-        "shp_for_stg_lp": round(shp_for_stg_lp, 2),
-        "mp_for_prds_lp": round(mp_for_prds_lp, 2),
-        "bfw_for_prds_lp": round(bfw_for_prds_lp, 2),
+        "lp_process": lp_process,
+        "lp_fixed": lp_fixed,
+        "lp_ufu": lp_ufu,
+        "lp_total": lp_total,
+        "lp_from_prds": lp_from_prds,
+        "lp_from_stg": lp_from_stg,
+        "lp_from_stg_available": lp_from_stg_available,
+        "lp_stg_excess": lp_stg_excess,
+        "shp_for_stg_lp": shp_for_stg_lp,
+        "mp_for_prds_lp": mp_for_prds_lp,
+        "bfw_for_prds_lp": bfw_for_prds_lp,
         "lp_stg_ratio": round(lp_stg_ratio, 4),
         "lp_prds_ratio": round(lp_prds_ratio, 4),
-        "stg_lp_extraction_tph": round(stg_lp_extraction_tph, 2),
-        "stg_operating_hours": round(stg_operating_hours, 2),
+        "stg_lp_extraction_tph": stg_lp_extraction_tph,
+        "stg_operating_hours": stg_operating_hours,
     }
 
 
@@ -201,8 +250,11 @@ def calculate_mp_balance(
         mp_for_lp: MP required for LP PRDS (from LP balance)
     
     Returns:
-        dict with MP balance details and downstream requirements
+        dict with MP balance details and downstream requirements (unrounded)
     """
+    if not (mp_process or mp_fixed or mp_for_lp):
+        return _ZERO_MP_BALANCE.copy()
+    
     # Step 1: Total MP Demand
     mp_total = mp_process + mp_fixed + mp_for_lp
     
@@ -212,28 +264,28 @@ def calculate_mp_balance(
     
     # Step 3: Calculate what each supplier needs
     # STG MP needs SHP
-    shp_for_stg_mp = mp_from_stg * NORM_SHP_PER_MP_STG
+    shp_for_stg_mp = mp_total * _K_SHP_FROM_MP_STG
     
     # PRDS MP needs SHP and BFW
-    shp_for_prds_mp = mp_from_prds * NORM_SHP_PER_MP_PRDS
-    bfw_for_prds_mp = mp_from_prds * NORM_BFW_PER_MP_PRDS
+    shp_for_prds_mp = mp_total * _K_SHP_FROM_MP_PRDS
+    bfw_for_prds_mp = mp_total * _K_BFW_FROM_MP_PRDS
     
     # Total SHP from MP chain
     shp_from_mp_chain = shp_for_stg_mp + shp_for_prds_mp
     
     return {
-        "mp_process": round(mp_process, 2),
-        "mp_fixed": round(mp_fixed, 2),
-        "mp_for_lp": round(mp_for_lp, 2),
-        "mp_total": round(mp_total, 2),
-        "mp_from_prds": round(mp_from_prds, 2),
-        "mp_from_stg": round(mp_from_stg, 2),
-        "shp_for_stg_mp": round(shp_for_stg_mp, 2),
-        "shp_for_prds_mp": round(shp_for_prds_mp, 2),
-        "bfw_for_prds_mp": round(bfw_for_prds_mp, 2),
-        "shp_from_mp_chain": round(shp_from_mp_chain, 2),
-        "mp_stg_ratio": round(NORM_MP_FROM_STG, 4),
-        "mp_prds_ratio": round(NORM_MP_FROM_PRDS, 4),
+        "mp_process": mp_process,
+        "mp_fixed": mp_fixed,
+        "mp_for_lp": mp_for_lp,
+        "mp_total": mp_total,
+        "mp_from_prds": mp_from_prds,
+        "mp_from_stg": mp_from_stg,
+        "shp_for_stg_mp": shp_for_stg_mp,
+        "shp_for_prds_mp": shp_for_prds_mp,
+        "bfw_for_prds_mp": bfw_for_prds_mp,
+        "shp_from_mp_chain": shp_from_mp_chain,
+        "mp_stg_ratio": NORM_MP_FROM_STG,
+        "mp_prds_ratio": NORM_MP_FROM_PRDS,
     }
 
 
@@ -261,7 +313,7 @@ def calculate_mp_balance_stg_based(
         stg_operating_hours: STG operating hours for the month
     
     Returns:
-        dict with MP balance details and downstream requirements
+        dict with MP balance details and downstream requirements (unrounded)
     """
     # Step 1: Total MP Demand
     mp_total = mp_process + mp_fixed + mp_for_lp
@@ -295,22 +347,22 @@ def calculate_mp_balance_stg_based(
     shp_from_mp_chain = shp_for_stg_mp + shp_for_prds_mp
     
     return {
-        "mp_process": round(mp_process, 2),
-        "mp_fixed": round(mp_fixed, 2),
-        "mp_for_lp": round(mp_for_lp, 2),
-        "mp_total": round(mp_total, 2),
-        "mp_from_prds": round(mp_from_prds, 2),
-        "mp_from_stg": round(mp_from_stg, 2),
-        "mp_from_stg_available": round(mp_from_stg_available, 2),
-        "mp_stg_excess": round(mp_stg_excess, 2),
-        "shp_for_stg_mp": round(shp_for_stg_mp, 2),
-        "shp_for_prds_mp": round(shp_for_prds_mp, 2),
-        "bfw_for_prds_mp": round(bfw_for_prds_mp, 2),
-        "shp_from_mp_chain": round(shp_from_mp_chain, 2),
+        "mp_process": mp_process,
+        "mp_fixed": mp_fixed,
+        "mp_for_lp": mp_for_lp,
+        "mp_total": mp_total,
+        "mp_from_prds": mp_from_prds,
+        "mp_from_stg": mp_from_stg,
+        "mp_from_stg_available": mp_from_stg_available,
+        "mp_stg_excess": mp_stg_excess,
+        "shp_for_stg_mp": shp_for_stg_mp,
+        "shp_for_prds_mp": shp_for_prds_mp,
+        "bfw_for_prds_mp": bfw_for_prds_mp,
+        "shp_from_mp_chain": shp_from_mp_chain,
         "mp_stg_ratio": round(mp_stg_ratio, 4),
         "mp_prds_ratio": round(mp_prds_ratio, 4),
-        "stg_mp_extraction_tph": round(stg_mp_extraction_tph, 2),
-        "stg_operating_hours": round(stg_operating_hours, 2),
+        "stg_mp_extraction_tph": stg_mp_extraction_tph,
+        "stg_operating_hours": stg_operating_hours,
     }
 
 
@@ -329,8 +381,11 @@ def calculate_hp_balance(
         hp_fixed: Fixed HP requirement (MT)
     
     Returns:
-        dict with HP balance details and downstream requirements
+        dict with HP balance details and downstream requirements (unrounded)
     """
+    if not (hp_process or hp_fixed):
+        return _ZERO_HP_BALANCE.copy()
+    
     # Step 1: Total HP Demand
     hp_total = hp_process + hp_fixed
     
@@ -338,16 +393,16 @@ def calculate_hp_balance(
     hp_from_prds = hp_total * NORM_HP_FROM_PRDS
     
     # Step 3: Calculate what PRDS needs
-    shp_for_hp_prds = hp_from_prds * NORM_SHP_PER_HP_PRDS
-    bfw_for_hp_prds = hp_from_prds * NORM_BFW_PER_HP_PRDS
+    shp_for_hp_prds = hp_total * _K_SHP_FROM_HP_PRDS
+    bfw_for_hp_prds = hp_total * _K_BFW_FROM_HP_PRDS
     
     return {
-        "hp_process": round(hp_process, 2),
-        "hp_fixed": round(hp_fixed, 2),
-        "hp_total": round(hp_total, 2),
-        "hp_from_prds": round(hp_from_prds, 2),
-        "shp_for_hp_prds": round(shp_for_hp_prds, 2),
-        "bfw_for_hp_prds": round(bfw_for_hp_prds, 2),
+        "hp_process": hp_process,
+        "hp_fixed": hp_fixed,
+        "hp_total": hp_total,
+        "hp_from_prds": hp_from_prds,
+        "shp_for_hp_prds": shp_for_hp_prds,
+        "bfw_for_hp_prds": bfw_for_hp_prds,
     }
 
 
@@ -374,8 +429,12 @@ def calculate_shp_balance(
         stg_shp_power: SHP used as inlet steam for STG power generation
     
     Returns:
-        dict with SHP balance details
+        dict with SHP balance details (unrounded)
     """
+    if not (shp_process or shp_fixed or shp_for_stg_lp or shp_from_mp_chain
+            or shp_for_hp_prds or stg_shp_power):
+        return _ZERO_SHP_BALANCE.copy()
+    
     # SHP from headers (LP + MP + HP)
     shp_from_headers = shp_for_stg_lp + shp_from_mp_chain + shp_for_hp_prds
     
@@ -390,17 +449,17 @@ def calculate_shp_balance(
     shp_from_hrsg3 = shp_total_demand * NORM_SHP_FROM_HRSG3
     
     return {
-        "shp_process": round(shp_process, 2),
-        "shp_fixed": round(shp_fixed, 2),
-        "shp_for_stg_lp": round(shp_for_stg_lp, 2),
-        "shp_from_mp_chain": round(shp_from_mp_chain, 2),
-        "shp_for_hp_prds": round(shp_for_hp_prds, 2),
-        "shp_from_headers": round(shp_from_headers, 2),
-        "shp_total_without_power": round(shp_total_without_power, 2),
-        "stg_shp_power": round(stg_shp_power, 2),
-        "shp_total_demand": round(shp_total_demand, 2),
-        "shp_from_hrsg2": round(shp_from_hrsg2, 2),
-        "shp_from_hrsg3": round(shp_from_hrsg3, 2),
+        "shp_process": shp_process,
+        "shp_fixed": shp_fixed,
+        "shp_for_stg_lp": shp_for_stg_lp,
+        "shp_from_mp_chain": shp_from_mp_chain,
+        "shp_for_hp_prds": shp_for_hp_prds,
+        "shp_from_headers": shp_from_headers,
+        "shp_total_without_power": shp_total_without_power,
+        "stg_shp_power": stg_shp_power,
+        "shp_total_demand": shp_total_demand,
+        "shp_from_hrsg2": shp_from_hrsg2,
+        "shp_from_hrsg3": shp_from_hrsg3,
     }
 
 
@@ -414,19 +473,150 @@ def calculate_total_bfw(
     bfw_ufu: float = 0.0
 ) -> dict:
     """
-    Calculate total BFW requirement from all sources.
+    Calculate total BFW requirement from all sources (unrounded).
     """
     total_bfw = bfw_for_prds_lp + bfw_for_prds_mp + bfw_for_hp_prds + bfw_ufu
     
     return {
-        "bfw_for_prds_lp": round(bfw_for_prds_lp, 2),
-        "bfw_for_prds_mp": round(bfw_for_prds_mp, 2),
-        "bfw_for_hp_prds": round(bfw_for_hp_prds, 2),
-        "bfw_ufu": round(bfw_ufu, 2),
-        "total_bfw": round(total_bfw, 2),
+        "bfw_for_prds_lp": bfw_for_prds_lp,
+        "bfw_for_prds_mp": bfw_for_prds_mp,
+        "bfw_for_hp_prds": bfw_for_hp_prds,
+        "bfw_ufu": bfw_ufu,
+        "total_bfw": total_bfw,
     }
 
 
+class SteamBalanceCore(NamedTuple):
+    """Unrounded derived values of the fixed-ratio steam balance chain."""
+    lp_ufu: float
+    lp_total: float
+    lp_from_prds: float
+    lp_from_stg: float
+    shp_for_stg_lp: float
+    mp_for_prds_lp: float
+    bfw_for_prds_lp: float
+    mp_total: float
+    mp_from_prds: float
+    mp_from_stg: float
+    shp_for_stg_mp: float
+    shp_for_prds_mp: float
+    bfw_for_prds_mp: float
+    shp_from_mp_chain: float
+    hp_total: float
+    hp_from_prds: float
+    shp_for_hp_prds: float
+    bfw_for_hp_prds: float
+    shp_from_headers: float
+    shp_total_without_power: float
+    shp_total_demand: float
+    shp_from_hrsg2: float
+    shp_from_hrsg3: float
+    total_bfw: float
+
+
+def _round_tree(obj: dict, ndigits: int = 2) -> dict:
+    """Round every float leaf of a nested result dict in place."""
+    for key, value in obj.items():
+        if isinstance(value, float):
+            obj[key] = round(value, ndigits)
+        elif isinstance(value, dict):
+            _round_tree(value, ndigits)
+    return obj
+
+
+def round_balance(balance: dict) -> dict:
+    """
+    Presentation copy of a single balance dict.
+    
+    Quantities are rounded to 2 decimals; *_ratio entries keep the 4
+    decimals the balance functions already give them. The balance
+    functions themselves return unrounded values for chaining.
+    
+    Args:
+        balance: Result of one calculate_*_balance* function (or None)
+        
+    Returns:
+        New dict with rounded values, or None if balance is None
+    """
+    if balance is None:
+        return None
+    return {
+        key: round(value, 2) if isinstance(value, float) and not key.endswith("_ratio") else value
+        for key, value in balance.items()
+    }
+
+
+def _steam_balance_core(
+    lp_process: float,
+    lp_fixed: float,
+    mp_process: float,
+    mp_fixed: float,
+    hp_process: float,
+    hp_fixed: float,
+    shp_process: float,
+    shp_fixed: float,
+    bfw_ufu: float = 0.0,
+    stg_shp_power: float = 0.0
+) -> SteamBalanceCore:
+    """
+    Numeric core of the LP → MP → HP → SHP chain (fixed ratios).
+
+    Pure float arithmetic with no dicts and no rounding, so it stays cheap
+    inside scenario sweeps. calculate_steam_balance() packs the output.
+
+    The chain is a fixed linear map of the ten inputs, but it is kept as
+    straight-line code: without NumPy, a 24 x 10 coefficient matvec would
+    cost ~240 multiplies against the ~40 done here.
+
+    Returns:
+        SteamBalanceCore with every derived value at full precision
+    """
+    # LP
+    lp_ufu = bfw_ufu * NORM_LP_PER_BFW
+    lp_total = lp_process + lp_fixed + lp_ufu
+    lp_from_prds = lp_total * NORM_LP_FROM_PRDS
+    lp_from_stg = lp_total * NORM_LP_FROM_STG
+    shp_for_stg_lp = lp_total * _K_SHP_FROM_LP_STG
+    mp_for_prds_lp = lp_total * _K_MP_FROM_LP_PRDS
+    bfw_for_prds_lp = lp_total * _K_BFW_FROM_LP_PRDS
+
+    # MP
+    mp_total = mp_process + mp_fixed + mp_for_prds_lp
+    mp_from_prds = mp_total * NORM_MP_FROM_PRDS
+    mp_from_stg = mp_total * NORM_MP_FROM_STG
+    shp_for_stg_mp = mp_total * _K_SHP_FROM_MP_STG
+    shp_for_prds_mp = mp_total * _K_SHP_FROM_MP_PRDS
+    bfw_for_prds_mp = mp_total * _K_BFW_FROM_MP_PRDS
+    shp_from_mp_chain = shp_for_stg_mp + shp_for_prds_mp
+
+    # HP
+    hp_total = hp_process + hp_fixed
+    hp_from_prds = hp_total * NORM_HP_FROM_PRDS
+    shp_for_hp_prds = hp_total * _K_SHP_FROM_HP_PRDS
+    bfw_for_hp_prds = hp_total * _K_BFW_FROM_HP_PRDS
+
+    # SHP
+    shp_from_headers = shp_for_stg_lp + shp_from_mp_chain + shp_for_hp_prds
+    shp_total_without_power = shp_process + shp_fixed + shp_from_headers
+    shp_total_demand = shp_total_without_power + stg_shp_power
+    shp_from_hrsg2 = shp_total_demand * NORM_SHP_FROM_HRSG2
+    shp_from_hrsg3 = shp_total_demand * NORM_SHP_FROM_HRSG3
+
+    # BFW
+    total_bfw = bfw_for_prds_lp + bfw_for_prds_mp + bfw_for_hp_prds + bfw_ufu
+
+    return SteamBalanceCore(
+        lp_ufu, lp_total, lp_from_prds, lp_from_stg,
+        shp_for_stg_lp, mp_for_prds_lp, bfw_for_prds_lp,
+        mp_total, mp_from_prds, mp_from_stg,
+        shp_for_stg_mp, shp_for_prds_mp, bfw_for_prds_mp, shp_from_mp_chain,
+        hp_total, hp_from_prds, shp_for_hp_prds, bfw_for_hp_prds,
+        shp_from_headers, shp_total_without_power, shp_total_demand,
+        shp_from_hrsg2, shp_from_hrsg3,
+        total_bfw,
+    )
+
+
 # ============================================================
 # MAIN: COMPLETE STEAM BALANCE CALCULATION
 # ============================================================
@@ -453,50 +643,85 @@ def calculate_steam_balance(
         bfw_ufu: BFW for UFU (M3)
         stg_shp_power: SHP for STG power generation (MT)
     
+    The LP/MP/HP/SHP/BFW stages run fused in _steam_balance_core(), so
+    intermediates are carried at full precision and the result is rounded
+    once by _round_tree() before returning.
+    
     Returns:
         dict with complete steam balance for all headers
     """
-    # Step 1: LP Balance
-    lp = calculate_lp_balance(lp_process, lp_fixed, bfw_ufu)
-    
-    # Step 2: MP Balance (uses mp_for_lp from LP balance)
-    mp = calculate_mp_balance(mp_process, mp_fixed, lp["mp_for_prds_lp"])
-    
-    # Step 3: HP Balance
-    hp = calculate_hp_balance(hp_process, hp_fixed)
-    
-    # Step 4: SHP Balance (uses outputs from LP, MP, HP)
-    shp = calculate_shp_balance(
-        shp_process=shp_process,
-        shp_fixed=shp_fixed,
-        shp_for_stg_lp=lp["shp_for_stg_lp"],
-        shp_from_mp_chain=mp["shp_from_mp_chain"],
-        shp_for_hp_prds=hp["shp_for_hp_prds"],
-        stg_shp_power=stg_shp_power
+    c = _steam_balance_core(
+        lp_process, lp_fixed, mp_process, mp_fixed, hp_process, hp_fixed,
+        shp_process, shp_fixed, bfw_ufu, stg_shp_power
     )
-    
-    # Step 5: Total BFW
-    bfw = calculate_total_bfw(
-        bfw_for_prds_lp=lp["bfw_for_prds_lp"],
-        bfw_for_prds_mp=mp["bfw_for_prds_mp"],
-        bfw_for_hp_prds=hp["bfw_for_hp_prds"],
-        bfw_ufu=bfw_ufu
-    )
-    
-    return {
-        "lp_balance": lp,
-        "mp_balance": mp,
-        "hp_balance": hp,
-        "shp_balance": shp,
-        "bfw_requirement": bfw,
+
+    result = _round_tree({
+        "lp_balance": {
+            "lp_process": lp_process,
+            "lp_fixed": lp_fixed,
+            "lp_ufu": c.lp_ufu,
+            "lp_total": c.lp_total,
+            "lp_from_prds": c.lp_from_prds,
+            "lp_from_stg": c.lp_from_stg,
+            "shp_for_stg_lp": c.shp_for_stg_lp,
+            "mp_for_prds_lp": c.mp_for_prds_lp,
+            "bfw_for_prds_lp": c.bfw_for_prds_lp,
+        },
+        "mp_balance": {
+            "mp_process": mp_process,
+            "mp_fixed": mp_fixed,
+            "mp_for_lp": c.mp_for_prds_lp,
+            "mp_total": c.mp_total,
+            "mp_from_prds": c.mp_from_prds,
+            "mp_from_stg": c.mp_from_stg,
+            "shp_for_stg_mp": c.shp_for_stg_mp,
+            "shp_for_prds_mp": c.shp_for_prds_mp,
+            "bfw_for_prds_mp": c.bfw_for_prds_mp,
+            "shp_from_mp_chain": c.shp_from_mp_chain,
+        },
+        "hp_balance": {
+            "hp_process": hp_process,
+            "hp_fixed": hp_fixed,
+            "hp_total": c.hp_total,
+            "hp_from_prds": c.hp_from_prds,
+            "shp_for_hp_prds": c.shp_for_hp_prds,
+            "bfw_for_hp_prds": c.bfw_for_hp_prds,
+        },
+        "shp_balance": {
+            "shp_process": shp_process,
+            "shp_fixed": shp_fixed,
+            "shp_for_stg_lp": c.shp_for_stg_lp,
+            "shp_from_mp_chain": c.shp_from_mp_chain,
+            "shp_for_hp_prds": c.shp_for_hp_prds,
+            "shp_from_headers": c.shp_from_headers,
+            "shp_total_without_power": c.shp_total_without_power,
+            "stg_shp_power": stg_shp_power,
+            "shp_total_demand": c.shp_total_demand,
+            "shp_from_hrsg2": c.shp_from_hrsg2,
+            "shp_from_hrsg3": c.shp_from_hrsg3,
+        },
+        "bfw_requirement": {
+            "bfw_for_prds_lp": c.bfw_for_prds_lp,
+            "bfw_for_prds_mp": c.bfw_for_prds_mp,
+            "bfw_for_hp_prds": c.bfw_for_hp_prds,
+            "bfw_ufu": bfw_ufu,
+            "total_bfw": c.total_bfw,
+        },
         "summary": {
-            "total_lp_demand": lp["lp_total"],
-            "total_mp_demand": mp["mp_total"],
-            "total_hp_demand": hp["hp_total"],
-            "total_shp_demand": shp["shp_total_demand"],
-            "total_bfw_demand": bfw["total_bfw"],
+            "total_lp_demand": c.lp_total,
+            "total_mp_demand": c.mp_total,
+            "total_hp_demand": c.hp_total,
+            "total_shp_demand": c.shp_total_demand,
+            "total_bfw_demand": c.total_bfw,
         }
-    }
+    })
+    
+    # Ratios are norm constants, kept at full precision
+    result["lp_balance"]["lp_stg_ratio"] = NORM_LP_FROM_STG
+    result["lp_balance"]["lp_prds_ratio"] = NORM_LP_FROM_PRDS
+    result["mp_balance"]["mp_stg_ratio"] = NORM_MP_FROM_STG
+    result["mp_balance"]["mp_prds_ratio"] = NORM_MP_FROM_PRDS
+    return result
 
 
 # ============================================================
@@ -529,6 +754,31 @@ HRSG_ASSETS_DEFAULT = {
 
 # Global HRSG_ASSETS - will be populated from DB
 HRSG_ASSETS = HRSG_ASSETS_DEFAULT.copy()
+_HRSG_LOADED = False
+_hrsg_load_lock = threading.Lock()
+
+# HRSG assets with linked GT info (columns read by name in load_hrsg_assets_from_db)
+_HRSG_QUERY = """
+    SELECT 
+        s.AssetName,
+        s.MinCapacityMT,
+        s.MaxCapacityMT,
+        s.Efficiency,
+        s.SteamType,
+        s.LinkedPowerAssetId,
+        p.AssetName as LinkedGTName
+    FROM SteamGenerationAssets s
+    LEFT JOIN PowerGenerationAssets p ON s.LinkedPowerAssetId = p.AssetId
+    WHERE s.AssetType = 'HRSG'
+    ORDER BY s.AssetName
+"""
+
+# Linked power asset name fragment -> GT tag (e.g., "NMD-Power Plant-1" -> "GT1")
+_PLANT_TO_GT = {
+    "Plant-1": "GT1",
+    "Plant-2": "GT2",
+    "Plant-3": "GT3",
+}
 
 
 def load_hrsg_assets_from_db():
@@ -539,61 +789,49 @@ def load_hrsg_assets_from_db():
     Returns:
         dict: HRSG assets configuration
     """
-    global HRSG_ASSETS
+    global HRSG_ASSETS, _HRSG_LOADED
     
     try:
         from database.connection import get_connection
-        conn = get_connection()
-        cur = conn.cursor()
-        
-        # Fetch HRSG assets with linked GT info
-        cur.execute("""
-            SELECT 
-                s.AssetName,
-                s.MinCapacityMT,
-                s.MaxCapacityMT,
-                s.Efficiency,
-                s.SteamType,
-                s.LinkedPowerAssetId,
-                p.AssetName as LinkedGTName
-            FROM SteamGenerationAssets s
-            LEFT JOIN PowerGenerationAssets p ON s.LinkedPowerAssetId = p.AssetId
-            WHERE s.AssetType = 'HRSG'
-            ORDER BY s.AssetName
-        """)
         
-        rows = cur.fetchall()
-        conn.close()
+        # closing() guarantees the connection is released even if a row fails
+        with closing(get_connection()) as conn:
+            cur = conn.cursor()
+            
+            # Fetch HRSG assets with linked GT info
+            cur.execute(_HRSG_QUERY)
+            
+            # Build HRSG_ASSETS from DB, streaming rows straight off the cursor
+            hrsg_assets = {}
+            for row in cur:
+                hrsg_name = row.AssetName  # e.g., "HRSG1"
+                linked_gt_name = row.LinkedGTName  # e.g., "NMD-Power Plant-1"
+                
+                # Determine linked GT pattern (GT1, GT2, GT3)
+                linked_gt = None
+                if linked_gt_name:
+                    linked_gt = next(
+                        (gt for plant, gt in _PLANT_TO_GT.items() if plant in linked_gt_name),
+                        None
+                    )
+                
+                # "is not None" so a stored 0.0 is kept rather than defaulted
+                min_cap, max_cap = row.MinCapacityMT, row.MaxCapacityMT
+                efficiency, steam_type = row.Efficiency, row.SteamType
+                hrsg_assets[hrsg_name] = {
+                    "min_capacity_mt": float(min_cap) if min_cap is not None else 60.0,
+                    "max_capacity_mt": float(max_cap) if max_cap is not None else 136.0,
+                    "efficiency": float(efficiency) if efficiency is not None else 1.03,
+                    "steam_type": steam_type if steam_type else "SHP",
+                    "linked_gt": linked_gt or hrsg_name.replace("HRSG", "GT"),
+                }
         
-        if not rows:
+        if not hrsg_assets:
             print("  [HRSG] No HRSG assets found in DB, using defaults")
             return HRSG_ASSETS
         
-        # Build HRSG_ASSETS from DB
-        hrsg_assets = {}
-        for row in rows:
-            hrsg_name = row[0]  # e.g., "HRSG1"
-            linked_gt_name = row[6]  # e.g., "NMD-Power Plant-1"
-            
-            # Determine linked GT pattern (GT1, GT2, GT3)
-            linked_gt = None
-            if linked_gt_name:
-                if "Plant-1" in linked_gt_name:
-                    linked_gt = "GT1"
-                elif "Plant-2" in linked_gt_name:
-                    linked_gt = "GT2"
-                elif "Plant-3" in linked_gt_name:
-                    linked_gt = "GT3"
-            
-            hrsg_assets[hrsg_name] = {
-                "min_capacity_mt": float(row[1]) if row[1] else 60.0,
-                "max_capacity_mt": float(row[2]) if row[2] else 136.0,
-                "efficiency": float(row[3]) if row[3] else 1.03,
-                "steam_type": row[4] if row[4] else "SHP",
-                "linked_gt": linked_gt or hrsg_name.replace("HRSG", "GT"),
-            }
-        
         HRSG_ASSETS = hrsg_assets
+        _HRSG_LOADED = True
         print(f"  [HRSG] Loaded {len(hrsg_assets)} HRSG assets from DB")
         return HRSG_ASSETS
         
@@ -602,10 +840,22 @@ def load_hrsg_assets_from_db():
         return HRSG_ASSETS
 
 
+def invalidate_hrsg_assets():
+    """
+    Drop the loaded HRSG configuration so the next get_hrsg_assets() call
+    re-reads SteamGenerationAssets (call after editing HRSG assets).
+    """
+    global _HRSG_LOADED
+    with _hrsg_load_lock:
+        _HRSG_LOADED = False
+
+
 def get_hrsg_assets():
-    """Get HRSG assets, loading from DB if not already loaded."""
-    if HRSG_ASSETS == HRSG_ASSETS_DEFAULT:
-        load_hrsg_assets_from_db()
+    """Get HRSG assets, loading from DB if not already loaded (thread-safe)."""
+    if not _HRSG_LOADED:
+        with _hrsg_load_lock:
+            if not _HRSG_LOADED:
+                load_hrsg_assets_from_db()
     return HRSG_ASSETS
 
 # ============================================================
@@ -621,7 +871,11 @@ def get_hrsg_assets():
 # ============================================================
 # GET STG REQUIREMENTS FROM POWER DISPATCH
 # ============================================================
-def get_stg_requirements_from_dispatch(power_dispatch: list) -> dict:
+# STG identification in dispatch asset names
+_STG_RE = re.compile(r"STG|STEAM TURBINE", re.IGNORECASE)
+
+
+def get_stg_requirements_from_dispatch(power_dispatch: list, dispatch_index: dict = None) -> dict:
     """
     Get STG power and SHP steam requirements from power dispatch results.
     
@@ -634,22 +888,30 @@ def get_stg_requirements_from_dispatch(power_dispatch: list) -> dict:
     
     Args:
         power_dispatch: List of dispatch results from power_service
+        dispatch_index: Optional index_dispatch() result to reuse
         
     Returns:
         dict with STG requirements
     """
+    # Find STG in dispatch and get pre-calculated values
+    if dispatch_index is not None:
+        return _stg_requirements(dispatch_index.get("STG"))
+    for asset in power_dispatch:
+        if _STG_RE.search(asset.get("AssetName", "")):
+            return _stg_requirements(asset)
+    return _stg_requirements(None)
+
+
+def _stg_requirements(stg_asset) -> dict:
+    """Build the STG requirements dict from the STG dispatch row (or None)."""
     stg_gross_mwh = 0.0
     stg_shp_required = 0.0
     stg_power_required = 0.0
     
-    # Find STG in dispatch and get pre-calculated values
-    for asset in power_dispatch:
-        asset_name = asset.get("AssetName", "").upper()
-        if "STG" in asset_name or "STEAM TURBINE" in asset_name:
-            stg_gross_mwh = asset.get("GrossMWh", 0)
-            stg_shp_required = asset.get("STG_SHP_Required_MT") or 0.0
-            stg_power_required = asset.get("STG_Power_Required_MWh") or 0.0
-            break
+    if stg_asset is not None:
+        stg_gross_mwh = stg_asset.get("GrossMWh", 0)
+        stg_shp_required = stg_asset.get("STG_SHP_Required_MT") or 0.0
+        stg_power_required = stg_asset.get("STG_Power_Required_MWh") or 0.0
     
     stg_gross_kwh = stg_gross_mwh * 1000  # Convert MWh to KWh
     
@@ -667,6 +929,10 @@ def get_stg_requirements_from_dispatch(power_dispatch: list) -> dict:
 # ============================================================
 # CALCULATE FREE STEAM FROM GT DISPATCH
 # ============================================================
+# GT identification in dispatch asset names
+_GT_RE = re.compile(r"GT[123]|PLANT [123]", re.IGNORECASE)
+
+
 def calculate_free_steam_from_dispatch(power_dispatch: list) -> dict:
     """
     Calculate free steam generated by each GT based on dispatch results.
@@ -694,7 +960,7 @@ def calculate_free_steam_from_dispatch(power_dispatch: list) -> dict:
         free_steam_factor = asset.get("FreeSteam")  # FreeSteamFactor from HeatRateLookup
         
         # Only GTs generate free steam (not STG)
-        is_gt = any(gt in asset_name.upper() for gt in ["GT1", "GT2", "GT3", "PLANT 1", "PLANT 2", "PLANT 3"])
+        is_gt = _GT_RE.search(asset_name) is not None
         
         if is_gt and gross_mwh > 0 and free_steam_factor is not None:
             # Verify load calculation: LoadMW = GrossMWh / Hours
@@ -729,72 +995,92 @@ def calculate_free_steam_from_dispatch(power_dispatch: list) -> dict:
     }
 
 
+# ============================================================
+# INDEX POWER DISPATCH BY ASSET TAG
+# ============================================================
+# GT tag in dispatch asset names: GT1 / Plant-1 / Plant 1 -> "GT1"
+_GT_TAG_RE = re.compile(r"GT(\d)|PLANT[ -](\d)", re.IGNORECASE)
+
+
+def index_dispatch(power_dispatch: list) -> dict:
+    """
+    Index dispatch rows by asset tag ("STG", "GT1", "GT2", ...).
+    
+    The first row matching a tag wins, as in the linear searches this
+    replaces. Build it once and pass it to the dispatch readers that
+    accept dispatch_index.
+    
+    Args:
+        power_dispatch: List of dispatch results from power_service
+        
+    Returns:
+        dict mapping asset tag to its dispatch row
+    """
+    index = {}
+    for asset in power_dispatch:
+        asset_name = asset.get("AssetName", "")
+        if "STG" not in index and _STG_RE.search(asset_name):
+            index["STG"] = asset
+        for gt_num, plant_num in _GT_TAG_RE.findall(asset_name):
+            index.setdefault("GT" + (gt_num or plant_num), asset)
+    return index
+
+
 # ============================================================
 # GET HRSG AVAILABILITY FROM POWER DISPATCH
 # ============================================================
-def get_hrsg_availability_from_dispatch(power_dispatch: list) -> dict:
+def get_hrsg_availability_from_dispatch(power_dispatch: list, dispatch_index: dict = None) -> dict:
     """
     Determine HRSG availability based on GT dispatch results.
     
     Args:
         power_dispatch: List of dispatch results from power_service
+        dispatch_index: Optional index_dispatch() result to reuse
         
     Returns:
         dict with HRSG availability and operational hours
     """
     hrsg_availability = {}
     hrsg_assets = get_hrsg_assets()  # Load from DB
+    if dispatch_index is None:
+        dispatch_index = index_dispatch(power_dispatch)
     
     for hrsg_name, hrsg_config in hrsg_assets.items():
         linked_gt = hrsg_config["linked_gt"]
         
-        # Find the linked GT in dispatch results
-        gt_dispatch = None
-        for asset in power_dispatch:
-            asset_name = asset.get("AssetName", "").upper()
-            # Match GT1, GT2, GT3 or Power Plant-1, Plant-2, Plant-3
-            # linked_gt is "GT1", "GT2", "GT3" - extract the number
-            gt_num = linked_gt[-1]  # "1", "2", "3"
-            if (linked_gt in asset_name or 
-                f"PLANT-{gt_num}" in asset_name or 
-                f"PLANT {gt_num}" in asset_name):
-                gt_dispatch = asset
-                break
+        # Find the linked GT in dispatch results (GT1 / Plant-1 / Plant 1)
+        gt_dispatch = dispatch_index.get(linked_gt)
         
-        if gt_dispatch and gt_dispatch.get("GrossMWh", 0) > 0:
+        gross_mwh = (gt_dispatch.get("GrossMWh", 0) or 0) if gt_dispatch else 0
+        if gross_mwh > 0:
             # GT is running, HRSG is available
-            gross_mwh = gt_dispatch.get("GrossMWh", 0)
+            is_available = True
+            operational_hours = gt_dispatch.get("Hours", 0)
+            gt_load_mw = gt_dispatch.get("LoadMW", 0)
             free_steam_factor = gt_dispatch.get("FreeSteam")
             
             # Calculate free steam for this HRSG
             free_steam_mt = 0.0
             if free_steam_factor is not None:
-                free_steam_mt = free_steam_factor * gross_mwh
-            
-            hrsg_availability[hrsg_name] = {
-                "is_available": True,
-                "operational_hours": gt_dispatch.get("Hours", 0),
-                "gt_load_mw": gt_dispatch.get("LoadMW", 0),
-                "gt_gross_mwh": gross_mwh,
-                "free_steam_factor": free_steam_factor,
-                "free_steam_mt": round(free_steam_mt, 2),
-                "min_capacity_mt": hrsg_config["min_capacity_mt"],
-                "max_capacity_mt": hrsg_config["max_capacity_mt"],
-                "efficiency": hrsg_config["efficiency"],
-            }
+                free_steam_mt = round(free_steam_factor * gross_mwh, 2)
         else:
             # GT not running, HRSG unavailable
-            hrsg_availability[hrsg_name] = {
-                "is_available": False,
-                "operational_hours": 0,
-                "gt_load_mw": 0,
-                "gt_gross_mwh": 0,
-                "free_steam_factor": None,
-                "free_steam_mt": 0.0,
-                "min_capacity_mt": hrsg_config["min_capacity_mt"],
-                "max_capacity_mt": hrsg_config["max_capacity_mt"],
-                "efficiency": hrsg_config["efficiency"],
-            }
+            is_available = False
+            operational_hours = gt_load_mw = gross_mwh = 0
+            free_steam_factor = None
+            free_steam_mt = 0.0
+        
+        hrsg_availability[hrsg_name] = {
+            "is_available": is_available,
+            "operational_hours": operational_hours,
+            "gt_load_mw": gt_load_mw,
+            "gt_gross_mwh": gross_mwh,
+            "free_steam_factor": free_steam_factor,
+            "free_steam_mt": free_steam_mt,
+            "min_capacity_mt": hrsg_config["min_capacity_mt"],
+            "max_capacity_mt": hrsg_config["max_capacity_mt"],
+            "efficiency": hrsg_config["efficiency"],
+        }
     
     return hrsg_availability
 
@@ -802,6 +1088,16 @@ def get_hrsg_availability_from_dispatch(power_dispatch: list) -> dict:
 # ============================================================
 # CALCULATE SHP GENERATION CAPACITY FROM HRSG
 # ============================================================
+def _hrsg_supp_firing_mt(capacity_per_hr: float, hours: float, efficiency: float) -> float:
+    """
+    Monthly supplementary firing (MT) of one HRSG = Hours × Capacity × Efficiency.
+    
+    Shared by calculate_shp_generation_capacity() and
+    calculate_hrsg_min_load_and_excess_steam() so both report the same MIN figure.
+    """
+    return capacity_per_hr * (hours * efficiency)
+
+
 def calculate_shp_generation_capacity(hrsg_availability: dict) -> dict:
     """
     Calculate total SHP generation capacity from available HRSGs.
@@ -829,6 +1125,7 @@ def calculate_shp_generation_capacity(hrsg_availability: dict) -> dict:
     
     Args:
         hrsg_availability: dict from get_hrsg_availability_from_dispatch
+                           (free_steam_mt is already rounded to 2 dp there)
         
     Returns:
         dict with SHP generation capacity details
@@ -855,8 +1152,8 @@ def calculate_shp_generation_capacity(hrsg_availability: dict) -> dict:
             efficiency = hrsg_data["efficiency"]  # 103%
             
             # Monthly supplementary capacity = Hours × Capacity × Efficiency
-            supp_min_month = min_capacity_per_hr * hours * efficiency
-            supp_max_month = max_capacity_per_hr * hours * efficiency
+            supp_min_month = _hrsg_supp_firing_mt(min_capacity_per_hr, hours, efficiency)
+            supp_max_month = _hrsg_supp_firing_mt(max_capacity_per_hr, hours, efficiency)
             
             total_supplementary_min += supp_min_month
             total_supplementary_max += supp_max_month
@@ -869,7 +1166,7 @@ def calculate_shp_generation_capacity(hrsg_availability: dict) -> dict:
                 "gt_load_mw": hrsg_data["gt_load_mw"],
                 "gt_gross_mwh": hrsg_data.get("gt_gross_mwh", 0),
                 "free_steam_factor": hrsg_data.get("free_steam_factor"),
-                "free_steam_mt": round(free_steam_mt, 2),
+                "free_steam_mt": free_steam_mt,  # already rounded upstream
                 "min_capacity_per_hr": min_capacity_per_hr,
                 "max_capacity_per_hr": max_capacity_per_hr,
                 "efficiency": efficiency,
@@ -915,7 +1212,8 @@ def calculate_shp_generation_capacity(hrsg_availability: dict) -> dict:
 # ============================================================
 def check_shp_balance(
     shp_demand: float,
-    shp_generation_capacity: dict
+    shp_generation_capacity: dict,
+    precision: int = 2
 ) -> dict:
     """
     Check if SHP generation capacity can meet demand.
@@ -928,6 +1226,8 @@ def check_shp_balance(
     Args:
         shp_demand: Total SHP demand (MT)
         shp_generation_capacity: dict from calculate_shp_generation_capacity
+        precision: Decimal places for the reported figures; None keeps raw
+                   floats (for optimizer / scenario loops)
         
     Returns:
         dict with balance check results
@@ -935,8 +1235,8 @@ def check_shp_balance(
     max_capacity = shp_generation_capacity["total_max_shp_capacity"]
     min_capacity = shp_generation_capacity["total_min_shp_capacity"]
     
-    surplus = max_capacity - shp_demand
-    deficit = shp_demand - max_capacity if shp_demand > max_capacity else 0
+    surplus = max(0.0, max_capacity - shp_demand)
+    deficit = max(0.0, shp_demand - max_capacity)
     
     # Check if demand can be met
     can_meet_demand = shp_demand <= max_capacity
@@ -947,16 +1247,23 @@ def check_shp_balance(
     # Utilization percentage
     utilization = (shp_demand / max_capacity * 100) if max_capacity > 0 else 0
     
+    if precision is not None:
+        shp_demand = round(shp_demand, precision)
+        max_capacity = round(max_capacity, precision)
+        min_capacity = round(min_capacity, precision)
+        surplus = round(surplus, precision)
+        deficit = round(deficit, precision)
+        utilization = round(utilization, precision)
+    
     return {
-        "shp_demand": round(shp_demand, 2),
-        "shp_max_capacity": round(max_capacity, 2),
-        "shp_min_capacity": round(min_capacity, 2),
-        "surplus": round(surplus, 2) if surplus > 0 else 0,
-        "deficit": round(deficit, 2),
+        "shp_demand": shp_demand,
+        "shp_max_capacity": max_capacity,
+        "shp_min_capacity": min_capacity,
+        "surplus": surplus,
+        "deficit": deficit,
         "can_meet_demand": can_meet_demand,
-        "utilization_percent": round(utilization, 2),
+        "utilization_percent": utilization,
         "above_minimum": above_minimum,
-        "utilization_percent": round((shp_demand / max_capacity) * 100, 2) if max_capacity > 0 else 0,
     }
 
 
@@ -994,9 +1301,12 @@ def calculate_complete_steam_balance(
     # Step 1: Get STG requirements from power dispatch (calculated in power_service.py)
     stg_requirements = None
     stg_shp_power = 0.0
+    dispatch_index = None
     
     if power_dispatch:
-        stg_requirements = get_stg_requirements_from_dispatch(power_dispatch)
+        # One index serves both the STG and HRSG readers below
+        dispatch_index = index_dispatch(power_dispatch)
+        stg_requirements = get_stg_requirements_from_dispatch(power_dispatch, dispatch_index)
         stg_shp_power = stg_requirements["shp_steam_required_mt"]
     
     # Step 2: Calculate steam balance (demand side) - includes STG SHP requirement
@@ -1015,7 +1325,7 @@ def calculate_complete_steam_balance(
     
     # Step 3: Get HRSG availability from power dispatch
     if power_dispatch:
-        hrsg_availability = get_hrsg_availability_from_dispatch(power_dispatch)
+        hrsg_availability = get_hrsg_availability_from_dispatch(power_dispatch, dispatch_index)
     else:
         # Default: assume all HRSGs available with 720 hours
         hrsg_assets = get_hrsg_assets()  # Load from DB
@@ -1053,7 +1363,19 @@ def calculate_complete_steam_balance(
 # ============================================================
 # TEST WITH EXAMPLE VALUES
 # ============================================================
-if __name__ == "__main__":
+def _demo():
+    """Print a worked steam balance for a mock dispatch (run this module directly)."""
+    # Collect the report and write it in one go; flush even if a section fails
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            _demo_report()
+    finally:
+        sys.stdout.write(buf.getvalue())
+
+
+def _demo_report():
+    """Body of _demo(); prints every section to stdout."""
     # Example values based on your plant constraints
     # GT Max Capacity: 22 MW, so max generation = 22 MW × 720 hrs = 15,840 MWh
     # 
@@ -1295,9 +1617,6 @@ if __name__ == "__main__":
     print("SHP SUPPLY vs DEMAND CHECK")
     print("="*70)
     print(f"  SHP Demand:                     {shp_check['shp_demand']:>12.2f} MT SHP")
-    print(f"  Free Steam Available:           {shp_check['free_steam_available']:>12.2f} MT SHP")
-    print(f"  Free Steam Sufficient:          {'✅ YES' if shp_check['free_steam_sufficient'] else '❌ NO'}")
-    print(f"  Supplementary Firing Needed:    {shp_check['supplementary_firing_needed']:>12.2f} MT SHP")
     print(f"  ─────────────────────────────────────────────")
     print(f"  SHP Max Capacity:               {shp_check['shp_max_capacity']:>12.2f} MT SHP")
     print(f"  SHP Min Capacity:               {shp_check['shp_min_capacity']:>12.2f} MT SHP")
@@ -1315,7 +1634,9 @@ if __name__ == "__main__":
 # ============================================================
 def calculate_hrsg_min_load_and_excess_steam(
     power_dispatch: list,
-    shp_demand: float
+    shp_demand: float,
+    dispatch_index: dict = None,
+    verbose: bool = True
 ) -> dict:
     """
     Calculate HRSG production at MIN load and determine excess steam.
@@ -1331,12 +1652,17 @@ def calculate_hrsg_min_load_and_excess_steam(
     Args:
         power_dispatch: List of dispatch results from power_service
         shp_demand: Total SHP demand (MT) including STG requirements
+        dispatch_index: Optional index_dispatch() result to reuse
+        verbose: Print the MIN load table (skipped entirely when False)
         
     Returns:
         dict with HRSG MIN load production, excess steam, and power conversion
     """
     # Get HRSG availability from power dispatch
-    hrsg_availability = get_hrsg_availability_from_dispatch(power_dispatch)
+    if dispatch_index is None:
+        dispatch_index = index_dispatch(power_dispatch)
+    hrsg_availability = get_hrsg_availability_from_dispatch(power_dispatch, dispatch_index)
+    hrsg_assets = get_hrsg_assets()
     
     # Calculate MIN load production for each available HRSG
     hrsg_min_load_details = []
@@ -1355,7 +1681,7 @@ def calculate_hrsg_min_load_and_excess_steam(
             total_free_steam += free_steam_mt
             
             # MIN supplementary firing = Hours × Min_Capacity × Efficiency
-            min_supp_firing = min_capacity_per_hr * hours * efficiency
+            min_supp_firing = _hrsg_supp_firing_mt(min_capacity_per_hr, hours, efficiency)
             total_min_supp_firing += min_supp_firing
             
             # Total MIN production = Only Supplementary Firing (Free Steam is display only)
@@ -1364,17 +1690,9 @@ def calculate_hrsg_min_load_and_excess_steam(
             total_min_shp_production += min_production
             
             # Get linked GT info for priority
-            hrsg_assets = get_hrsg_assets()
             linked_gt = hrsg_assets[hrsg_name]["linked_gt"]
-            gt_num = linked_gt[-1]  # "1", "2", "3"
-            gt_priority = None
-            for asset in power_dispatch:
-                asset_name = asset.get("AssetName", "").upper()
-                if (linked_gt in asset_name or 
-                    f"PLANT-{gt_num}" in asset_name or 
-                    f"PLANT {gt_num}" in asset_name):
-                    gt_priority = asset.get("Priority")
-                    break
+            gt_dispatch = dispatch_index.get(linked_gt)
+            gt_priority = gt_dispatch.get("Priority") if gt_dispatch else None
             
             hrsg_min_load_details.append({
                 "name": hrsg_name,
@@ -1389,7 +1707,6 @@ def calculate_hrsg_min_load_and_excess_steam(
                 "min_production_mt": round(min_production, 2),
             })
         else:
-            hrsg_assets = get_hrsg_assets()
             hrsg_min_load_details.append({
                 "name": hrsg_name,
                 "linked_gt": hrsg_assets[hrsg_name]["linked_gt"],
@@ -1409,41 +1726,44 @@ def calculate_hrsg_min_load_and_excess_steam(
     # Convert excess steam to power (3.56 MT = 1 MWh)
     excess_power_mwh = excess_steam_mt / STEAM_TO_POWER_MT_PER_MWH if excess_steam_mt > 0 else 0.0
     
-    # Log the results
-    print("\n" + "="*90)
-    print("HRSG MIN LOAD CALCULATION (NEW DISPATCH LOGIC)")
-    print("="*90)
-    print(f"{'HRSG':<10} {'Linked GT':<12} {'Priority':<10} {'Available':<12} {'Hours':<8} {'Free Steam':<12} {'Min Supp':<12} {'Total MIN':<12}")
-    print("-"*90)
-    
-    for h in hrsg_min_load_details:
-        avail_str = "YES" if h["is_available"] else "NO"
-        # Handle None and NaN for priority
-        pri_val = h.get("priority")
-        pri_str = str(int(pri_val)) if pri_val is not None and not (isinstance(pri_val, float) and pri_val != pri_val) else "-"
-        print(f"{h['name']:<10} {h['linked_gt']:<12} {pri_str:<10} {avail_str:<12} {h['hours']:<8.0f} {h['free_steam_mt']:>10.2f}   {h['min_supp_firing_mt']:>10.2f}   {h['min_production_mt']:>10.2f}")
-    
-    print("-"*90)
-    print(f"{'TOTAL':<10} {'':<12} {'':<10} {'':<12} {'':<8} {total_free_steam:>10.2f}   {total_min_supp_firing:>10.2f}   {total_min_shp_production:>10.2f}")
-    
-    print(f"\n  SHP Demand:                     {shp_demand:>12.2f} MT")
-    print(f"  Total MIN SHP Production:       {total_min_shp_production:>12.2f} MT")
-    print(f"  ─────────────────────────────────────────────")
-    
-    if excess_steam_mt > 0:
-        print(f"  ⚡ EXCESS STEAM:                {excess_steam_mt:>12.2f} MT")
-        print(f"  ⚡ EXCESS POWER (@ 3.56 MT/MWh): {excess_power_mwh:>12.2f} MWh")
-        print(f"  ─────────────────────────────────────────────")
-        print(f"  NOTE: Excess steam can be absorbed by increasing STG generation")
-        print(f"        or reducing GT dispatch to maintain power balance")
-    else:
-        shortfall = shp_demand - total_min_shp_production
-        print(f"  Status: MIN load meets demand (no excess)")
-        if shortfall > 0:
-            print(f"  Additional SHP needed:          {shortfall:>12.2f} MT")
-            print(f"  (Will be met by increasing HRSG above MIN load)")
-    
-    print("="*90 + "\n")
+    if verbose:
+        # Log the results as one buffered write
+        buf = io.StringIO()
+        buf.write("\n" + "="*90 + "\n")
+        buf.write("HRSG MIN LOAD CALCULATION (NEW DISPATCH LOGIC)\n")
+        buf.write("="*90 + "\n")
+        buf.write(f"{'HRSG':<10} {'Linked GT':<12} {'Priority':<10} {'Available':<12} {'Hours':<8} {'Free Steam':<12} {'Min Supp':<12} {'Total MIN':<12}\n")
+        buf.write("-"*90 + "\n")
+        
+        for h in hrsg_min_load_details:
+            avail_str = "YES" if h["is_available"] else "NO"
+            # Handle None and NaN for priority
+            pri_val = h.get("priority")
+            pri_str = "-" if pri_val is None or (isinstance(pri_val, float) and math.isnan(pri_val)) else str(int(pri_val))
+            buf.write(f"{h['name']:<10} {h['linked_gt']:<12} {pri_str:<10} {avail_str:<12} {h['hours']:<8.0f} {h['free_steam_mt']:>10.2f}   {h['min_supp_firing_mt']:>10.2f}   {h['min_production_mt']:>10.2f}\n")
+        
+        buf.write("-"*90 + "\n")
+        buf.write(f"{'TOTAL':<10} {'':<12} {'':<10} {'':<12} {'':<8} {total_free_steam:>10.2f}   {total_min_supp_firing:>10.2f}   {total_min_shp_production:>10.2f}\n")
+        
+        buf.write(f"\n  SHP Demand:                     {shp_demand:>12.2f} MT\n")
+        buf.write(f"  Total MIN SHP Production:       {total_min_shp_production:>12.2f} MT\n")
+        buf.write(f"  ─────────────────────────────────────────────\n")
+        
+        if excess_steam_mt > 0:
+            buf.write(f"  ⚡ EXCESS STEAM:                {excess_steam_mt:>12.2f} MT\n")
+            buf.write(f"  ⚡ EXCESS POWER (@ 3.56 MT/MWh): {excess_power_mwh:>12.2f} MWh\n")
+            buf.write(f"  ─────────────────────────────────────────────\n")
+            buf.write(f"  NOTE: Excess steam can be absorbed by increasing STG generation\n")
+            buf.write(f"        or reducing GT dispatch to maintain power balance\n")
+        else:
+            shortfall = shp_demand - total_min_shp_production
+            buf.write(f"  Status: MIN load meets demand (no excess)\n")
+            if shortfall > 0:
+                buf.write(f"  Additional SHP needed:          {shortfall:>12.2f} MT\n")
+                buf.write(f"  (Will be met by increasing HRSG above MIN load)\n")
+        
+        buf.write("="*90 + "\n\n")
+        sys.stdout.write(buf.getvalue())
     
     return {
         "hrsg_details": hrsg_min_load_details,
@@ -1463,7 +1783,9 @@ def calculate_hrsg_min_load_and_excess_steam(
 def dispatch_hrsg_load(
     power_dispatch: list,
     shp_demand: float,
-    shp_capacity: dict
+    shp_capacity: dict,
+    dispatch_index: dict = None,
+    verbose: bool = True
 ) -> dict:
     """
     Dispatch HRSG supplementary firing load based on SHP demand with priority.
@@ -1493,6 +1815,8 @@ def dispatch_hrsg_load(
         power_dispatch: List of dispatch results from power_service
         shp_demand: Total SHP demand (MT)
         shp_capacity: SHP capacity dict from calculate_shp_generation_capacity
+        dispatch_index: Optional index_dispatch() result to reuse
+        verbose: Print the dispatch table (skipped entirely when False)
         
     Returns:
         dict with dispatched HRSG load per unit
@@ -1504,30 +1828,29 @@ def dispatch_hrsg_load(
     # Build list of available HRSGs with priority
     available_hrsgs = []
     hrsg_assets = get_hrsg_assets()
+    if dispatch_index is None:
+        dispatch_index = index_dispatch(power_dispatch)
     
     for hrsg_data in hrsg_details:
         if hrsg_data.get("is_available"):
             hrsg_name = hrsg_data.get("name", "")
             linked_gt = hrsg_assets.get(hrsg_name, {}).get("linked_gt", "")
             
-            # Get priority from power dispatch
-            gt_priority = None
-            gt_num = linked_gt[-1] if linked_gt else ""
-            for asset in power_dispatch:
-                asset_name = asset.get("AssetName", "").upper()
-                if (linked_gt in asset_name or 
-                    f"PLANT-{gt_num}" in asset_name or 
-                    f"PLANT {gt_num}" in asset_name):
-                    gt_priority = asset.get("Priority")
-                    break
+            # Get priority from power dispatch (GT1 / Plant-1 / Plant 1)
+            gt_dispatch = dispatch_index.get(linked_gt)
+            gt_priority = gt_dispatch.get("Priority") if gt_dispatch else None
+            
+            min_supp_mt = hrsg_data.get("supp_min_mt_month", 0)
+            max_supp_mt = hrsg_data.get("supp_max_mt_month", 0)
             
             available_hrsgs.append({
                 "name": hrsg_name,
                 "linked_gt": linked_gt,
                 "priority": gt_priority if gt_priority is not None else 999,
                 "hours": hrsg_data.get("hours", 0),
-                "min_supp_mt": hrsg_data.get("supp_min_mt_month", 0),
-                "max_supp_mt": hrsg_data.get("supp_max_mt_month", 0),
+                "min_supp_mt": min_supp_mt,
+                "max_supp_mt": max_supp_mt,
+                "headroom_mt": max_supp_mt - min_supp_mt,  # Capacity above MIN
                 "free_steam_mt": hrsg_data.get("free_steam_mt", 0),
             })
     
@@ -1567,7 +1890,7 @@ def dispatch_hrsg_load(
     # =========================================================
     if shp_demand > min_supply:
         # Group HRSGs by priority for equal distribution within same priority
-        sorted_hrsgs = sorted(available_hrsgs, key=lambda x: x["priority"])
+        sorted_hrsgs = sorted(available_hrsgs, key=itemgetter("priority"))
         
         # Initialize all HRSGs to MIN
         for hrsg in sorted_hrsgs:
@@ -1577,19 +1900,16 @@ def dispatch_hrsg_load(
         additional_needed = required_supp_firing - total_min_supp
         
         if additional_needed > 0:
-            # Process priority groups in order (lower priority number first)
-            priority_groups = []
-            for priority, group in groupby(sorted_hrsgs, key=lambda x: x["priority"]):
-                priority_groups.append(list(group))
-            
             remaining_additional = additional_needed
             
-            for group in priority_groups:
+            # Process priority groups in order (lower priority number first)
+            for _priority, group_iter in groupby(sorted_hrsgs, key=itemgetter("priority")):
                 if remaining_additional <= 0:
                     break
+                group = list(group_iter)
                 
                 # Calculate total available capacity above MIN for this group
-                group_available = sum(h["max_supp_mt"] - h["min_supp_mt"] for h in group)
+                group_available = sum(h["headroom_mt"] for h in group)
                 
                 if group_available <= 0:
                     continue
@@ -1600,7 +1920,7 @@ def dispatch_hrsg_load(
                 # Distribute equally among HRSGs in this group
                 # Each HRSG gets proportional share based on its available capacity
                 for hrsg in group:
-                    hrsg_available = hrsg["max_supp_mt"] - hrsg["min_supp_mt"]
+                    hrsg_available = hrsg["headroom_mt"]
                     if hrsg_available > 0 and group_available > 0:
                         # Equal distribution: each HRSG gets same share
                         hrsg_share = group_allocation / len(group)
@@ -1620,7 +1940,7 @@ def dispatch_hrsg_load(
     # =========================================================
     else:
         # Sort by priority DESCENDING (higher number = lower priority = decrease first)
-        sorted_hrsgs = sorted(available_hrsgs, key=lambda x: x["priority"], reverse=True)
+        sorted_hrsgs = sorted(available_hrsgs, key=itemgetter("priority"), reverse=True)
         
         # Calculate excess at MIN load
         excess_at_min = min_supply - shp_demand
@@ -1659,46 +1979,54 @@ def dispatch_hrsg_load(
     # Total SHP supply = Only Dispatched Supp Firing (Free Steam is display only)
     dispatch_result["total_shp_supply_mt"] = round(total_dispatched_supp, 2)  # Exclude free steam
     
-    # Print dispatch summary
-    print("\n" + "="*100)
-    print("HRSG LOAD DISPATCH (Priority-Based)")
-    print("="*100)
-    print(f"  {'HRSG':<10} {'Linked GT':<12} {'Priority':<10} {'Hours':<8} {'MIN Supp':<12} {'MAX Supp':<12} {'Dispatched':<12} {'Status':<15}")
-    print("  " + "-"*95)
-    
-    for h in dispatch_result["hrsg_dispatch"]:
-        pri_str = str(int(h["priority"])) if h["priority"] != 999 else "-"
-        dispatched = h["dispatched_supp_mt"]
-        min_supp = h["min_supp_mt"]
-        max_supp = h["max_supp_mt"]
+    if verbose:
+        # Print dispatch summary as one buffered write
+        buf = io.StringIO()
+        buf.write("\n" + "="*100 + "\n")
+        buf.write("HRSG LOAD DISPATCH (Priority-Based)\n")
+        buf.write("="*100 + "\n")
+        buf.write(f"  {'HRSG':<10} {'Linked GT':<12} {'Priority':<10} {'Hours':<8} {'MIN Supp':<12} {'MAX Supp':<12} {'Dispatched':<12} {'Status':<15}\n")
+        buf.write("  " + "-"*95 + "\n")
+        
+        for h in dispatch_result["hrsg_dispatch"]:
+            pri_val = h["priority"]
+            pri_str = "-" if pri_val == 999 or (isinstance(pri_val, float) and math.isnan(pri_val)) else str(int(pri_val))
+            dispatched = h["dispatched_supp_mt"]
+            min_supp = h["min_supp_mt"]
+            max_supp = h["max_supp_mt"]
+        
+            if dispatched <= min_supp:
+                status = "AT MIN"
+            elif dispatched >= max_supp:
+                status = "AT MAX"
+            else:
+                status = "PARTIAL"
+        
+            buf.write(f"  {h['name']:<10} {h['linked_gt']:<12} {pri_str:<10} {h['hours']:<8.0f} {min_supp:>10.2f}   {max_supp:>10.2f}   {dispatched:>10.2f}   {status:<15}\n")
+        
+        buf.write("  " + "-"*95 + "\n")
+        buf.write(f"  {'TOTAL':<10} {'':<12} {'':<10} {'':<8} {dispatch_result['total_min_supp_mt']:>10.2f}   {dispatch_result['total_max_supp_mt']:>10.2f}   {dispatch_result['total_dispatched_supp_mt']:>10.2f}\n")
+        buf.write("  " + "="*95 + "\n")
+        buf.write(f"\n  SHP BALANCE SUMMARY:\n")
+        buf.write(f"  ├─ Free Steam (display only):   {dispatch_result['total_free_steam_mt']:>12.2f} MT\n")
+        buf.write(f"  ├─ Dispatched Supp Firing:      {dispatch_result['total_dispatched_supp_mt']:>12.2f} MT\n")
+        buf.write(f"  ├─ Total SHP Supply (Supp):     {dispatch_result['total_shp_supply_mt']:>12.2f} MT\n")
+        buf.write(f"  ├─ SHP Demand:                  {dispatch_result['shp_demand_mt']:>12.2f} MT\n")
+        buf.write(f"  └─ Balance:                     {dispatch_result['total_shp_supply_mt'] - dispatch_result['shp_demand_mt']:>12.2f} MT\n")
         
-        if dispatched <= min_supp:
-            status = "AT MIN"
-        elif dispatched >= max_supp:
-            status = "AT MAX"
+        if not dispatch_result["can_meet_demand"]:
+            buf.write(f"\n  ⚠️  CANNOT MEET DEMAND - Shortfall: {dispatch_result.get('shortfall_mt', 0):.2f} MT\n")
+        elif dispatch_result["excess_steam_mt"] > 0:
+            buf.write(f"\n  ⚡ EXCESS STEAM at MIN load: {dispatch_result['excess_steam_mt']:.2f} MT\n")
+            buf.write(f"     → Needs STG/GT adjustment to balance\n")
         else:
-            status = "PARTIAL"
+            buf.write(f"\n  ✓ SHP BALANCED\n")
         
-        print(f"  {h['name']:<10} {h['linked_gt']:<12} {pri_str:<10} {h['hours']:<8.0f} {min_supp:>10.2f}   {max_supp:>10.2f}   {dispatched:>10.2f}   {status:<15}")
-    
-    print("  " + "-"*95)
-    print(f"  {'TOTAL':<10} {'':<12} {'':<10} {'':<8} {dispatch_result['total_min_supp_mt']:>10.2f}   {dispatch_result['total_max_supp_mt']:>10.2f}   {dispatch_result['total_dispatched_supp_mt']:>10.2f}")
-    print("  " + "="*95)
-    print(f"\n  SHP BALANCE SUMMARY:")
-    print(f"  ├─ Free Steam (display only):   {dispatch_result['total_free_steam_mt']:>12.2f} MT")
-    print(f"  ├─ Dispatched Supp Firing:      {dispatch_result['total_dispatched_supp_mt']:>12.2f} MT")
-    print(f"  ├─ Total SHP Supply (Supp):     {dispatch_result['total_shp_supply_mt']:>12.2f} MT")
-    print(f"  ├─ SHP Demand:                  {dispatch_result['shp_demand_mt']:>12.2f} MT")
-    print(f"  └─ Balance:                     {dispatch_result['total_shp_supply_mt'] - dispatch_result['shp_demand_mt']:>12.2f} MT")
-    
-    if not dispatch_result["can_meet_demand"]:
-        print(f"\n  ⚠️  CANNOT MEET DEMAND - Shortfall: {dispatch_result.get('shortfall_mt', 0):.2f} MT")
-    elif dispatch_result["excess_steam_mt"] > 0:
-        print(f"\n  ⚡ EXCESS STEAM at MIN load: {dispatch_result['excess_steam_mt']:.2f} MT")
-        print(f"     → Needs STG/GT adjustment to balance")
-    else:
-        print(f"\n  ✓ SHP BALANCED")
-    
-    print("="*100 + "\n")
+        buf.write("="*100 + "\n\n")
+        sys.stdout.write(buf.getvalue())
     
     return dispatch_result
+
+
+if __name__ == "__main__":
+    _demo()